@@ -1,15 +1,18 @@
 import logging
 import math
 from dataclasses import dataclass, field
+from typing import Optional
 
-import pygame as pg
+from pygame import Rect
 from pygame.math import Vector2
+from pygame.surface import Surface
 import pygame.transform
 
 from asteroids.display import Display
 from asteroids.layer import Layer
+from asteroids.physics import PhysicsWorld, get_world
 from asteroids.static_actor import StaticActor
-from asteroids.utils import load_image
+from asteroids.utils import load_image, load_scaled_image
 
 log = logging.getLogger(__name__)
 
@@ -23,6 +26,8 @@ class Actor(StaticActor):
     THRUST_MULT = .01
     HIT_DURATION = .1
     HIT_MARK_DURATION_MS = 100
+    HIT_MARK_COLOR = (255, 0, 0)
+    MAX_INTERPOLATION_TURN = 45
 
     health: int = 1
     angle: float = 0
@@ -30,23 +35,73 @@ class Actor(StaticActor):
     thrust: float = field(init=False, default=0)
     active: bool = True
     teleport: bool = True
+    # degrees per frame, only stepped by the physics world
+    angular_velocity: float = field(init=False, default=0)
 
     _delta: float = field(init=False, default=0)
     _hit_mark_cooldown: float = field(init=False, default=0)
+    _previous_angle: Optional[float] = field(init=False, default=None, repr=False)
+    _world: Optional[PhysicsWorld] = field(init=False, default=None, repr=False)
+    _body: Optional[int] = field(init=False, default=None, repr=False)
 
     def __post_init__(self, pos: Vector2):
         super().__post_init__(pos)
         self._update_physics()
+        self._attach_body()
+
+    def _reset(self, image_name: str, scale: float, pos: Vector2, velocity: Vector2, angle: float = 0,
+               spawned: bool = True, groups: dict[Layer, pygame.sprite.Group] = None):
+        """Re-initializes a pooled actor in place, the image is only looked up when the sprite changed"""
+        if image_name != self.image_name or scale != self.scale:
+            self.image_name = image_name
+            self.scale = scale
+            self._original_image = load_scaled_image(image_name, scale)
+            self.radius = self._original_image.get_width() / 2 * self.HITBOX_RADIUS_RATIO
+        self.groups = groups
+        self.spawned = spawned
+        self.health = 1
+        self.angle = angle
+        self.velocity = Vector2(velocity)
+        self.active = True
+        self.teleport = True
+        self.angular_velocity = 0
+        self._delta = 0
+        self._hit_mark_cooldown = 0
+        self._previous_angle = None
+        self._previous_position = None
+        self.position = pos
+        self._update_physics()
+        self._attach_body()
+
+    def _attach_body(self):
+        if (world := get_world()) is None:
+            return
+        self._world = world
+        self._body = world.add(self)
+
+    def _sync_body(self):
+        """Writes changed inputs (thrust, angle, velocity...) to the physics body, the world steps from those"""
+        if self._body is not None:
+            self._world.sync(self._body, self)
+
+    def kill(self):
+        super().kill()
+        if self._body is not None:
+            self._world.remove(self._body)
+            self._body = None
 
     def update(self, dt, keys) -> None:
         self._delta = dt
         self._hit_mark_cooldown -= dt
-        self._update_physics()
-        if self._hit_mark_cooldown > 0:
-            hit_mark_image = pg.Surface(self.image.get_size()).convert_alpha()
-            hit_mark_image.fill((255, 0, 0))
-            self.image.blit(hit_mark_image, (0, 0), special_flags=pg.BLEND_RGB_MULT)
-        if not self.inbounds() and self.spawned:
+        if self._body is not None:
+            self._read_body()
+        else:
+            self._update_physics()
+        if self._body is not None:
+            # the world already teleported out of bounds bodies
+            if self._world.expired[self._body]:
+                self.kill()
+        elif not self.inbounds() and self.spawned:
             if self.teleport:
                 self._teleport()
             else:
@@ -60,12 +115,40 @@ class Actor(StaticActor):
         self.rotate(self.angle)
         pos_delta = self.velocity * self._delta * self.VELOCITY_MULT
         self.position += pos_delta
-        log.debug(f'{self.angle=}, {self.velocity=}, {self.position=}, {pos_delta=}')
+        log.debug('angle=%f, velocity=%s, position=%s, pos_delta=%s', self.angle, self.velocity, self.position, pos_delta)
         log.debug('Position: (%f, %f)', *self.position)
         # rotated_image, rotated_rect = self._rotate(self.angle)
         # self.image = rotated_image
         # self.rect = rotated_rect
 
+    def _tint(self) -> Optional[tuple]:
+        if self._hit_mark_cooldown > 0:
+            return self.HIT_MARK_COLOR
+        return None
+
+    def snapshot(self):
+        super().snapshot()
+        self._previous_angle = self.angle
+
+    def interpolated(self, alpha: float) -> tuple[Surface, Rect]:
+        image, rect = super().interpolated(alpha)
+        if self._previous_angle is None or rect is self.rect:
+            return image, rect
+        turn = (self._previous_angle - self.angle + 180) % 360 - 180
+        if not turn or abs(turn) > self.MAX_INTERPOLATION_TURN:
+            return image, rect
+        image = self._rotated_image(self.angle + turn * (1 - alpha))
+        return image, image.get_rect(center=rect.center)
+
+    def _read_body(self):
+        x, y, vx, vy, angle = self._world.read(self._body)
+        self._position = Vector2(x, y)
+        self.velocity = Vector2(vx, vy)
+        self.angle = angle
+        self.thrust = 0
+        self.rotate(self.angle)
+        self._world.set_extent(self._body, self.rect.width // 2, self.rect.height // 2)
+
     def _update_velocity(self):
         dx = -math.sin(math.radians(self.angle)) * self.thrust
         dy = -math.cos(math.radians(self.angle)) * self.thrust
@@ -99,24 +182,29 @@ class Actor(StaticActor):
 
     def accelerate(self):
         self.thrust = self.THRUST_MULT
+        self._sync_body()
 
     def decelerate(self):
         self.thrust = -self.THRUST_MULT
+        self._sync_body()
 
     def rotate_ccw(self):
         self.angle += self.ANGULAR_SPEED
         log.debug("Rotated CCW to %f", self.angle)
         if self.angle >= 360:
             self.angle = 0
+        self._sync_body()
 
     def rotate_cw(self):
         self.angle -= self.ANGULAR_SPEED
         log.debug("Rotated CW to %f", self.angle)
         if self.angle <= 0:
             self.angle = 359
+        self._sync_body()
 
     def hit(self):
         self._hit_mark_cooldown = self.HIT_MARK_DURATION_MS
 
     def is_dead(self):
         return self.health <= 0
+
@@ -5,7 +5,8 @@ import pygame
 from asteroids.actor import Actor
 from asteroids.bullet import Bullet
 from asteroids.config import get_config
-from asteroids.events.game_events import GameEvents
+from asteroids.events.event_bus import get_event_bus
+from asteroids.events.game_events import EventId
 from asteroids.events.events_info import ShotBulletInfo
 from asteroids.layer import Layer
 from asteroids.player import Player
@@ -23,7 +24,9 @@ class Alien(Actor):
         self.health = 5
         self.teleport = False
         self.spawned = False
+        self.angular_velocity = -self.ANGULAR_SPEED
         self._dead = False
+        self._sync_body()
 
     def update(self, dt, keys) -> None:
         super().update(dt, keys)
@@ -32,7 +35,9 @@ class Alien(Actor):
             return
         if self.inbounds() and not self.spawned:
             self.spawned = True
-        self.rotate_cw()
+            self._sync_body()
+        if self._body is None:
+            self.rotate_cw()
         self._cooldown -= dt
         self._cooldown = max(self._cooldown, 0)
         try:
@@ -50,19 +55,19 @@ class Alien(Actor):
         # print(d, self.position.angle_to(d))
         # shot_direction = self.position.angle_to(d)
         if self._cooldown == 0 and self.spawned:
-            pygame.event.post(
-                GameEvents.shot_bullet(
-                    ShotBulletInfo(
-                        position=self.position,
-                        bullet_config=get_config().alien_bullet,
-                        angle=shot_direction,
-                        layer=Layer.ENEMY_BULLETS,
-                    ))
-            )
+            get_event_bus().post(
+                EventId.SHOT_BULLET,
+                ShotBulletInfo(
+                    position=self.position,
+                    bullet_config=get_config().alien_bullet,
+                    angle=shot_direction,
+                    layer=Layer.ENEMY_BULLETS,
+                ))
             self._cooldown = get_config().alien_bullet.cooldown
 
     def _die_slowly(self, dt):
         self.angle += 300 * dt / 1000
+        self._sync_body()
         self.alpha = self.alpha * .96
         if self.alpha < .2:
             self.kill()
@@ -72,6 +77,8 @@ class Alien(Actor):
         self.active = False
         self.velocity = pygame.Vector2(0, 0)
         self.thrust = 0
+        self.angular_velocity = 0
+        self._sync_body()
 
     def on_bullet_hit(self, bullet: Bullet):
         self.hit()
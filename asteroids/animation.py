@@ -1,38 +1,47 @@
-from typing import Sequence
+from functools import cache
+from typing import NamedTuple, Sequence
 
 import pygame.sprite
 from pygame.math import Vector2
 
-from asteroids.utils import load_image
+from asteroids.pool import Poolable
+from asteroids.utils import load_scaled_image
 
 
-class Animation(pygame.sprite.Sprite):
+class AnimationClip(NamedTuple):
+    frames: tuple[pygame.Surface, ...]
+
+    def __len__(self):
+        return len(self.frames)
+
+
+@cache
+def load_clip(images: tuple[str, ...], scale: float = 1.) -> AnimationClip:
+    return AnimationClip(tuple(load_scaled_image(image, scale) for image in images))
+
+
+class Animation(Poolable, pygame.sprite.Sprite):
     def __init__(self, images: Sequence[str], center: tuple, fps: float,
                  scale: float = 1.):
         super().__init__()
-        self._images = list(images)
-        self._scale = scale
+        self._clip = load_clip(tuple(images), scale)
         self._center = center
-        self._frame_delta = 0
+        self._elapsed = 0
+        self._frame = -1
         self._delta = 1 / fps * 1000
-        self._load_next_frame()
-        # self._delta = 1
+        self._show_frame(0)
 
-    def _load_next_frame(self):
-        if not self._images:
+    def _show_frame(self, frame: int):
+        if frame >= len(self._clip):
             self.kill()
             return
-        image = self._images.pop(0)
-        self.image = load_image(image)
-        self.image = pygame.transform.scale(
-            self.image,
-            (self._scale * self.image.get_width(),
-             self._scale * self.image.get_height()))
+        if frame == self._frame:
+            return
+        self._frame = frame
+        self.image = self._clip.frames[frame]
         self.rect = self.image.get_rect()
         self.rect.center = self._center
 
     def update(self, dt, keys):
-        self._frame_delta += dt
-        if self._frame_delta >= self._delta:
-            self._load_next_frame()
-            self._frame_delta = 0
+        self._elapsed += dt
+        self._show_frame(int(self._elapsed // self._delta))
@@ -1,20 +1,22 @@
 import logging
+import math
 import random
-import time
 
-import pygame
+from pygame.math import Vector2
 
 from asteroids.actor import Actor
 from asteroids.bullet import Bullet
 from asteroids.config import get_config
 from asteroids.events.events_info import SpawnAsteroidInfo
-from asteroids.events.game_events import GameEvents
+from asteroids.events.event_bus import get_event_bus
+from asteroids.events.game_events import EventId
+from asteroids.pool import Poolable
 from asteroids.sound import SoundManager
 
 log = logging.getLogger(__name__)
 
 
-class Asteroid(Actor):
+class Asteroid(Poolable, Actor):
     HEALTH_TABLE = {'big': 3, 'medium': 2, 'small': 1}
     KILL_TELEPORT_DELTA = .1
     EXPLODE_PARTS = {
@@ -27,20 +29,37 @@ class Asteroid(Actor):
 
     def __init__(self, angular_velocity, size, color, *args, **kwargs):
         super().__init__(*args, **kwargs, spawned=False)
-        self._last_teleport = 0
+        self._init_asteroid(angular_velocity, size, color)
+
+    def reset(self, angular_velocity, size, color, *, image_name: str, pos: Vector2, velocity: Vector2,
+              scale: float = 1, groups=None):
+        self._reset(image_name, scale, pos, velocity, spawned=False, groups=groups)
+        self._init_asteroid(angular_velocity, size, color)
+
+    def _init_asteroid(self, angular_velocity, size, color):
+        # game time, so replays kill the same asteroids
+        self._age_ms = 0
+        self._last_teleport = -math.inf
         self.ANGULAR_SPEED = angular_velocity
+        self.angular_velocity = -angular_velocity
         self.ttl_ms = 5000
         self.size = size
         self.health = self.HEALTH_TABLE[size]
         self.color = color
         self.score: int = self.SCORE[self.size]
+        self._sync_body()
 
     def update(self, dt, keys) -> None:
+        self._age_ms += dt
         super().update(dt, keys)
         # doesn't make sense...
         inbounds = self.inbounds()
         if inbounds and not self.spawned:
             self.spawned = True
+            self.ttl_ms = math.inf
+            self._sync_body()
+        if self._body is not None:
+            return
 
         if not self.spawned and not self.inbounds() and self.ttl_ms < 0:
             log.info("Asteroid time to live passed and not spawned")
@@ -51,9 +70,9 @@ class Asteroid(Actor):
     def _teleport(self):
         super()._teleport()
         # asteroid may be stuck in odd position keeping it teleported very fast
-        if time.time() - self._last_teleport < self.KILL_TELEPORT_DELTA:
+        if self._age_ms - self._last_teleport < self.KILL_TELEPORT_DELTA * 1000:
             self.kill()
-        self._last_teleport = time.time()
+        self._last_teleport = self._age_ms
 
     def explode(self):
         self.kill()
@@ -66,13 +85,12 @@ class Asteroid(Actor):
         log.info('Exploding %s asteroid to %s', self.size, parts)
         for size, amount in parts.items():
             for _ in range(amount):
-                pygame.event.post(
-                    GameEvents.spawn_asteroid(SpawnAsteroidInfo(
+                get_event_bus().post(
+                    EventId.SPAWN_ASTEROID, SpawnAsteroidInfo(
                         position=self.position,
                         size=size,
                         color=self.color
                     ))
-                )
 
     def on_bullet_hit(self, bullet: Bullet):
         self.hit()
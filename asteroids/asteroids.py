@@ -2,7 +2,7 @@ import logging
 import math
 import re
 from random import random, choice, randrange
-from typing import Sequence, Type
+from typing import Callable, Optional, Sequence, Type
 
 import pygame as pg
 import pygame.display
@@ -13,16 +13,27 @@ from asteroids.animation import Animation
 from asteroids.asteroid import Asteroid
 from asteroids.bullet import Bullet
 from asteroids.config import Config, get_config
-from asteroids.events.game_events import EventId, GameEvents
+from asteroids.events.event_bus import EventBus, set_event_bus
+from asteroids.events.game_events import EventId
+from asteroids.events.timer import EventTimer
 from asteroids.events.events_info import ShotBulletInfo, SpawnAsteroidInfo, SpawnAlienInfo, SpawnPowerUpInfo
 from asteroids.gui import GUI
 from asteroids.layer import Layer
+from asteroids.physics import PhysicsWorld, set_world
 from asteroids.player import Player
+from asteroids.population import PopulationGroup
 from asteroids.power_up import Health, PowerUp
+from asteroids.preloader import AssetPreloader, get_preloader, set_preloader
+from asteroids.profiler import FrameProfiler
+from asteroids.rotation_cache import RotationCache
 from asteroids.sound import SoundManager
+from asteroids.spatial_hash import BroadPhase, BruteForce, SpatialHash
 from asteroids.spawner import Spawner
+from asteroids.startup import get_startup_report
+from asteroids.static_actor import StaticActor
 from asteroids.text import Text
-from asteroids.utils import load_image, repeat_surface, get_sprites_path
+from asteroids.utils import (load_image, preload_assets, referenced_sounds, repeat_surface, get_sprite_names,
+                             get_sprites_path)
 
 log = logging.getLogger(__name__)
 
@@ -31,59 +42,133 @@ class Asteroids:
 
     def __init__(self):
         self.config: Config = get_config()
-        pg.display.set_caption(self.config.title)
-        log.debug('Setting screen to (%d,%d)', self.config.width, self.config.height)
-        if get_config().full_screen:
-            self.screen = pg.display.set_mode((0, 0), pygame.FULLSCREEN)
-        else:
-            self.screen = pg.display.set_mode((get_config().width,
-                                               get_config().height))
+        report = get_startup_report()
+        preloader = None
+        with report.phase('asset preloader'):
+            if get_config().preload_assets and get_preloader() is None:
+                preloader = preload_assets(get_config().preload_workers)
+                set_preloader(preloader)
+        with report.phase('display'):
+            pg.display.set_caption(self.config.title)
+            log.debug('Setting screen to (%d,%d)', self.config.width, self.config.height)
+            if get_config().full_screen:
+                self.screen = pg.display.set_mode((0, 0), pygame.FULLSCREEN)
+            else:
+                self.screen = pg.display.set_mode((get_config().width,
+                                                   get_config().height))
 
         self.is_running = True
+        self.profiler = FrameProfiler(enabled=get_config().profiler, window=get_config().profiler_window)
+        self.profiler.overlay = get_config().profiler_overlay
+        self._update_phases = {layer: f'update.{layer.name.lower()}' for layer in Layer}
+        self._draw_phases = {layer: f'draw.{layer.name.lower()}' for layer in Layer}
         self._clock = pygame.time.Clock()
+        # sees every polled event list before it is handled, used to record and replay input
+        self.event_hook: Optional[Callable[[list[pg.event.Event]], list[pg.event.Event]]] = None
         self._game_over: bool = False
-        log.debug("Setting background to '%s'", get_config().background_image)
-        self.background = repeat_surface(self.screen.get_size(),
-                                         load_image(get_config().background_image))
+        self.events = EventBus()
+        set_event_bus(self.events)
+        self.physics = PhysicsWorld() if get_config().vectorized_physics else None
+        set_world(self.physics)
         self.layers: dict[Layer, pg.sprite.Group] = {
-            layer: pg.sprite.Group() for layer in sorted(Layer)
+            layer: PopulationGroup() if layer == Layer.ASTEROIDS else pg.sprite.Group()
+            for layer in sorted(Layer)
+        }
+        self.collision_grids: dict[Layer, BroadPhase] = {
+            layer: self._new_broad_phase()
+            for layer in (Layer.ASTEROIDS, Layer.ENEMY_BULLETS, Layer.POWER_UP)
         }
-        self.gui = GUI(self.screen, max_health=100)
+        # drawn on the previous frame, cleared first by the dirty rects renderer
+        self._layer_rects: dict[Layer, list[pg.Rect]] = {}
+        self._overlay_rects: list[pg.Rect] = []
         self.lives = get_config().lives
-        self._init_player()
-        self.sound_manager = SoundManager
-        self.sound_manager.init()
+        self.asteroids_destroyed = 0
         self.alien = None
         self._pause = False
-        self.spawner = Spawner(self.layers)
 
-        self._text = Text(get_config().gui_font)
+        with report.phase('assets'):
+            log.debug("Setting background to '%s'", get_config().background_image)
+            self.background = repeat_surface(self.screen.get_size(),
+                                             load_image(get_config().background_image))
+            self.gui = GUI(self.screen, max_health=100)
+            self.sound_manager = SoundManager
+            self.sound_manager.init()
+            self.sound_manager.reserve(get_config().thrust_sound)
+            self.sound_manager.reserve(get_config().alien_sound)
+            self.spawner = Spawner(self.layers)
+            self._text = Text(get_config().gui_font)
+            self._text.prewarm((('Game Over', 40), ('Game paused', 40)))
+
+        with report.phase('sprites'):
+            self._init_player()
+            if get_config().prebake_rotations:
+                self._prebake_rotations()
+        if preloader is not None:
+            with report.phase('preloaded assets'):
+                self._finish_preloading(preloader)
+        self._subscribe()
 
         self.delta = 0
+        # fixed timestep: unsimulated time and how far rendering is between the last two steps
+        self._accumulator = 0.
+        self._alpha = 1.
         log.info("Setting spawn asteroid timer to %d ms", get_config().asteroid_spawn_frequency_ms)
-        pg.time.set_timer(
-            GameEvents.spawn_asteroid(SpawnAsteroidInfo(
+        self._timers = [
+            EventTimer(EventId.SPAWN_ASTEROID, SpawnAsteroidInfo(
                 size='big',
                 color=None,
                 position=None,
-            )), get_config().asteroid_spawn_frequency_ms)
+            ), get_config().asteroid_spawn_frequency_ms),
+            EventTimer(EventId.SPAWN_ALIEN, SpawnAlienInfo(
+                probability=get_config().alien_spawn_frequency_per_seconds
+            ), 1000),
+            EventTimer(EventId.SPAWN_POWERUP, SpawnPowerUpInfo(
+                power_ups=tuple(get_config().power_up.keys()),
+            ), get_config().power_up_freq_s * 1000),
+        ]
 
-        pg.time.set_timer(GameEvents.spawn_alien(SpawnAlienInfo(
-            probability=get_config().alien_spawn_frequency_per_seconds
-        )), 1000)
+    def _subscribe(self):
+        self.events.subscribe(EventId.SPAWN_ASTEROID, self.spawner.spawn_asteroid)
+        self.events.subscribe(EventId.SHOT_BULLET, self._shot)
+        self.events.subscribe(EventId.PLAYER_DEAD, self._on_player_dead)
+        self.events.subscribe(EventId.GAME_OVER, self._on_game_over)
+        self.events.subscribe(EventId.SPAWN_ALIEN, self.spawner.spawn_alien)
+        self.events.subscribe(EventId.SPAWN_POWERUP, self.spawner.spawn_powerup)
 
-        for powerup in ('health', 'laser'):
-            pg.time.set_timer(GameEvents.spawn_powerup(
-                SpawnPowerUpInfo(
-                    power_ups=tuple(get_config().power_up.keys()),
-                )), get_config().power_up_freq_s * 1000)
+    @staticmethod
+    def _finish_preloading(preloader: AssetPreloader):
+        """Takes the assets startup did not need yet, then stops the workers"""
+        for name in get_sprite_names():
+            load_image(name)
+        SoundManager.load(referenced_sounds(get_config()))
+        preloader.shutdown()
+        set_preloader(None)
+
+    def _prebake_rotations(self):
+        log.info("Pre-baking sprite rotations every %f degrees", get_config().rotation_step)
+        RotationCache.prebake('player', get_config().player_scale)
+        RotationCache.prebake('fire01')
+        RotationCache.prebake('ufoGreen', Spawner.ALIEN_SCALE)
+        for bullet_config in (*get_config().player_bullet, get_config().alien_bullet):
+            RotationCache.prebake(bullet_config.image, bullet_config.scale)
+        for sizes in self.spawner.asteroids_sprites.values():
+            for names in sizes.values():
+                for name in names:
+                    RotationCache.prebake(name)
+
+    def _new_broad_phase(self) -> BroadPhase:
+        if not get_config().collision_broad_phase:
+            return BruteForce()
+        return SpatialHash(self.screen.get_size(),
+                           cell_size=get_config().collision_cell_size,
+                           wrap=get_config().collision_wrap)
 
     def _init_player(self):
         self.lives -= 1
 
         # make sure event trigger only once
         if self.lives == -1:
-            pygame.event.post(GameEvents.game_over())
+            self.events.post(EventId.GAME_OVER)
             return
 
         self.player = Player(pos=self._get_center(),
@@ -92,16 +177,28 @@ class Asteroids:
         self.layers[Layer.PLAYERS].add(self.player)
         self.gui.health = self.player.health
 
+    @property
+    def game_over(self) -> bool:
+        return self._game_over
+
     def _get_center(self):
         return (self.screen.get_width() // 2,
                 self.screen.get_height() // 2)
 
-    def _handle_events(self):
-        for event in pg.event.get():
+    def _handle_input(self):
+        """Handles the pygame events once per `update`, however many steps it runs"""
+        events = pg.event.get()
+        if self.event_hook is not None:
+            events = self.event_hook(events)
+        for event in events:
+            if SoundManager.handle_event(event.type):
+                continue
             if event.type == pg.QUIT or \
                     event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE:
                 log.debug('Quit event')
                 self.is_running = False
+            if event.type == pg.KEYDOWN and event.key == pg.K_F3:
+                self.profiler.overlay = not self.profiler.overlay
             if event.type == pg.KEYDOWN and event.key == pg.K_p:
                 self._pause = not self._pause
                 if self._pause:
@@ -112,62 +209,98 @@ class Asteroids:
             if self._pause:
                 continue
 
-            if event.type == EventId.SPAWN_ASTEROID:
-                log.debug('Spawn asteroid event')
-                self.spawner.spawn_asteroid(event.info)
-            if event.type == EventId.SHOT_BULLET:
-                log.debug('Shot bullet event')
-                self._shot(event.info)
-            if event.type == EventId.PLAYER_DEAD:
-                log.debug("Respawning player")
-                self._init_player()
-            if event.type == EventId.GAME_OVER:
-                log.info("Game over!")
-                log.info("Score: %d", self.gui.score)
-                self._game_over = True
-            if event.type == EventId.SPAWN_ALIEN:
-                log.debug("Spawn alien event")
-                self.spawner.spawn_alien(event.info)
+            # events still posted through pygame with the GameEvents helpers
+            if event.type in self._event_ids:
+                self.events.post(EventId(event.type), getattr(event, 'info', None))
             if event.type == pg.KEYDOWN and event.key == pg.K_j:
                 self.spawner.spawn_alien(SpawnAlienInfo(probability=1.))
-            if event.type == EventId.SPAWN_POWERUP:
-                self.spawner.spawn_powerup(event.info)
             if event.type == pg.KEYDOWN and event.key == pg.K_o:
-                pygame.event.post(
-                    GameEvents.spawn_powerup(
-                        SpawnPowerUpInfo(
-                            power_ups=tuple(get_config().power_up.keys())
-                        )))
+                self.events.post(EventId.SPAWN_POWERUP, SpawnPowerUpInfo(
+                    power_ups=tuple(get_config().power_up.keys())
+                ))
+
+    def _dispatch_events(self):
+        if self._pause:
+            self.events.clear()
+        else:
+            self.events.dispatch()
+
+    _event_ids = frozenset(EventId)
+
+    def _on_player_dead(self, info: None):
+        log.debug("Respawning player")
+        self._init_player()
+
+    def _on_game_over(self, info: None):
+        log.info("Game over!")
+        log.info("Score: %d", self.gui.score)
+        self._game_over = True
 
     def _shot(self, info: ShotBulletInfo):
         bullet_config = info.bullet_config
         x = -math.sin(math.radians(info.angle))
         y = -math.cos(math.radians(info.angle))
         velocity = pg.math.Vector2(x, y) * bullet_config.velocity
-        bullet = Bullet(image_name=bullet_config.image, pos=info.position,
-                        velocity=velocity, angle=info.angle,
-                        scale=bullet_config.scale, ttl=bullet_config.duration,
-                        damage=bullet_config.damage,
-                        groups=self.layers,
-                        hit_animation_images=bullet_config.hit_images)
+        bullet = Bullet.acquire(image_name=bullet_config.image, pos=info.position,
+                                velocity=velocity, angle=info.angle,
+                                scale=bullet_config.scale, ttl=bullet_config.duration,
+                                damage=bullet_config.damage,
+                                groups=self.layers,
+                                hit_animation_images=bullet_config.hit_images)
 
         log.debug("Shot bullet %s", bullet)
         self.layers[info.layer].add(bullet)
         self.sound_manager.play(bullet_config.sound)
 
-    def update(self):
-        dt = self._clock.tick(60)
-        keys = pg.key.get_pressed()
+    def tick(self) -> int:
+        return self._clock.tick(60)
+
+    def update(self, dt: float = None, keys: Sequence[bool] = None):
+        if dt is None:
+            dt = self.tick()
+        self.profiler.begin_frame()
+        if keys is None:
+            keys = pg.key.get_pressed()
+        with self.profiler.phase('input'):
+            self._handle_input()
+        if not get_config().fixed_timestep_hz:
+            self._step(dt, keys)
+            return
+
+        step_ms = 1000 / get_config().fixed_timestep_hz
+        self._accumulator += dt
+        steps = 0
+        while self._accumulator >= step_ms:
+            if steps == get_config().max_catchup_steps:
+                log.debug("Dropping %f ms the simulation could not catch up on", self._accumulator)
+                self._accumulator %= step_ms
+                break
+            self._step(step_ms, keys)
+            self._accumulator -= step_ms
+            steps += 1
+        interpolate = get_config().render_interpolation and not self._pause
+        self._alpha = self._accumulator / step_ms if interpolate else 1.
+
+    def _step(self, dt: float, keys: Sequence[bool]):
         self.delta = dt
         log.debug("Handling game events")
-        self._handle_events()
+        with self.profiler.phase('events'):
+            self._dispatch_events()
 
         if self._pause:
             return
 
+        if get_config().fixed_timestep_hz and get_config().render_interpolation:
+            self._snapshot()
+        for timer in self._timers:
+            timer.update(dt)
+        if self.physics is not None:
+            with self.profiler.phase('physics'):
+                self.physics.step(dt, self.screen.get_size())
         log.debug("Updating actors")
-        for group in self.layers.values():
-            group.update(dt, keys)
+        for layer, group in self.layers.items():
+            with self.profiler.phase(self._update_phases[layer]):
+                group.update(dt, keys)
         self.check_actions()
         self.gui.health = self.player.health
         self.gui.lives = self.lives
@@ -182,40 +315,100 @@ class Asteroids:
         if self.player.is_dead() and self.player.active:
             self.player.explode()
             self.sound_manager.play(get_config().player_die_sound)
+        self.sound_manager.flush()
         try:
             self.alien = self.layers[Layer.ENEMIES].sprites()[0]
         except IndexError:
             self.alien = None
 
+    def _snapshot(self):
+        for group in self.layers.values():
+            for sprite in group:
+                if isinstance(sprite, StaticActor):
+                    sprite.snapshot()
+
     def render(self):
-        self.screen.blit(self.background, (0, 0))
+        if get_config().dirty_rects and self._layer_rects:
+            self._render_dirty()
+        else:
+            self._render_full()
+        if self.profiler.enabled:
+            self.profiler.end_frame({layer.name: len(group) for layer, group in self.layers.items()})
+
+    def _render_full(self):
+        with self.profiler.phase('background'):
+            self.screen.blit(self.background, (0, 0))
+        self._draw()
+        with self.profiler.phase('flip'):
+            pg.display.flip()
+
+    def _render_dirty(self):
+        previous = [rect for rects in self._layer_rects.values() for rect in rects]
+        previous.extend(self._overlay_rects)
+        with self.profiler.phase('background'):
+            for rect in previous:
+                self.screen.blit(self.background, rect, rect)
+        self._draw()
+        dirty = previous
+        for rects in self._layer_rects.values():
+            dirty.extend(rects)
+        dirty.extend(self._overlay_rects)
+        with self.profiler.phase('flip'):
+            if len(dirty) > get_config().max_dirty_rects:
+                log.debug("%d dirty rects, flipping the whole screen", len(dirty))
+                pg.display.flip()
+            else:
+                pg.display.update(dirty)
+
+    def _draw(self):
         log.debug("Drawing all actors")
-        for group in self.layers.values():
-            group.draw(self.screen)
-        self.gui.render()
+        for layer, group in self.layers.items():
+            with self.profiler.phase(self._draw_phases[layer]):
+                if self._alpha < 1:
+                    blits = [sprite.interpolated(self._alpha) if isinstance(sprite, StaticActor)
+                             else (sprite.image, sprite.rect) for sprite in group]
+                else:
+                    blits = [(sprite.image, sprite.rect) for sprite in group]
+                self._layer_rects[layer] = self.screen.blits(blits)
+        with self.profiler.phase('gui'):
+            self._overlay_rects = self.gui.render()
         if self._game_over:
-            self._text.render('Game Over', 40, Vector2(self._get_center()) + Vector2(0, -100))
-            self._text.render(f'{self.gui.score}', 32, Vector2(self._get_center()) + Vector2(0, -50))
+            self._overlay_rects.append(
+                self._text.render('Game Over', 40, Vector2(self._get_center()) + Vector2(0, -100)))
+            self._overlay_rects.append(
+                self._text.render(f'{self.gui.score}', 32, Vector2(self._get_center()) + Vector2(0, -50)))
         if self._pause:
-            self._text.render("Game paused", 40, Vector2(self._get_center()))
-        pg.display.flip()
+            self._overlay_rects.append(
+                self._text.render("Game paused", 40, Vector2(self._get_center())))
+        if (overlay_rect := self.profiler.draw_overlay(self.screen)) is not None:
+            self._overlay_rects.append(overlay_rect)
 
     def check_actions(self):
-        self.check_player_bullets_hit()
-        self.check_asteroid_hit_player()
-        self.check_asteroid_hit_alien()
-        self.check_powerups()
+        with self.profiler.phase('collide.broad_phase'):
+            for layer, grid in self.collision_grids.items():
+                grid.rebuild(self.layers[layer])
+        with self.profiler.phase('collide.player_bullets_hit'):
+            self.check_player_bullets_hit()
+        with self.profiler.phase('collide.asteroid_hit_player'):
+            self.check_asteroid_hit_player()
+        with self.profiler.phase('collide.asteroid_hit_alien'):
+            self.check_asteroid_hit_alien()
+        with self.profiler.phase('collide.powerups'):
+            self.check_powerups()
+        log.debug("Collision candidates: %d, hits: %d",
+                  sum(grid.candidates for grid in self.collision_grids.values()),
+                  sum(grid.hits for grid in self.collision_grids.values()))
 
     def check_player_bullets_hit(self):
         bullet: Bullet
         asteroid: Asteroid
         for bullet in self.layers[Layer.BULLETS]:
-            for asteroid in self.layers[Layer.ASTEROIDS]:
-                if pg.sprite.collide_circle(bullet, asteroid):
-                    bullet.on_hit()
-                    asteroid.on_bullet_hit(bullet)
-                    if not asteroid.alive():
-                        self.gui.score += asteroid.score
+            for asteroid in self.collision_grids[Layer.ASTEROIDS].collide(bullet):
+                bullet.on_hit()
+                asteroid.on_bullet_hit(bullet)
+                if not asteroid.alive():
+                    self.gui.score += asteroid.score
+                    self.asteroids_destroyed += 1
             if self.alien and self.alien.alive() and pg.sprite.collide_circle(bullet, self.alien):
                 bullet.on_hit()
                 self.alien.on_bullet_hit(bullet)
@@ -224,22 +417,23 @@ class Asteroids:
 
     def check_asteroid_hit_player(self):
         asteroid: Asteroid
-        for asteroid in self.layers[Layer.ASTEROIDS]:
-            if pg.sprite.collide_circle(self.player, asteroid):
-                self.player.on_asteroid_hit()
+        for asteroid in self.collision_grids[Layer.ASTEROIDS].collide(self.player):
+            self.player.on_asteroid_hit()
 
     def check_asteroid_hit_alien(self):
         bullet: Bullet
-        for bullet in self.layers[Layer.ENEMY_BULLETS]:
-            if pg.sprite.collide_circle(bullet, self.player):
-                bullet.on_hit()
-                self.player.on_bullet_hit(bullet)
+        for bullet in self.collision_grids[Layer.ENEMY_BULLETS].collide(self.player):
+            bullet.on_hit()
+            self.player.on_bullet_hit(bullet)
 
     def check_powerups(self):
+        collected = set()
+        if self.player.alive():
+            collected.update(self.collision_grids[Layer.POWER_UP].collide(self.player))
         for powerup in self.layers[Layer.POWER_UP]:
             powerup: PowerUp
             powerup.duration -= self.delta
-            if self.player.alive() and pg.sprite.collide_circle(powerup, self.player):
+            if powerup in collected:
                 powerup.activate()
                 powerup.kill()
             if powerup.duration < 0:
@@ -0,0 +1,98 @@
+import argparse
+import json
+import logging
+from functools import cache
+from importlib.resources import files
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import pygame
+
+from asteroids.preloader import get_preloader
+
+log = logging.getLogger(__name__)
+
+ATLAS_IMAGE = 'atlas.png'
+ATLAS_INDEX = 'atlas.json'
+VERSION = 1
+
+
+class Atlas(NamedTuple):
+    surface: pygame.Surface
+    rects: dict[str, pygame.Rect]
+
+    def get(self, name: str) -> Optional[pygame.Surface]:
+        rect = self.rects.get(name)
+        if rect is None:
+            return None
+        return self.surface.subsurface(rect)
+
+
+def pack(sizes: dict[str, tuple[int, int]], max_width: int = 1024,
+         padding: int = 1) -> tuple[dict[str, pygame.Rect], tuple[int, int]]:
+    """Shelf packing, tallest sprites first, returns every sprite's rect and the atlas size"""
+    rects = {}
+    x = y = shelf_height = width = 0
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+        if x and x + w > max_width:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        rects[name] = pygame.Rect(x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+        width = max(width, x - padding)
+    return rects, (width, y + shelf_height)
+
+
+def build(sprites_dir: Path, output_dir: Path, max_width: int = 1024, padding: int = 1) -> dict[str, pygame.Rect]:
+    images = {path.stem: pygame.image.load(path) for path in sorted(sprites_dir.glob('*.png'))}
+    rects, size = pack({name: image.get_size() for name, image in images.items()}, max_width, padding)
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    for name, image in images.items():
+        # MAX onto the transparent atlas copies the pixels, a normal blit would blend the alpha away
+        atlas.blit(image, rects[name], special_flags=pygame.BLEND_RGBA_MAX)
+    pygame.image.save(atlas, output_dir / ATLAS_IMAGE)
+    index = {
+        'version': VERSION,
+        'size': list(size),
+        'sprites': {name: list(rect) for name, rect in rects.items()},
+    }
+    (output_dir / ATLAS_INDEX).write_text(json.dumps(index, indent=1))
+    log.info("Packed %d sprites into a %dx%d atlas", len(rects), *size)
+    return rects
+
+
+def has_atlas() -> bool:
+    return files('asteroids.resources').joinpath(ATLAS_INDEX).is_file()
+
+
+@cache
+def get_atlas() -> Optional[Atlas]:
+    """The packed sprites, None when the atlas was not built"""
+    if not has_atlas():
+        return None
+    resources = files('asteroids.resources')
+    index = json.loads(resources.joinpath(ATLAS_INDEX).read_text())
+    if index.get('version') != VERSION:
+        log.warning("Ignoring sprite atlas version %s, rebuild it with python -m asteroids.atlas",
+                    index.get('version'))
+        return None
+    preloader = get_preloader()
+    surface = preloader.take('atlas') if preloader is not None else None
+    if surface is None:
+        surface = pygame.image.load(resources.joinpath(ATLAS_IMAGE))
+    surface = surface.convert_alpha()
+    return Atlas(surface, {name: pygame.Rect(rect) for name, rect in index['sprites'].items()})
+
+
+if __name__ == '__main__':
+    resources = Path(__file__).parent / 'resources'
+    parser = argparse.ArgumentParser(prog='python -m asteroids.atlas',
+                                     description='pack resources/sprites into a single atlas')
+    parser.add_argument('--sprites', type=Path, default=resources / 'sprites')
+    parser.add_argument('--output', type=Path, default=resources)
+    parser.add_argument('--max-width', type=int, default=1024)
+    parser.add_argument('--padding', type=int, default=1)
+    args = parser.parse_args()
+    packed = build(args.sprites, args.output, args.max_width, args.padding)
+    print(f'Packed {len(packed)} sprites into {args.output / ATLAS_IMAGE}')
@@ -0,0 +1,164 @@
+import os
+
+# spawned workers import pygame too, keep its banner out of the JSON lines
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import argparse
+import itertools
+import json
+import logging
+import multiprocessing
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, NamedTuple, Optional, TextIO
+
+from asteroids.benchmark import _parse_override
+from asteroids.config import Config, get_config, set_config
+from asteroids.env import ACTIONS, AsteroidsEnv
+from asteroids.events.game_events import EventId
+
+log = logging.getLogger(__name__)
+
+POLICIES: dict[str, Callable[[random.Random], int]] = {
+    'idle': lambda rng: 0,
+    'random': lambda rng: rng.randrange(len(ACTIONS)),
+}
+
+
+class Episode(NamedTuple):
+    index: int
+    seed: int
+    overrides: dict[str, Any]
+    frames: int
+    policy: str = 'random'
+    frame_skip: int = 4
+
+
+class EpisodeResult(NamedTuple):
+    index: int
+    seed: int
+    overrides: dict[str, Any]
+    policy: str
+    score: int
+    frames: int
+    deaths: int
+    asteroids_destroyed: int
+    game_over: bool
+    seconds: float
+    sim_fps: float
+
+
+# per worker process, every episode resets the same environment
+_base_config: Optional[Config] = None
+_env: Optional[AsteroidsEnv] = None
+
+
+def _init_worker(config: Config):
+    global _base_config
+    _base_config = config._replace(full_screen=False)
+
+
+def run_episode(episode: Episode) -> EpisodeResult:
+    global _env
+    config = (_base_config or get_config())._replace(**episode.overrides)
+    set_config(config)
+    if _env is None:
+        _env = AsteroidsEnv(config=config)
+    _env.frame_skip = episode.frame_skip
+    policy = POLICIES[episode.policy]
+    # the game draws from the global random, the policy gets its own stream
+    rng = random.Random(episode.seed)
+    _env.reset(episode.seed)
+    start = time.perf_counter()
+    info = {'frames': 0}
+    terminated = False
+    while not terminated and info['frames'] < episode.frames:
+        _, _, terminated, _, info = _env.step(policy(rng))
+    seconds = time.perf_counter() - start
+    game = _env.game
+    return EpisodeResult(index=episode.index, seed=episode.seed, overrides=episode.overrides,
+                         policy=episode.policy, score=game.gui.score, frames=info['frames'],
+                         deaths=game.events.posted[EventId.PLAYER_DEAD],
+                         asteroids_destroyed=game.asteroids_destroyed, game_over=terminated,
+                         seconds=seconds, sim_fps=info['frames'] / seconds if seconds else 0.)
+
+
+def episodes(count: int, seed: int, frames: int, policy: str,
+             sweep: Optional[dict[str, list]] = None, frame_skip: int = 4) -> list[Episode]:
+    """`count` seeds for every combination of the swept Config values"""
+    sweep = sweep or {}
+    combinations = [dict(zip(sweep, values)) for values in itertools.product(*sweep.values())]
+    return [Episode(index=index, seed=seed + index % count, overrides=overrides,
+                    frames=frames, policy=policy, frame_skip=frame_skip)
+            for index, (overrides, _) in enumerate(itertools.product(combinations, range(count)))]
+
+
+def run(batch: list[Episode], workers: int, config: Config = None) -> Iterator[EpisodeResult]:
+    """Runs the episodes on a pool of `workers` processes, yields results as they finish"""
+    # spawned workers start from a clean interpreter, nothing leaks in from pygame or module state
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(config or get_config(),)) as executor:
+        futures = {executor.submit(run_episode, episode): episode for episode in batch}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception:
+                log.exception("Episode %s failed", futures[future])
+
+
+def _parse_sweep(value: str) -> tuple[str, list]:
+    key, values = _parse_override(value)
+    if not isinstance(values, (list, tuple)):
+        raise argparse.ArgumentTypeError(f'{key} needs a list of values to sweep')
+    return key, list(values)
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(prog='python -m asteroids.batch',
+                                     description='run seeded headless episodes on a process pool')
+    parser.add_argument('--episodes', type=int, default=os.cpu_count(),
+                        help='seeds per combination of swept values')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first episode')
+    parser.add_argument('--frames', type=int, default=3600, help='frame limit of an episode')
+    parser.add_argument('--frame-skip', type=int, default=4, help='frames each policy action is held')
+    parser.add_argument('--policy', choices=POLICIES, default='random')
+    parser.add_argument('--set', type=_parse_override, action='append', default=[],
+                        metavar='KEY=VALUE', help='override a Config field in every episode')
+    parser.add_argument('--sweep', type=_parse_sweep, action='append', default=[],
+                        metavar='KEY=[VALUES]', help='run the episodes for each value of a Config field')
+    parser.add_argument('--output', help='append the JSON lines to this file instead of stdout')
+    return parser.parse_args()
+
+
+def _write(results: Iterator[EpisodeResult], out: TextIO) -> tuple[int, int]:
+    count = frames = 0
+    for result in results:
+        out.write(json.dumps(result._asdict()) + '\n')
+        out.flush()
+        count += 1
+        frames += result.frames
+    return count, frames
+
+
+def main():
+    args = _parse_args()
+    set_config(get_config()._replace(**dict(args.set)))
+    batch = episodes(args.episodes, args.seed, args.frames, args.policy, dict(args.sweep), args.frame_skip)
+    start = time.perf_counter()
+    results = run(batch, args.workers)
+    if args.output:
+        with open(args.output, 'a') as f:
+            count, frames = _write(results, f)
+    else:
+        count, frames = _write(results, sys.stdout)
+    seconds = time.perf_counter() - start
+    print(f'{count}/{len(batch)} episodes, {frames} frames in {seconds:.2f}s '
+          f'({frames / seconds:.0f} fps on {args.workers} workers)', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+import argparse
+import ast
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from typing import Callable, NamedTuple
+
+import pygame
+from pygame.math import Vector2
+
+from asteroids.asteroids import Asteroids
+from asteroids.config import get_config, set_config
+from asteroids.events.events_info import ShotBulletInfo, SpawnAsteroidInfo, SpawnAlienInfo
+from asteroids.game import setup_headless
+from asteroids.layer import Layer
+
+log = logging.getLogger(__name__)
+
+PHASES = (
+    'update',
+    'broad_phase',
+    'check_player_bullets_hit',
+    'check_asteroid_hit_player',
+    'check_asteroid_hit_alien',
+    'check_powerups',
+    'render',
+    'gui.render',
+)
+
+
+class Scenario(NamedTuple):
+    asteroids: int
+    bullets: int
+    alien: bool = True
+    explosions: int = 0
+
+    @property
+    def name(self) -> str:
+        return f'asteroids={self.asteroids},bullets={self.bullets},alien={int(self.alien)},explosions={self.explosions}'
+
+
+class Timing(NamedTuple):
+    median_ms: float
+    mean_ms: float
+    min_ms: float
+    max_ms: float
+    samples: int
+
+
+def build_game(scenario: Scenario, seed: int) -> Asteroids:
+    random.seed(seed)
+    set_config(get_config()._replace(max_asteroids=max(scenario.asteroids, get_config().max_asteroids)))
+    game = Asteroids()
+    width, height = game.screen.get_size()
+    game.spawner.spawn_asteroids_batch([SpawnAsteroidInfo(
+        position=Vector2(random.randrange(width), random.randrange(height)),
+        size=random.choice(('big', 'medium', 'small')),
+        color=None,
+    ) for _ in range(scenario.asteroids)])
+    # long lived bullets so the scenario does not drain while measuring
+    bullet_config = get_config().player_bullet[-1]._replace(duration=10 ** 9)
+    for _ in range(scenario.bullets):
+        game._shot(ShotBulletInfo(
+            position=Vector2(random.randrange(width), random.randrange(height)),
+            bullet_config=bullet_config,
+            angle=random.randrange(360),
+            layer=Layer.BULLETS,
+        ))
+    if scenario.alien:
+        game.spawner.spawn_alien(SpawnAlienInfo(probability=1.))
+    asteroids = game.layers[Layer.ASTEROIDS].sprites()
+    for asteroid in random.sample(asteroids, min(scenario.explosions, len(asteroids))):
+        asteroid.explode()
+    return game
+
+
+def _phase(game: Asteroids, phase: str, dt: float) -> tuple[Callable[[], None], Callable[[], None]]:
+    """Returns the untimed setup and the timed call of a phase"""
+    def rebuild():
+        for layer, grid in game.collision_grids.items():
+            grid.rebuild(game.layers[layer])
+
+    def nothing():
+        pass
+
+    match phase:
+        case 'update':
+            return nothing, lambda: game.update(dt)
+        case 'broad_phase':
+            return nothing, rebuild
+        case 'render':
+            return nothing, game.render
+        case 'gui.render':
+            return nothing, game.gui.render
+        case _:
+            return rebuild, getattr(game, phase)
+
+
+def measure(scenario: Scenario, phase: str, repeat: int, dt: float, seed: int) -> Timing:
+    samples = []
+    for _ in range(repeat):
+        # the phases kill and spawn sprites, every sample starts from a freshly built scenario
+        call = _prepare(scenario, phase, dt, seed)
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return Timing(median_ms=statistics.median(samples),
+                  mean_ms=statistics.fmean(samples),
+                  min_ms=min(samples),
+                  max_ms=max(samples),
+                  samples=len(samples))
+
+
+def _prepare(scenario: Scenario, phase: str, dt: float, seed: int) -> Callable[[], None]:
+    game = build_game(scenario, seed)
+    # first update handles the spawn and explosion events queued by the scenario
+    game.update(dt)
+    setup, call = _phase(game, phase, dt)
+    setup()
+    return call
+
+
+def run(scenarios: list[Scenario], phases: tuple[str, ...], repeat: int, dt: float, seed: int) -> dict:
+    results = {}
+    for scenario in scenarios:
+        log.info('Benchmarking %s', scenario.name)
+        results[scenario.name] = {
+            phase: measure(scenario, phase, repeat, dt, seed)._asdict() for phase in phases
+        }
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_ms: float) -> list[str]:
+    regressions = []
+    for scenario, phases in results.items():
+        for phase, timing in phases.items():
+            try:
+                base = baseline[scenario][phase]['median_ms']
+            except KeyError:
+                continue
+            current = timing['median_ms']
+            if current > base * (1 + tolerance) and current - base > min_ms:
+                regressions.append(f'{scenario} {phase}: {base:.3f} ms -> {current:.3f} ms '
+                                   f'(+{(current / base - 1) * 100:.0f}%)')
+    return regressions
+
+
+def _parse_override(value: str) -> tuple[str, object]:
+    key, _, raw = value.partition('=')
+    if key not in get_config()._fields:
+        raise argparse.ArgumentTypeError(f'Unknown config field: {key}')
+    try:
+        return key, ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        return key, raw
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(prog='python -m asteroids.benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 50, 200],
+                        help='asteroid counts to benchmark')
+    parser.add_argument('--bullet-ratio', type=float, default=1.,
+                        help='bullets per asteroid')
+    parser.add_argument('--explosion-ratio', type=float, default=.1,
+                        help='fraction of asteroids exploded before measuring')
+    parser.add_argument('--no-alien', action='store_true')
+    parser.add_argument('--phases', nargs='+', choices=PHASES, default=PHASES)
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--dt', type=float, default=1000 / 60)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--set', type=_parse_override, action='append', default=[],
+                        metavar='KEY=VALUE', help='override a Config field')
+    parser.add_argument('--output', help='write the JSON results to this file')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='flag regressions against a stored JSON result')
+    parser.add_argument('--tolerance', type=float, default=.1,
+                        help='allowed relative slowdown of the median')
+    parser.add_argument('--min-ms', type=float, default=.01,
+                        help='ignore slowdowns smaller than this')
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    setup_headless()
+    set_config(get_config()._replace(**dict(args.set)))
+    pygame.init()
+    scenarios = [Scenario(asteroids=size,
+                          bullets=round(size * args.bullet_ratio),
+                          alien=not args.no_alien,
+                          explosions=round(size * args.explosion_ratio))
+                 for size in args.sizes]
+    report = {
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'dt': args.dt,
+        'config': dict(args.set),
+        'results': run(scenarios, tuple(args.phases), args.repeat, args.dt, args.seed),
+    }
+    pygame.quit()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(report['results'], baseline, args.tolerance, args.min_ms)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print('No regressions', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
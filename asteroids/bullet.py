@@ -1,20 +1,32 @@
 import logging
 from typing import Sequence
 
+from pygame.math import Vector2
+
 from asteroids.actor import Actor
 from asteroids.animation import Animation
 from asteroids.config import get_config
 from asteroids.layer import Layer
+from asteroids.pool import Poolable
 
 log = logging.getLogger(__name__)
 
 
-class Bullet(Actor):
+class Bullet(Poolable, Actor):
     def __init__(self, ttl=500, damage=1, *args, hit_animation_images: Sequence[str], **kwargs):
         super().__init__(*args, **kwargs)
         self.ttl_ms = ttl
         self.damage = damage
         self._animation_sprites = hit_animation_images
+        self._sync_body()
+
+    def reset(self, ttl=500, damage=1, *, image_name: str, pos: Vector2, velocity: Vector2, angle: float = 0,
+              scale: float = 1, groups=None, hit_animation_images: Sequence[str]):
+        self._reset(image_name, scale, pos, velocity, angle, groups=groups)
+        self.ttl_ms = ttl
+        self.damage = damage
+        self._animation_sprites = hit_animation_images
+        self._sync_body()
 
     def hit(self):
         super().hit()
@@ -22,6 +34,8 @@ class Bullet(Actor):
 
     def update(self, dt, keys) -> None:
         super().update(dt, keys)
+        if self._body is not None:
+            return
         self.ttl_ms -= dt
         if self.ttl_ms <= 0:
             log.debug("Killing bullet")
@@ -29,6 +43,6 @@ class Bullet(Actor):
 
     def on_hit(self):
         self.hit()
-        animation = Animation(self._animation_sprites,
-                              self.position, 30, 0.8)
+        animation = Animation.acquire(self._animation_sprites,
+                                      self.position, 30, 0.8)
         self.groups[Layer.ANIMATIONS].add(animation)
@@ -11,6 +11,11 @@ def get_config() -> Config:
     return _config
 
 
+def set_config(config: Config):
+    global _config
+    _config = config
+
+
 class _BulletConfig(NamedTuple):
     image: str
     sound: str
@@ -40,6 +45,13 @@ class Config(NamedTuple):
     out_of_screen_offset_spawn: int = 100
     max_asteroids: int = 15
     background_image: str = 'purple'
+    # serve sprites from resources/atlas.png when it was built with python -m asteroids.atlas
+    sprite_atlas: bool = True
+    # resolve assets through resources/manifest.json when it was built with python -m asteroids.manifest
+    asset_manifest: bool = True
+    # decode sprites and sounds on worker threads while the window opens
+    preload_assets: bool = True
+    preload_workers: int = 4
     lives: int = 3
     player_asteroid_damage: float = .5
     player_scale: float = .5
@@ -96,6 +108,23 @@ class Config(NamedTuple):
     explosion_sound: str = 'explosionCrunch_000'
     hit_sound: str = 'lowFrequency_explosion_000'
     global_volume: float = .5
+    sound_channels: int = 16
+    # voices one sound may play at once, loops get their own reserved channel
+    sound_voice_limit: int = 4
+    sound_voice_limits: dict[str, int] = {
+        'sfx_laser2': 6,
+        'laserSmall_002': 2,
+        'impactMetal_000': 1,
+    }
+    # a sound without a free channel steals the oldest voice of an equal or lower priority
+    sound_priorities: dict[str, int] = {
+        'sfx_lose': 3,
+        'explosionCrunch_004': 2,
+        'sfx_twoTone': 2,
+        'impactMetal_000': 2,
+        'explosionCrunch_000': 1,
+        'sfx_laser2': 1,
+    }
     power_up: dict[str, _PowerConfig] = {
         'health': _PowerConfig(
             image='pill_green',
@@ -112,3 +141,26 @@ class Config(NamedTuple):
     power_up_spawn_area: float = 0.1
     powerup_sound: str = 'sfx_twoTone'
     power_up_health_amount: int = 20
+    rotation_step: float = 1.
+    prebake_rotations: bool = False
+    collision_broad_phase: bool = True
+    collision_cell_size: int = 128
+    # sprites touch across the screen edges, off by default as they are only drawn on one side
+    collision_wrap: bool = False
+    vectorized_physics: bool = False
+    # simulation steps per second, 0 steps once per rendered frame with its measured dt
+    fixed_timestep_hz: int = 0
+    max_catchup_steps: int = 5
+    render_interpolation: bool = True
+    dirty_rects: bool = False
+    max_dirty_rects: int = 200
+    profiler: bool = False
+    profiler_overlay: bool = False
+    profiler_window: int = 300
+    text_cache_entries: int = 64
+    text_cache_bytes: int = 4 * 1024 * 1024
+    pool_capacity: dict[str, int] = {
+        'bullet': 256,
+        'animation': 128,
+        'asteroid': 64,
+    }
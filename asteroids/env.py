@@ -0,0 +1,173 @@
+import logging
+import math
+import random
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+import pygame
+from pygame.constants import K_SPACE, K_a, K_d, K_w
+from pygame.math import Vector2
+
+from asteroids.asteroids import Asteroids
+from asteroids.config import Config, set_config
+from asteroids.frame import FrameRenderer
+from asteroids.game import setup_headless
+from asteroids.keys import KeyState
+from asteroids.layer import Layer
+
+log = logging.getLogger(__name__)
+
+
+class Action(NamedTuple):
+    name: str
+    keys: KeyState
+
+
+ACTIONS = (
+    Action('noop', KeyState()),
+    Action('thrust', KeyState((K_w,))),
+    Action('left', KeyState((K_a,))),
+    Action('right', KeyState((K_d,))),
+    Action('fire', KeyState((K_SPACE,))),
+    Action('thrust_left', KeyState((K_w, K_a))),
+    Action('thrust_right', KeyState((K_w, K_d))),
+    Action('thrust_fire', KeyState((K_w, K_SPACE))),
+    Action('left_fire', KeyState((K_a, K_SPACE))),
+    Action('right_fire', KeyState((K_d, K_SPACE))),
+)
+
+# columns of an observation row, the layer one-hot follows the numeric features
+FEATURES = ('dx', 'dy', 'vx', 'vy', 'radius', 'heading_x', 'heading_y', 'health',
+            *(f'is_{layer.name.lower()}' for layer in Layer))
+_LAYER_COLUMN = FEATURES.index('health') + 1
+# the player is row 0, its own layer is not observed
+OBSERVED_LAYERS = tuple(layer for layer in Layer if layer not in (Layer.PLAYERS, Layer.ANIMATIONS))
+_STILL = Vector2()
+
+
+class AsteroidsEnv:
+    """Gym-style headless environment, an action is an index into `ACTIONS`.
+
+    Observations are `(1 + max_entities, len(FEATURES))` float32 arrays: the player
+    followed by the nearest entities sorted by distance, zero rows when there are fewer.
+    Positions are relative to the player across the screen wrap, lengths are scaled so
+    half the screen is 1. The reward is the score gained plus `health_weight` times the
+    health change of the current life.
+
+    With a `frame_size` the observations are the game drawn at that `(width, height)`
+    instead, see `FrameRenderer`.
+    """
+
+    def __init__(self, max_entities: int = 16, frame_skip: int = 4, dt: float = 1000 / 60,
+                 max_steps: Optional[int] = None, health_weight: float = .1,
+                 config: Optional[Config] = None, frame_size: Optional[tuple[int, int]] = None,
+                 grayscale: bool = False):
+        if config is not None:
+            set_config(config)
+        setup_headless()
+        pygame.init()
+        self.max_entities = max_entities
+        self.frame_skip = frame_skip
+        self.dt = dt
+        self.max_steps = max_steps
+        self.health_weight = health_weight
+        self.observation_shape = (1 + max_entities, len(FEATURES))
+        self.frames: Optional[FrameRenderer] = None
+        if frame_size is not None:
+            self.frames = FrameRenderer(frame_size, grayscale)
+            width, height = frame_size
+            self.observation_shape = (height, width) if grayscale else (height, width, 3)
+        self.game: Optional[Asteroids] = None
+        self._steps = 0
+        self._frames = 0
+        self._score = 0
+        self._player = None
+        self._health = 0
+
+    def reset(self, seed: Optional[int] = None) -> tuple[np.ndarray, dict[str, Any]]:
+        if seed is not None:
+            random.seed(seed)
+        log.debug("Resetting with seed %s", seed)
+        self.game = Asteroids()
+        width, height = self.game.screen.get_size()
+        self._size = np.array((width, height), dtype=np.float32)
+        self._scale = 2 / max(width, height)
+        self._steps = 0
+        self._frames = 0
+        self._track()
+        return self._observe(), self._info()
+
+    def step(self, action: int) -> tuple[np.ndarray, float, bool, bool, dict[str, Any]]:
+        """Plays `action` for `frame_skip` frames, returns the observation, reward, terminated, truncated and info"""
+        keys = ACTIONS[action].keys
+        previous_score, previous_player, previous_health = self._score, self._player, self._health
+        for _ in range(self.frame_skip):
+            self.game.update(self.dt, keys)
+            self._frames += 1
+            if self.game.game_over:
+                break
+        self._steps += 1
+        self._track()
+        reward = float(self._score - previous_score)
+        if self._player is previous_player:
+            reward += self.health_weight * (self._health - previous_health)
+        truncated = self.max_steps is not None and self._steps >= self.max_steps
+        return self._observe(), reward, self.game.game_over, truncated, self._info()
+
+    def render(self):
+        self.game.render()
+
+    def close(self):
+        self.game = None
+        pygame.quit()
+
+    def _track(self):
+        self._score = self.game.gui.score
+        self._player = self.game.player
+        self._health = self._player.health
+
+    def _info(self) -> dict[str, Any]:
+        return {'score': self.game.gui.score, 'lives': self.game.lives,
+                'health': self.game.player.health, 'steps': self._steps, 'frames': self._frames}
+
+    def _observe(self) -> np.ndarray:
+        if self.frames is not None:
+            return self.frames.render(self.game)
+        observation = np.zeros(self.observation_shape, dtype=np.float32)
+        player = self.game.player
+        center = self._size / 2
+        px, py = player.position
+        observation[0, :8] = ((px - center[0]) * self._scale, (py - center[1]) * self._scale,
+                              *player.velocity, player.radius * self._scale,
+                              *_heading(player.angle), player.health / 100)
+        observation[0, _LAYER_COLUMN + Layer.PLAYERS - 1] = 1
+
+        entities = [(sprite.position.x, sprite.position.y, *getattr(sprite, 'velocity', _STILL),
+                     sprite.radius, getattr(sprite, 'angle', 0), getattr(sprite, 'health', 0), layer)
+                    for layer in OBSERVED_LAYERS for sprite in self.game.layers[layer]]
+        if not entities:
+            return observation
+        entities = np.array(entities, dtype=np.float32)
+        # shortest offsets on the wrapping screen
+        offsets = (entities[:, :2] - (px, py) + center) % self._size - center
+        distances = np.einsum('ij,ij->i', offsets, offsets)
+        if len(distances) > self.max_entities:
+            nearest = np.argpartition(distances, self.max_entities - 1)[:self.max_entities]
+            nearest = nearest[np.argsort(distances[nearest])]
+        else:
+            nearest = np.argsort(distances)
+        entities, offsets = entities[nearest], offsets[nearest]
+        rows = np.arange(1, 1 + len(nearest))
+        angles = np.radians(entities[:, 5])
+        observation[rows, 0:2] = offsets * self._scale
+        observation[rows, 2:4] = entities[:, 2:4]
+        observation[rows, 4] = entities[:, 4] * self._scale
+        observation[rows, 5] = -np.sin(angles)
+        observation[rows, 6] = -np.cos(angles)
+        observation[rows, 7] = entities[:, 6] / 100
+        observation[rows, _LAYER_COLUMN + entities[:, 7].astype(np.intp) - 1] = 1
+        return observation
+
+
+def _heading(angle: float) -> tuple[float, float]:
+    return -math.sin(math.radians(angle)), -math.cos(math.radians(angle))
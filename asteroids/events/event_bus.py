@@ -0,0 +1,61 @@
+import logging
+from collections import Counter
+from typing import Any, Callable, NamedTuple, Optional, TypeVar
+
+from asteroids.events.game_events import EventId
+
+log = logging.getLogger(__name__)
+
+Info = TypeVar('Info', bound=Optional[NamedTuple])
+
+
+class EventBus:
+    """Queues game events in process and dispatches them to handlers once per frame.
+
+    Events posted while dispatching, like the parts of an exploding asteroid,
+    are handled on the next dispatch, the same frame delay the pygame queue had.
+    """
+
+    def __init__(self):
+        self._handlers: dict[EventId, list[Callable[[Any], None]]] = {}
+        self._pending: list[tuple[EventId, Any]] = []
+        self.posted: Counter[EventId] = Counter()
+        self.dispatched: Counter[EventId] = Counter()
+
+    def subscribe(self, event_id: EventId, handler: Callable[[Info], None]):
+        self._handlers.setdefault(event_id, []).append(handler)
+
+    def unsubscribe(self, event_id: EventId, handler: Callable[[Info], None]):
+        self._handlers[event_id].remove(handler)
+
+    def post(self, event_id: EventId, info: Info = None):
+        self._pending.append((event_id, info))
+        self.posted[event_id] += 1
+
+    def dispatch(self) -> int:
+        pending, self._pending = self._pending, []
+        for event_id, info in pending:
+            for handler in self._handlers.get(event_id, ()):
+                handler(info)
+            self.dispatched[event_id] += 1
+        return len(pending)
+
+    def clear(self):
+        if self._pending:
+            log.debug("Dropping %d pending events", len(self._pending))
+        self._pending.clear()
+
+    def __len__(self):
+        return len(self._pending)
+
+
+_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    return _bus
+
+
+def set_event_bus(bus: EventBus):
+    global _bus
+    _bus = bus
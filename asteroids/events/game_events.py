@@ -19,6 +19,7 @@ class EventId(IntEnum):
 
 
 class GameEvents:
+    """pygame events for code still posting through the SDL queue, `Asteroids` forwards them to the event bus"""
 
     @staticmethod
     def _gen_event(event: EventId, info: NamedTuple = None):
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
+
+from asteroids.events.event_bus import get_event_bus
+from asteroids.events.game_events import EventId
+
+
+@dataclass(eq=False)
+class EventTimer:
+    """Posts `event_id` every `interval_ms` of game time, unlike `pygame.time.set_timer` which follows the wall clock."""
+    event_id: EventId
+    info: Optional[NamedTuple]
+    interval_ms: float
+    _elapsed: float = field(init=False, default=0)
+
+    def update(self, dt: float):
+        self._elapsed += dt
+        while self._elapsed >= self.interval_ms:
+            self._elapsed -= self.interval_ms
+            get_event_bus().post(self.event_id, self.info)
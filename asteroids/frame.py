@@ -0,0 +1,87 @@
+import logging
+import weakref
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pygame
+from pygame.surface import Surface
+
+from asteroids.static_actor import StaticActor
+
+if TYPE_CHECKING:
+    from asteroids.asteroids import Asteroids
+
+log = logging.getLogger(__name__)
+
+# ITU-R BT.601 luma weights of the blue, green and red bytes, in 256ths
+_LUMA = tuple(np.uint16(weight) for weight in (29, 150, 77))
+
+
+class FrameRenderer:
+    """Draws a game offscreen at a low resolution, for pixel observations.
+
+    The background, layers and HUD are scaled once per distinct surface and blitted
+    straight into a NumPy buffer the target surface is built on, so `render` returns
+    a view of that buffer without copying: `(height, width, 3)` RGB or `(height, width)`
+    grayscale uint8, overwritten by the next `render`.
+    """
+
+    def __init__(self, size: tuple[int, int], grayscale: bool = False):
+        width, height = size
+        self.size = size
+        self.grayscale = grayscale
+        # BGRA is the byte order convert_alpha gives the sprites, blits need no conversion
+        self._pixels = np.zeros((height, width, 4), dtype=np.uint8)
+        self.surface = pygame.image.frombuffer(self._pixels, size, 'BGRA')
+        self._rgb = self._pixels[..., 2::-1]
+        self._luma = np.zeros((height, width), dtype=np.uint16)
+        self._channel = np.zeros((height, width), dtype=np.uint16)
+        self._gray = np.zeros((height, width), dtype=np.uint8)
+        # full resolution surface -> scaled, dropped with the surface
+        self._scaled: weakref.WeakKeyDictionary[Surface, Surface] = weakref.WeakKeyDictionary()
+        self._scale = (1., 1.)
+
+    def render(self, game: 'Asteroids') -> np.ndarray:
+        screen_width, screen_height = game.screen.get_size()
+        scale = self.size[0] / screen_width, self.size[1] / screen_height
+        if scale != self._scale:
+            self._scaled.clear()
+            self._scale = scale
+        sx, sy = scale
+        self.surface.blit(self._get(game.background), (0, 0))
+        interpolate = game._alpha < 1
+        for group in game.layers.values():
+            blits = []
+            for sprite in group:
+                if interpolate and isinstance(sprite, StaticActor):
+                    image, rect = sprite.interpolated(game._alpha)
+                else:
+                    image, rect = sprite.image, sprite.rect
+                blits.append((self._get(image), (round(rect.x * sx), round(rect.y * sy))))
+            self.surface.blits(blits, doreturn=False)
+        hud, position = game.gui.hud()
+        self.surface.blit(self._get(hud), (round(position.x * sx), round(position.y * sy)))
+        if not self.grayscale:
+            return self._rgb
+        return self._to_gray()
+
+    def _to_gray(self) -> np.ndarray:
+        # integer weighted sum, twice as fast as a float matmul at these sizes
+        np.multiply(self._pixels[..., 0], _LUMA[0], out=self._luma)
+        for channel in (1, 2):
+            np.multiply(self._pixels[..., channel], _LUMA[channel], out=self._channel)
+            self._luma += self._channel
+        self._luma >>= 8
+        np.copyto(self._gray, self._luma, casting='unsafe')
+        return self._gray
+
+    def _get(self, surface: Surface) -> Surface:
+        scaled = self._scaled.get(surface)
+        if scaled is None:
+            width, height = surface.get_size()
+            sx, sy = self._scale
+            size = max(1, round(width * sx)), max(1, round(height * sy))
+            # smoothscale averages, thin sprites fade instead of dropping out
+            scaled = pygame.transform.smoothscale(surface, size)
+            self._scaled[surface] = scaled
+        return scaled
@@ -1,24 +1,218 @@
+import argparse
+import contextlib
+import logging
 import os
+import random
+import time
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 import pygame
-import logging
+
 from asteroids.asteroids import Asteroids
-from asteroids.config import Config
+from asteroids.config import Config, get_config, set_config
+from asteroids.replay import Recorder, Replay
+from asteroids.sampler import profile_session
+from asteroids.startup import get_startup_report
 
 logging.basicConfig(level=os.getenv('ASTEROID_LOG_LEVEL', 'ERROR'),
                     format='[%(asctime)s.%(msecs)03d] {%(filename)s:%(lineno)d} %(levelname)s - %(message)s',
                     datefmt='%H:%M:%S')
 
 
-def main():
-    pygame.init()
-    game = Asteroids()
+class HeadlessResult(NamedTuple):
+    frames: int
+    seconds: float
+    fps: float
+    score: int
+
+
+class ProfileOptions(NamedTuple):
+    output: str = 'asteroids-profile'
+    loop: bool = True
+    frames: Optional[int] = None
+    seconds: Optional[float] = None
+    startup: bool = False
+
+
+def main(trace: Optional[str] = None, profile: Optional[ProfileOptions] = None,
+         seed: Optional[int] = None, record: Optional[str] = None, startup_report: bool = False):
+    seed = _seed(seed, record)
+    game = _start(profile)
+    recorder = _recorder(game, record, seed)
+    with _profile_loop(profile):
+        _loop(game, frames=profile and profile.frames, seconds=profile and profile.seconds,
+              recorder=recorder, startup_report=startup_report)
+    pygame.quit()
+    if recorder:
+        recorder.close(game.gui.score)
+    if trace:
+        game.profiler.export_chrome_trace(trace)
+
+
+def _seed(seed: Optional[int], record: Optional[str]) -> Optional[int]:
+    # a recording needs a known seed to be replayed
+    if seed is None and record:
+        seed = random.getrandbits(63)
+    random.seed(seed)
+    return seed
+
+
+def _recorder(game: Asteroids, record: Optional[str], seed: Optional[int]) -> Optional[Recorder]:
+    if not record:
+        return None
+    recorder = Recorder(record, seed, game.screen.get_size())
+    recorder.attach(game)
+    return recorder
+
+
+def _start(profile: Optional[ProfileOptions]) -> Asteroids:
+    session = profile_session(f'{profile.output}-startup') if profile and profile.startup else contextlib.nullcontext()
+    with session:
+        with get_startup_report().phase('pygame.init'):
+            pygame.init()
+        return Asteroids()
+
+
+def _profile_loop(profile: Optional[ProfileOptions]):
+    if profile and profile.loop:
+        return profile_session(profile.output)
+    return contextlib.nullcontext()
+
+
+def _loop(game: Asteroids, dt: Optional[float] = None, render: bool = True,
+          frames: Optional[int] = None, seconds: Optional[float] = None,
+          recorder: Optional[Recorder] = None, startup_report: bool = False) -> int:
+    start = time.perf_counter()
+    frame = 0
     while game.is_running:
-        game.update()
-        game.render()
+        if frames is not None and frame >= frames:
+            break
+        if seconds is not None and time.perf_counter() - start >= seconds:
+            break
+        with get_startup_report().phase('first frame') if not frame else contextlib.nullcontext():
+            if recorder:
+                recorder.update(game, dt)
+            else:
+                game.update(dt)
+            if render:
+                game.render()
+        if not frame and startup_report:
+            print(get_startup_report().format())
+        frame += 1
+    return frame
+
+
+def enable_profiler():
+    set_config(get_config()._replace(profiler=True))
+
+
+def setup_headless():
+    # must run before pygame.init() to take effect
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    set_config(get_config()._replace(full_screen=False))
+
+
+def run_headless(frames: int, dt: float = 1000 / 60, seed: Optional[int] = None,
+                 render: bool = False, trace: Optional[str] = None,
+                 profile: Optional[ProfileOptions] = None, record: Optional[str] = None,
+                 startup_report: bool = False) -> HeadlessResult:
+    setup_headless()
+    seed = _seed(seed, record)
+    game = _start(profile)
+    recorder = _recorder(game, record, seed)
+    if profile and profile.frames is not None:
+        frames = min(frames, profile.frames)
+    start = time.perf_counter()
+    with _profile_loop(profile):
+        frame = _loop(game, dt, render, frames, profile and profile.seconds, recorder, startup_report)
+    seconds = time.perf_counter() - start
     pygame.quit()
+    if recorder:
+        recorder.close(game.gui.score)
+    if trace:
+        game.profiler.export_chrome_trace(trace)
+    return HeadlessResult(frames=frame, seconds=seconds,
+                          fps=frame / seconds if seconds else 0.,
+                          score=game.gui.score)
+
+
+def run_replay(path: str, trace: Optional[str] = None, profile: Optional[ProfileOptions] = None,
+               startup_report: bool = False) -> tuple[HeadlessResult, Replay]:
+    replay = Replay(path)
+    setup_headless()
+    set_config(get_config()._replace(width=replay.header.width, height=replay.header.height))
+    random.seed(replay.header.seed)
+    game = _start(profile)
+    # replays skip the timed first frame, report once the game is built
+    if startup_report:
+        print(get_startup_report().format())
+    start = time.perf_counter()
+    with _profile_loop(profile):
+        frame = replay.play(game)
+    seconds = time.perf_counter() - start
+    pygame.quit()
+    if trace:
+        game.profiler.export_chrome_trace(trace)
+    return HeadlessResult(frames=frame, seconds=seconds,
+                          fps=frame / seconds if seconds else 0.,
+                          score=game.gui.score), replay
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(prog='python -m asteroids.game')
+    parser.add_argument('--headless', action='store_true',
+                        help='run without a window using fixed time steps')
+    parser.add_argument('--frames', type=int, default=3600,
+                        help='frames to simulate in headless mode')
+    parser.add_argument('--dt', type=float, default=1000 / 60,
+                        help='milliseconds per headless frame')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--render', action='store_true',
+                        help='render every headless frame')
+    parser.add_argument('--record', metavar='PATH',
+                        help='record the seed, frame times and keys of the session')
+    parser.add_argument('--replay', metavar='PATH',
+                        help='re-simulate a recorded session as fast as possible')
+    parser.add_argument('--trace', metavar='PATH',
+                        help='profile frame phases and write a Chrome trace (open in Perfetto)')
+    parser.add_argument('--startup-report', action='store_true',
+                        help='print how long display, assets and sprites took before the first frame')
+    profiling = parser.add_argument_group('profiling', 'write <output>.pstats and <output>.collapsed')
+    profiling.add_argument('--profile', action='store_true',
+                           help='profile the game loop until it exits')
+    profiling.add_argument('--profile-frames', type=int, metavar='N',
+                           help='profile the first N frames, then exit')
+    profiling.add_argument('--profile-seconds', type=float, metavar='S',
+                           help='profile the first S seconds, then exit')
+    profiling.add_argument('--profile-startup', action='store_true',
+                           help='profile pygame.init() and Asteroids() into <output>-startup')
+    profiling.add_argument('--profile-output', default='asteroids-profile', metavar='PREFIX')
+    return parser.parse_args()
+
+
+def _profile_options(args) -> Optional[ProfileOptions]:
+    loop = args.profile or args.profile_frames is not None or args.profile_seconds is not None
+    if not loop and not args.profile_startup:
+        return None
+    return ProfileOptions(output=args.profile_output, loop=loop, frames=args.profile_frames,
+                          seconds=args.profile_seconds, startup=args.profile_startup)
 
 
 if __name__ == '__main__':
-    main()
+    args = _parse_args()
+    if args.trace:
+        enable_profiler()
+    profile = _profile_options(args)
+    if args.replay:
+        result, replay = run_replay(args.replay, args.trace, profile, args.startup_report)
+        print(f'Replayed {result.frames} frames in {result.seconds:.2f}s '
+              f'({result.fps:.0f} fps), score {result.score} (recorded {replay.recorded_score})')
+    elif args.headless:
+        result = run_headless(args.frames, args.dt, args.seed, args.render, args.trace, profile, args.record,
+                              args.startup_report)
+        print(f'Simulated {result.frames} frames in {result.seconds:.2f}s '
+              f'({result.fps:.0f} fps), score {result.score}')
+    else:
+        main(args.trace, profile, args.seed, args.record, args.startup_report)
@@ -18,6 +18,10 @@ class GUI:
     _font: pygame.font.Font = field(init=False)
     _start_pos: Vector2 = field(init=False)
     _curr_pos: Vector2 = field(init=False)
+    rebuilds: int = field(init=False, default=0)
+    _hud: pygame.Surface = field(init=False, repr=False)
+    _hud_state: tuple = field(init=False, default=None)
+    _blits: list[tuple[pygame.Surface, Vector2]] = field(init=False, default_factory=list, repr=False)
 
     HEIGHT_OFFSET = 40
     WIDTH_OFFSET = 10
@@ -35,25 +39,45 @@ class GUI:
         self._start_pos = Vector2(self.WIDTH_OFFSET, h - self.HEIGHT_OFFSET)
         self._curr_pos = Vector2(0, 0)
 
-    def render(self):
-        self._curr_pos = self._start_pos.copy()
-        self._curr_pos += Vector2(self.WIDTH_OFFSET, 0)
+    def render(self) -> list[pygame.Rect]:
+        return [self.screen.blit(*self.hud())]
+
+    def hud(self) -> tuple[pygame.Surface, Vector2]:
+        """The HUD surface and where it goes on the screen, rebuilt only when its values change"""
+        state = (self.score, self.lives, self.health, self.max_health)
+        if state != self._hud_state:
+            self._rebuild_hud()
+            self._hud_state = state
+        return self._hud, self._start_pos
+
+    def _rebuild_hud(self):
+        self.rebuilds += 1
+        self._blits = []
+        self._curr_pos = Vector2(self.WIDTH_OFFSET, 0)
         self._render_score()
         self._curr_pos += Vector2(25, 0)
         self._render_lives()
         self._curr_pos += Vector2(50, 0)
         self._render_health()
+        width = max(pos.x + surface.get_width() for surface, pos in self._blits)
+        height = max(pos.y + surface.get_height() for surface, pos in self._blits)
+        self._hud = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._hud.blits(self._blits, doreturn=False)
+        self._blits = []
+
+    def _add(self, surface: pygame.Surface, pos: Vector2):
+        self._blits.append((surface, pos.copy()))
 
     def _render_score(self):
         text = self._font.render(f'{self.score}', True, '#ffffff')
 
-        self.screen.blit(text, self._curr_pos)
+        self._add(text, self._curr_pos)
 
     def _render_lives(self):
         pos = self._curr_pos.copy()
         for _ in range(self.lives):
             pos += Vector2(35, 0)
-            self.screen.blit(self._sprite, pos)
+            self._add(self._sprite, pos)
         self._curr_pos += Vector2(150, 0)
 
     def _render_health(self):
@@ -63,7 +87,7 @@ class GUI:
         fg = pygame.surface.Surface((self.HEALTH_BAR_WIDTH * health_perc, self.HEALTH_BAR_HEIGHT))
         bg.fill('#000000')
         fg.fill('#bf0000')
-        self.screen.blit(bg, self._curr_pos)
-        self.screen.blit(fg, self._curr_pos)
+        self._add(bg, self._curr_pos)
+        self._add(fg, self._curr_pos)
         text = self._small_font.render(f'{int(health_perc * 100)}', True, '#ffffff')
-        self.screen.blit(text, self._curr_pos)
+        self._add(text, self._curr_pos)
@@ -0,0 +1,30 @@
+from typing import Iterable, Sequence
+
+import pygame
+
+# get_pressed() is sized by scancode but indexed by key constant, so probe every constant
+_KEYS = tuple(sorted({value for name, value in vars(pygame.constants).items() if name.startswith('K_')}))
+
+
+class KeyState:
+    """Pressed keys, indexed by key constant like the result of `pygame.key.get_pressed()`"""
+    __slots__ = ('pressed',)
+
+    def __init__(self, pressed: Iterable[int] = ()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+    def __eq__(self, other):
+        return isinstance(other, KeyState) and self.pressed == other.pressed
+
+    def __hash__(self):
+        return hash(self.pressed)
+
+    def __repr__(self):
+        return f'KeyState({sorted(self.pressed)})'
+
+    @staticmethod
+    def from_pygame(keys: Sequence[bool]) -> 'KeyState':
+        return KeyState(key for key in _KEYS if keys[key])
@@ -0,0 +1,87 @@
+import argparse
+import json
+import logging
+import re
+from functools import cache
+from importlib.resources import files
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+from asteroids.config import get_config
+
+log = logging.getLogger(__name__)
+
+MANIFEST = 'manifest.json'
+VERSION = 2
+
+# resources sub directory and file suffix per asset kind
+KINDS = {
+    'sprites': ('sprites', '.png'),
+    'sounds': ('sounds', '.ogg'),
+    'fonts': ('', '.ttf'),
+}
+
+
+class Manifest(NamedTuple):
+    root: Path
+    # asset kind -> name -> path relative to root
+    paths: dict[str, dict[str, str]]
+    asteroids: dict[str, dict[str, list[str]]]
+
+    def path(self, kind: str, name: str) -> Optional[Path]:
+        relative = self.paths[kind].get(name)
+        return None if relative is None else self.root / relative
+
+
+def asteroid_table(sprite_names: Iterable[str]) -> dict[str, dict[str, list[str]]]:
+    """Asteroid sprite names by colour and size"""
+    table = {}
+    for sprite in sprite_names:
+        match = re.fullmatch(r'(meteor(\w+)_(\w+)\d)', sprite)
+        if match:
+            name, color, size = match.groups()
+            size = 'medium' if size == 'med' else size
+            table.setdefault(color.lower(), {}).setdefault(size, []).append(name)
+    return table
+
+
+def build(resources: Path) -> dict:
+    paths = {}
+    for kind, (directory, suffix) in KINDS.items():
+        paths[kind] = {path.name.removesuffix(suffix): path.relative_to(resources).as_posix()
+                       for path in sorted((resources / directory).glob(f'*{suffix}'))}
+    manifest = {
+        'version': VERSION,
+        'paths': paths,
+        'asteroids': asteroid_table(paths['sprites']),
+    }
+    (resources / MANIFEST).write_text(json.dumps(manifest, indent=1))
+    log.info("Wrote %d assets to the manifest", sum(len(names) for names in paths.values()))
+    return manifest
+
+
+@cache
+def get_manifest(root: Optional[Path] = None) -> Optional[Manifest]:
+    """The manifest built in `root` or the packaged resources, None when it was not built or is turned off"""
+    if not get_config().asset_manifest:
+        return None
+    root = root if root is not None else Path(str(files('asteroids.resources')))
+    try:
+        data = json.loads((root / MANIFEST).read_text())
+    except FileNotFoundError:
+        return None
+    if data.get('version') != VERSION:
+        log.warning("Ignoring asset manifest version %s, rebuild it with python -m asteroids.manifest",
+                    data.get('version'))
+        return None
+    return Manifest(root=root, paths=data['paths'], asteroids=data['asteroids'])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='python -m asteroids.manifest',
+                                     description='index resources/ into resources/manifest.json')
+    parser.add_argument('--resources', type=Path, default=Path(__file__).parent / 'resources')
+    args = parser.parse_args()
+    written = build(args.resources)
+    print(f"Indexed {sum(len(names) for names in written['paths'].values())} assets "
+          f"into {args.resources / MANIFEST}")
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import logging
+import math
+from typing import Optional, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from asteroids.actor import Actor
+
+log = logging.getLogger(__name__)
+
+_world: Optional[PhysicsWorld] = None
+
+
+def get_world() -> Optional[PhysicsWorld]:
+    return _world
+
+
+def set_world(world: Optional[PhysicsWorld]):
+    global _world
+    _world = world
+
+
+def wrap(position: np.ndarray, extent: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Where out of bounds `(n, 2)` positions teleport to, the vectorized `Actor._teleport`"""
+    x, y = position[:, 0], position[:, 1]
+    center_x, center_y = extent[:, 0], extent[:, 1]
+    new_x = np.where(x > width, -center_x + 2,
+                     np.where(x < 0, width + center_x - 2, width - x + center_x))
+    new_y = np.where(y > height, -center_y + 2,
+                     np.where(y < 0, height + center_y - 2, height - y + center_y))
+    return np.column_stack((new_x, new_y))
+
+
+class PhysicsWorld:
+    """Structure-of-arrays state of every registered actor, stepped in one vectorized pass.
+
+    Actors `sync` their inputs (thrust, angle, velocity...) to the arrays after
+    changing them and read their position, velocity and angle back after each `step`.
+    """
+    _VECTORS = ('position', 'velocity', 'extent')
+    _SCALARS = ('angle', 'angular_velocity', 'thrust', 'ttl', 'max_velocity', 'velocity_mult')
+    _FLAGS = ('used', 'spawned', 'teleport', 'expired')
+
+    def __init__(self, capacity: int = 256):
+        self._capacity = 0
+        self._size = 0
+        self._free: list[int] = []
+        for name in self._VECTORS:
+            setattr(self, name, np.zeros((0, 2)))
+        for name in self._SCALARS:
+            setattr(self, name, np.zeros(0))
+        for name in self._FLAGS:
+            setattr(self, name, np.zeros(0, dtype=bool))
+        self._grow(capacity)
+
+    def __len__(self):
+        return self._size - len(self._free)
+
+    def add(self, actor: Actor) -> int:
+        if self._free:
+            index = self._free.pop()
+        else:
+            if self._size == self._capacity:
+                self._grow(self._capacity * 2)
+            index = self._size
+            self._size += 1
+        self.extent[index] = actor.rect.width // 2, actor.rect.height // 2
+        self.max_velocity[index] = actor.MAX_VELOCITY
+        self.velocity_mult[index] = actor.VELOCITY_MULT
+        self.used[index] = True
+        self.expired[index] = False
+        self.sync(index, actor)
+        return index
+
+    def sync(self, index: int, actor: Actor):
+        """Copies the attributes the actor may change outside of `step` to its body"""
+        self.position[index] = tuple(actor.position)
+        self.velocity[index] = tuple(actor.velocity)
+        self.angle[index] = actor.angle
+        self.angular_velocity[index] = actor.angular_velocity
+        self.thrust[index] = actor.thrust
+        self.ttl[index] = getattr(actor, 'ttl_ms', math.inf)
+        self.spawned[index] = actor.spawned
+        self.teleport[index] = actor.teleport
+
+    def remove(self, index: int):
+        self.used[index] = False
+        self.expired[index] = False
+        self._free.append(index)
+
+    def set_extent(self, index: int, width: int, height: int):
+        self.extent[index, 0] = width
+        self.extent[index, 1] = height
+
+    def read(self, index: int) -> tuple[float, float, float, float, float]:
+        return (self.position[index, 0].item(), self.position[index, 1].item(),
+                self.velocity[index, 0].item(), self.velocity[index, 1].item(),
+                self.angle[index].item())
+
+    def step(self, dt: float, size: tuple[int, int]):
+        n = self._size
+        if not n:
+            return
+        position, velocity, extent = self.position[:n], self.velocity[:n], self.extent[:n]
+        angle, thrust, ttl = self.angle[:n], self.thrust[:n], self.ttl[:n]
+        used = self.used[:n]
+
+        radians = np.radians(angle)
+        velocity[:, 0] -= np.sin(radians) * thrust
+        velocity[:, 1] -= np.cos(radians) * thrust
+        max_velocity = self.max_velocity[:n, None]
+        np.clip(velocity, -max_velocity, max_velocity, out=velocity)
+        thrust[:] = 0
+        position += velocity * (dt * self.velocity_mult[:n])[:, None]
+        angle += self.angular_velocity[:n]
+        np.mod(angle, 360, out=angle)
+        ttl -= dt
+
+        width, height = size
+        x, y = position[:, 0], position[:, 1]
+        outside = ((x + extent[:, 0] <= 0) | (x - extent[:, 0] >= width) |
+                   (y + extent[:, 1] <= 0) | (y - extent[:, 1] >= height))
+        outside &= self.spawned[:n] & used
+        teleport = self.teleport[:n]
+        self.expired[:n] = ((outside & ~teleport) | (ttl <= 0)) & used
+        wrapped = outside & teleport
+        if wrapped.any():
+            self._wrap(wrapped, width, height)
+
+    def _wrap(self, mask: np.ndarray, width: int, height: int):
+        n = self._size
+        position = self.position[:n]
+        position[mask] = wrap(position[mask], self.extent[:n][mask], width, height)
+        log.debug("Teleported %d out of bounds bodies", mask.sum())
+
+    def _grow(self, capacity: int):
+        extra = capacity - self._capacity
+        for name in self._VECTORS:
+            setattr(self, name, np.concatenate((getattr(self, name), np.zeros((extra, 2)))))
+        for name in self._SCALARS:
+            setattr(self, name, np.concatenate((getattr(self, name), np.zeros(extra))))
+        for name in self._FLAGS:
+            setattr(self, name, np.concatenate((getattr(self, name), np.zeros(extra, dtype=bool))))
+        self._capacity = capacity
@@ -1,4 +1,3 @@
-import pygame as pg
 import pygame.display
 from pygame.locals import *
 from pygame.math import Vector2
@@ -8,7 +7,8 @@ from asteroids.bullet import Bullet
 from asteroids.config import get_config
 from asteroids.display import Display
 from asteroids.events.events_info import ShotBulletInfo
-from asteroids.events.game_events import EventId, GameEvents
+from asteroids.events.event_bus import get_event_bus
+from asteroids.events.game_events import EventId
 from asteroids.layer import Layer
 from asteroids.sound import SoundManager
 from asteroids.static_actor import StaticActor
@@ -65,7 +65,8 @@ class Player(Actor):
 
         if keys[K_r]:
             self.position = Display.get_center()
-            self.velocity.x = self.velocity.y = 0
+            self.velocity = Vector2(0, 0)
+            self._sync_body()
         if keys[K_g]:
             self.explode()
         if keys[K_SPACE]:
@@ -76,19 +77,20 @@ class Player(Actor):
         self._cooldown = max(self._cooldown, 0)
 
     def shot(self):
-        pg.event.post(GameEvents.shot_bullet(ShotBulletInfo(
+        get_event_bus().post(EventId.SHOT_BULLET, ShotBulletInfo(
             position=self.position,
             angle=self.angle,
             layer=Layer.BULLETS,
             bullet_config=self._bullet_config,
-        )))
+        ))
 
     def _die_slowly(self, dt):
         self.angle += 300 * dt / 1000
+        self._sync_body()
         self.alpha = self.alpha * .96
         if self.alpha < .2:
             self.kill()
-            pygame.event.post(GameEvents.player_dead())
+            get_event_bus().post(EventId.PLAYER_DEAD)
 
     def explode(self):
         self._dead = True
@@ -96,6 +98,7 @@ class Player(Actor):
         self.velocity = Vector2(0, 0)
         self._front_thrust.kill()
         self.thrust = 0
+        self._sync_body()
 
     def on_asteroid_hit(self):
         self.health -= get_config().player_asteroid_damage
@@ -0,0 +1,78 @@
+import logging
+from typing import Callable, NamedTuple
+
+from asteroids.config import get_config
+
+log = logging.getLogger(__name__)
+
+
+class PoolStats(NamedTuple):
+    hits: int
+    misses: int
+    free: int
+    capacity: int
+
+
+class Pool:
+    """Free list of killed sprites, capacity per pool comes from `Config.pool_capacity`"""
+    _pools: dict[str, 'Pool'] = {}
+
+    def __init__(self, name: str, factory: Callable):
+        self.name = name
+        self._factory = factory
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+        Pool._pools[name] = self
+
+    @property
+    def capacity(self) -> int:
+        return get_config().pool_capacity.get(self.name, 0)
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            self.hits += 1
+            instance = self._free.pop()
+            instance._in_pool = False
+            instance.reset(*args, **kwargs)
+            return instance
+        self.misses += 1
+        return self._factory(*args, **kwargs)
+
+    def release(self, instance):
+        if getattr(instance, '_in_pool', False) or len(self._free) >= self.capacity:
+            return
+        instance._in_pool = True
+        self._free.append(instance)
+
+    def clear(self):
+        self._free.clear()
+
+    def stats(self) -> PoolStats:
+        return PoolStats(hits=self.hits, misses=self.misses,
+                         free=len(self._free), capacity=self.capacity)
+
+    @staticmethod
+    def all_stats() -> dict[str, PoolStats]:
+        return {name: pool.stats() for name, pool in Pool._pools.items()}
+
+
+class Poolable:
+    """Sprite mixin, killed instances go back to the class pool and `acquire` re-initializes them"""
+    pool: Pool
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.pool = Pool(cls.__name__.lower(), cls)
+
+    @classmethod
+    def acquire(cls, *args, **kwargs):
+        return cls.pool.acquire(*args, **kwargs)
+
+    def reset(self, *args, **kwargs):
+        # fallback for cheap constructors, pooled actors override it to keep their image and rect
+        self.__init__(*args, **kwargs)
+
+    def kill(self):
+        super().kill()
+        self.pool.release(self)
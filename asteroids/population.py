@@ -0,0 +1,20 @@
+from collections import Counter
+
+import pygame.sprite
+
+
+class PopulationGroup(pygame.sprite.Group):
+    """Group counting its sprites per `size` as they are added and killed"""
+
+    def __init__(self, *sprites):
+        self.population: Counter[str] = Counter()
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        if sprite not in self.spritedict:
+            self.population[sprite.size] += 1
+        super().add_internal(sprite, layer)
+
+    def remove_internal(self, sprite):
+        self.population[sprite.size] -= 1
+        super().remove_internal(sprite)
@@ -0,0 +1,67 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+log = logging.getLogger(__name__)
+
+_preloader: Optional['AssetPreloader'] = None
+
+
+def get_preloader() -> Optional['AssetPreloader']:
+    return _preloader
+
+
+def set_preloader(preloader: Optional['AssetPreloader']):
+    global _preloader
+    _preloader = preloader
+
+
+class AssetPreloader:
+    """Decodes assets on worker threads, loaders take them by key and only wait for ones still decoding.
+
+    Surfaces are decoded but not converted, `convert_alpha` needs the display and stays on the main thread.
+    """
+
+    def __init__(self, workers: int = 4):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='asset-preloader')
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._done = 0
+        self._total = 0
+        self.waits = 0
+
+    def submit(self, key: str, load: Callable[[], Any]):
+        with self._lock:
+            self._total += 1
+        future = self._executor.submit(load)
+        future.add_done_callback(self._on_done)
+        self._futures[key] = future
+
+    def take(self, key: str) -> Optional[Any]:
+        """The decoded asset, None if it was never submitted or already taken"""
+        future = self._futures.pop(key, None)
+        if future is None:
+            return None
+        if not future.done():
+            self.waits += 1
+            log.debug("Waiting for '%s' to finish decoding", key)
+        return future.result()
+
+    def progress(self) -> tuple[int, int]:
+        with self._lock:
+            return self._done, self._total
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._futures.clear()
+
+    def _on_done(self, future: Future):
+        with self._lock:
+            self._done += 1
+            done, total = self._done, self._total
+        if future.exception() is not None:
+            log.warning("Preloading failed: %s", future.exception())
+        log.debug("Preloaded %d/%d assets", done, total)
+        if done == total:
+            log.info("Preloaded all %d assets", total)
@@ -0,0 +1,167 @@
+import json
+import logging
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import ContextManager, Optional
+
+import pygame
+
+from asteroids.config import get_config
+from asteroids.utils import load_font
+
+log = logging.getLogger(__name__)
+
+_DISABLED = nullcontext()
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.
+    index = min(len(values) - 1, round(percent / 100 * (len(values) - 1)))
+    return values[index]
+
+
+class _Phase:
+    __slots__ = ('_profiler', '_name', '_start')
+
+    def __init__(self, profiler: 'FrameProfiler', name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc):
+        self._profiler.record(self._name, self._start, time.perf_counter_ns())
+
+
+class FrameProfiler:
+    """Times the named phases of each frame.
+
+    Keeps a rolling window of durations for percentiles and the overlay, and a
+    bounded buffer of Chrome trace events. When disabled `phase` returns a shared
+    no-op context manager.
+    """
+    PERCENTILES = (50, 95, 99)
+    OVERLAY_WIDTH = 360
+    HISTOGRAM_HEIGHT = 60
+    HISTOGRAM_BINS = 40
+    BUDGET_MS = 1000 / 60
+    OVERLAY_REFRESH_FRAMES = 10
+
+    def __init__(self, enabled: bool = False, window: int = 300, max_trace_events: int = 500_000):
+        self.enabled = enabled
+        self.overlay = False
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._frame_times: deque[float] = deque(maxlen=window)
+        self._trace: deque[dict] = deque(maxlen=max_trace_events)
+        self._origin = time.perf_counter_ns()
+        self._frame_start: Optional[int] = None
+        self._frame = 0
+        self._counts: dict[str, int] = {}
+        self._font = None
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_frame = -1
+
+    def phase(self, name: str) -> ContextManager:
+        if not self.enabled:
+            return _DISABLED
+        return _Phase(self, name)
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        if self._frame_start is not None:
+            # the previous frame was not rendered
+            self.end_frame()
+        self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self, counts: Optional[dict[str, int]] = None):
+        if not self.enabled or self._frame_start is None:
+            return
+        end = time.perf_counter_ns()
+        self._frame_times.append((end - self._frame_start) / 1e6)
+        self._trace_event('frame', self._frame_start, end, {'frame': self._frame})
+        if counts is not None:
+            self._counts = counts
+            self._trace.append({'name': 'sprites', 'ph': 'C', 'pid': 1, 'tid': 1,
+                                'ts': (end - self._origin) / 1e3, 'args': counts})
+        self._frame_start = None
+        self._frame += 1
+
+    def record(self, name: str, start_ns: int, end_ns: int):
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self._window)
+        samples.append((end_ns - start_ns) / 1e6)
+        self._trace_event(name, start_ns, end_ns)
+
+    def percentiles(self, name: Optional[str] = None) -> dict[int, float]:
+        values = sorted(self._frame_times if name is None else self._samples.get(name, ()))
+        return {percent: _percentile(values, percent) for percent in self.PERCENTILES}
+
+    def summary(self) -> dict[str, dict[int, float]]:
+        summary = {'frame': self.percentiles()}
+        summary.update({name: self.percentiles(name) for name in self._samples})
+        return summary
+
+    def histogram(self, scale_ms: float, bins: int = HISTOGRAM_BINS) -> list[int]:
+        """Frame counts of the window in `bins` equal buckets over `[0, scale_ms)`, slower frames fall in the last"""
+        counts = [0] * bins
+        for frame_time in self._frame_times:
+            counts[min(int(frame_time / scale_ms * bins), bins - 1)] += 1
+        return counts
+
+    def export_chrome_trace(self, path: str):
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': list(self._trace), 'displayTimeUnit': 'ms'}, f)
+        log.info("Wrote %d trace events to %s", len(self._trace), path)
+
+    def draw_overlay(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
+        if not self.enabled or not self.overlay:
+            return None
+        if self._overlay is None or self._frame - self._overlay_frame >= self.OVERLAY_REFRESH_FRAMES:
+            self._overlay = self._build_overlay()
+            self._overlay_frame = self._frame
+        return surface.blit(self._overlay, (10, 10))
+
+    def _build_overlay(self) -> pygame.Surface:
+        if self._font is None:
+            self._font = load_font(get_config().gui_font, 12)
+        frame = self.percentiles()
+        lines = ['frame ms  ' + '  '.join(f'p{p} {v:.2f}' for p, v in frame.items())]
+        slowest = sorted(self._samples, key=lambda name: -self.percentiles(name)[95])[:6]
+        lines += [f'{name}  p95 {self.percentiles(name)[95]:.2f}' for name in slowest]
+        lines += ['  '.join(f'{layer.lower()} {count}' for layer, count in self._counts.items())]
+
+        line_height = self._font.get_linesize()
+        overlay = pygame.Surface((self.OVERLAY_WIDTH, self.HISTOGRAM_HEIGHT + line_height * len(lines) + 10),
+                                 pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 160))
+        # headroom past p99, only the slowest frames share the last bin
+        self._draw_histogram(overlay, max(frame[99], self.BUDGET_MS) * 1.25)
+        for i, line in enumerate(lines):
+            overlay.blit(self._font.render(line, True, '#ffffff'),
+                         (5, self.HISTOGRAM_HEIGHT + 5 + i * line_height))
+        return overlay
+
+    def _draw_histogram(self, overlay: pygame.Surface, scale_ms: float):
+        counts = self.histogram(scale_ms)
+        tallest = max(max(counts), 1)
+        bin_width = self.OVERLAY_WIDTH / len(counts)
+        for i, count in enumerate(counts):
+            height = count / tallest * self.HISTOGRAM_HEIGHT
+            color = '#40c040' if i * scale_ms / len(counts) < self.BUDGET_MS else '#e04040'
+            overlay.fill(color, (i * bin_width, self.HISTOGRAM_HEIGHT - height, max(bin_width - 1, 1), height))
+        budget_x = self.OVERLAY_WIDTH * self.BUDGET_MS / scale_ms
+        overlay.fill('#ffffff', (budget_x, 0, 1, self.HISTOGRAM_HEIGHT))
+
+    def _trace_event(self, name: str, start_ns: int, end_ns: int, args: Optional[dict] = None):
+        event = {'name': name, 'ph': 'X', 'pid': 1, 'tid': 1,
+                 'ts': (start_ns - self._origin) / 1e3,
+                 'dur': (end_ns - start_ns) / 1e3}
+        if args:
+            event['args'] = args
+        self._trace.append(event)
@@ -0,0 +1,206 @@
+import logging
+import struct
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+import pygame as pg
+
+from asteroids.keys import KeyState
+
+log = logging.getLogger(__name__)
+
+MAGIC = b'ASTREPLY'
+VERSION = 2
+_HEADER = struct.Struct('<8sBqHH')
+
+# every frame starts with a tag byte, the flags say which fields changed since the last frame
+_END = 0
+_FRAME = 1
+_DT_CHANGED = 2
+_KEYS_CHANGED = 4
+_HAS_EVENTS = 8
+
+_KEYDOWN = 0
+_QUIT = 1
+_INPUT_EVENTS = frozenset((pg.KEYDOWN, pg.QUIT))
+
+
+class ReplayHeader(NamedTuple):
+    seed: int
+    width: int
+    height: int
+
+
+class ReplayFrame(NamedTuple):
+    dt: float
+    keys: KeyState
+    # keyboard and quit events of the frame
+    events: tuple[pg.event.Event, ...]
+
+
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+class Recorder:
+    """Writes the seed, per frame dt, pressed keys and keyboard events of a session.
+
+    dt is stored in microseconds and the game runs on that rounded value, so a
+    replay steps through exactly the same frames.
+    """
+
+    def __init__(self, path: str, seed: int, size: tuple[int, int]):
+        self._file = open(path, 'wb')
+        self._file.write(_HEADER.pack(MAGIC, VERSION, seed, *size))
+        self._buffer = bytearray()
+        self._dt_us = 0
+        self._keys = KeyState()
+        self._events: list[tuple[int, int]] = []
+        self.frames = 0
+
+    def attach(self, game):
+        game.event_hook = self._record_events
+
+    def update(self, game, dt: Optional[float] = None):
+        dt_us = round((game.tick() if dt is None else dt) * 1000)
+        keys = KeyState.from_pygame(pg.key.get_pressed())
+        self._events = []
+        game.update(dt_us / 1000, keys)
+        self._write_frame(dt_us, keys)
+
+    def close(self, score: int):
+        self._buffer.append(_END)
+        _write_varint(self._buffer, self.frames)
+        _write_varint(self._buffer, score)
+        self._flush()
+        self._file.close()
+        log.info("Recorded %d frames", self.frames)
+
+    def _record_events(self, events: list[pg.event.Event]) -> list[pg.event.Event]:
+        for event in events:
+            if event.type == pg.KEYDOWN:
+                self._events.append((_KEYDOWN, event.key))
+            elif event.type == pg.QUIT:
+                self._events.append((_QUIT, 0))
+        return events
+
+    def _write_frame(self, dt_us: int, keys: KeyState):
+        out = self._buffer
+        tag_index = len(out)
+        out.append(_FRAME)
+        tag = _FRAME
+        if dt_us != self._dt_us:
+            tag |= _DT_CHANGED
+            _write_varint(out, _zigzag(dt_us - self._dt_us))
+            self._dt_us = dt_us
+        if keys != self._keys:
+            tag |= _KEYS_CHANGED
+            toggled = sorted(keys.pressed ^ self._keys.pressed)
+            _write_varint(out, len(toggled))
+            for key in toggled:
+                _write_varint(out, key)
+            self._keys = keys
+        if self._events:
+            tag |= _HAS_EVENTS
+            _write_varint(out, len(self._events))
+            for kind, key in self._events:
+                _write_varint(out, kind)
+                _write_varint(out, key)
+        out[tag_index] = tag
+        self.frames += 1
+        if len(out) > 1 << 16:
+            self._flush()
+
+    def _flush(self):
+        self._file.write(self._buffer)
+        self._buffer.clear()
+
+
+class Replay:
+    """Re-simulates a recorded session, feeding the game the recorded dt, keys and keyboard events"""
+
+    def __init__(self, path: str):
+        self._data = Path(path).read_bytes()
+        magic, version, seed, width, height = _HEADER.unpack_from(self._data)
+        if magic != MAGIC:
+            raise ValueError(f"'{path}' is not a replay file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+        self.header = ReplayHeader(seed, width, height)
+        # filled from the trailer once all frames are read, None if the recording was cut short
+        self.recorded_frames: Optional[int] = None
+        self.recorded_score: Optional[int] = None
+        self._pending: tuple[pg.event.Event, ...] = ()
+
+    def frames(self) -> Iterator[ReplayFrame]:
+        data = self._data
+        offset = _HEADER.size
+        dt_us = 0
+        keys = KeyState()
+        while offset < len(data):
+            tag = data[offset]
+            offset += 1
+            if tag == _END:
+                self.recorded_frames, offset = _read_varint(data, offset)
+                self.recorded_score, offset = _read_varint(data, offset)
+                return
+            if tag & _DT_CHANGED:
+                delta, offset = _read_varint(data, offset)
+                dt_us += _unzigzag(delta)
+            if tag & _KEYS_CHANGED:
+                count, offset = _read_varint(data, offset)
+                toggled = set()
+                for _ in range(count):
+                    key, offset = _read_varint(data, offset)
+                    toggled.add(key)
+                keys = KeyState(keys.pressed ^ toggled)
+            events = ()
+            if tag & _HAS_EVENTS:
+                count, offset = _read_varint(data, offset)
+                events = []
+                for _ in range(count):
+                    kind, offset = _read_varint(data, offset)
+                    key, offset = _read_varint(data, offset)
+                    event = pg.event.Event(pg.KEYDOWN, key=key) if kind == _KEYDOWN else pg.event.Event(pg.QUIT)
+                    events.append(event)
+                events = tuple(events)
+            yield ReplayFrame(dt_us / 1000, keys, events)
+
+    def play(self, game) -> int:
+        """Runs the game through every recorded frame without rendering, returns the frames played"""
+        game.event_hook = self._inject_events
+        played = 0
+        for frame in self.frames():
+            self._pending = frame.events
+            game.update(frame.dt, frame.keys)
+            played += 1
+            if not game.is_running:
+                break
+        game.event_hook = None
+        return played
+
+    def _inject_events(self, events: list[pg.event.Event]) -> list[pg.event.Event]:
+        # game events go through the event bus, only live input has to be swapped for the recording
+        return [event for event in events if event.type not in _INPUT_EVENTS] + list(self._pending)
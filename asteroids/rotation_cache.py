@@ -0,0 +1,67 @@
+import logging
+from typing import Optional
+
+import pygame
+from pygame.surface import Surface
+
+from asteroids.config import get_config
+from asteroids.utils import load_scaled_image
+
+log = logging.getLogger(__name__)
+
+
+class RotationCache:
+    """Rotated surfaces shared by every sprite with the same asset and scale.
+
+    Angles are quantized to `Config.rotation_step` degrees, a step of 0 disables
+    the cache and rotates on every call. Tinted variants are cached next to the
+    rotation they were made from.
+    """
+    _surfaces: dict[tuple[str, float, float, Optional[tuple]], Surface] = {}
+
+    @staticmethod
+    def quantize(angle: float) -> float:
+        step = get_config().rotation_step
+        if step <= 0:
+            return angle
+        return round(angle / step) * step % 360
+
+    @staticmethod
+    def get(image_name: str, scale: float, angle: float, tint: Optional[tuple] = None) -> Surface:
+        angle = RotationCache.quantize(angle)
+        if get_config().rotation_step <= 0:
+            surface = RotationCache._rotate(image_name, scale, angle)
+            return surface if tint is None else RotationCache._tint(surface, tint)
+        key = (image_name, scale, angle, tint)
+        surface = RotationCache._surfaces.get(key)
+        if surface is None:
+            if tint is None:
+                surface = RotationCache._rotate(image_name, scale, angle)
+            else:
+                surface = RotationCache._tint(RotationCache.get(image_name, scale, angle), tint)
+            RotationCache._surfaces[key] = surface
+        return surface
+
+    @staticmethod
+    def prebake(image_name: str, scale: float = 1):
+        step = get_config().rotation_step
+        if step <= 0:
+            return
+        log.debug("Pre-baking rotations of '%s' at scale %f", image_name, scale)
+        for i in range(round(360 / step)):
+            RotationCache.get(image_name, scale, i * step)
+
+    @staticmethod
+    def clear():
+        RotationCache._surfaces.clear()
+
+    @staticmethod
+    def _rotate(image_name: str, scale: float, angle: float) -> Surface:
+        # using rotozoom to smooth edges
+        return pygame.transform.rotozoom(load_scaled_image(image_name, scale), angle, 1.0)
+
+    @staticmethod
+    def _tint(surface: Surface, tint: tuple) -> Surface:
+        tinted = surface.copy()
+        tinted.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+        return tinted
@@ -1,8 +1,8 @@
 import logging
-import time
-from enum import Enum
-from typing import NamedTuple
+from collections import Counter
+from typing import Iterable, NamedTuple
 
+import pygame.event
 import pygame.mixer
 
 from asteroids.config import get_config
@@ -12,19 +12,72 @@ from asteroids.utils import load_sound
 log = logging.getLogger(__name__)
 
 
-class _SoundInfo(NamedTuple):
-    pg_sound: pygame.mixer.Sound
-    length: float
+class _Request(NamedTuple):
+    volume: float
+    loop: bool
+
+
+class _Voice(NamedTuple):
+    sound: str
+    priority: int
 
 
 class SoundManager:
-    _sounds: dict[str, _SoundInfo] = {}
-    _playing: dict[str, float] = {}
-    _last_update = time.time()
+    """Plays sounds on a pool of mixer channels.
+
+    Loops get a reserved channel each. Other sounds requested during a frame
+    are merged per sound and played by `flush`. Each sound has a voice cap and
+    a priority: past the cap its oldest voice restarts, and with no free
+    channel the oldest voice of the lowest priority at or below it is stolen.
+    Voices are released by the channels' end events, so the bookkeeping is
+    O(1) per call and nothing is polled.
+    """
+    _sounds: dict[str, pygame.mixer.Sound] = {}
+    _reserved: dict[str, pygame.mixer.Channel] = {}
+    _channels: list[pygame.mixer.Channel] = []
+    _end_events: dict[int, int] = {}
+    _free: list[int] = []
+    _voices: dict[int, _Voice] = {}
+    # channels in start order, dicts as ordered sets
+    _by_sound: dict[str, dict[int, None]] = {}
+    _by_priority: dict[int, dict[int, None]] = {}
+    # end events still due for voices that were replaced before they ended
+    _pending_ends: Counter[int] = Counter()
+    _requests: dict[str, _Request] = {}
+    stolen = 0
+    coalesced = 0
 
     @staticmethod
     def init():
-        pygame.mixer.set_num_channels(16)
+        channels = get_config().sound_channels
+        pygame.mixer.set_num_channels(channels)
+        pygame.mixer.set_reserved(0)
+        SoundManager._reserved = {}
+        SoundManager._channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        # event types are never released, reuse the ones from an earlier init
+        event_types = list(SoundManager._end_events)
+        while len(event_types) < channels:
+            event_types.append(pygame.event.custom_type())
+        SoundManager._end_events = {}
+        for i, (channel, event_type) in enumerate(zip(SoundManager._channels, event_types)):
+            channel.set_endevent(event_type)
+            SoundManager._end_events[event_type] = i
+        SoundManager._free = list(reversed(range(channels)))
+        SoundManager._voices = {}
+        SoundManager._by_sound = {}
+        SoundManager._by_priority = {}
+        SoundManager._pending_ends = Counter()
+        SoundManager._requests = {}
+
+    @staticmethod
+    def reserve(sound: str):
+        """Dedicates the next channel to `sound`, for loops that must not be evicted"""
+        index = len(SoundManager._reserved)
+        channel = SoundManager._channels[index]
+        channel.set_endevent()
+        SoundManager._free.remove(index)
+        SoundManager._reserved[sound] = channel
+        pygame.mixer.set_reserved(len(SoundManager._reserved))
 
     @staticmethod
     def mute():
@@ -34,38 +87,113 @@ class SoundManager:
     def unmute():
         pygame.mixer.unpause()
 
+    @staticmethod
+    def load(sounds: Iterable[str]):
+        """Loads `sounds` now instead of on their first play"""
+        for sound in sounds:
+            SoundManager._check_sound(sound)
+
     @staticmethod
     def play(sound: str, loop=False, volume=100, unique=False):
         SoundManager._check_sound(sound)
-        SoundManager._update()
-        loops = 0 if not loop else 100
-        if unique and sound in SoundManager._playing:
+        if (channel := SoundManager._reserved.get(sound)) is not None:
+            if unique and channel.get_busy():
+                return
+            channel.set_volume(volume / 100 * get_config().global_volume)
+            channel.play(SoundManager._sounds[sound], -1 if loop else 0)
+            return
+        if unique and (sound in SoundManager._by_sound or sound in SoundManager._requests):
             return
-        _sound = SoundManager._sounds[sound]
-        _sound.pg_sound.set_volume(volume / 100 * get_config().global_volume)
-        _sound.pg_sound.play(loops)
-        SoundManager._playing[sound] = _sound.length
+        if (request := SoundManager._requests.get(sound)) is not None:
+            SoundManager.coalesced += 1
+            volume = min(request.volume + volume, 100)
+            loop = loop or request.loop
+        SoundManager._requests[sound] = _Request(volume, loop)
 
     @staticmethod
     def stop(sound: str, fadeout=False):
         SoundManager._check_sound(sound)
-        if fadeout:
-            SoundManager._sounds[sound].pg_sound.fadeout(500)
-        else:
-            SoundManager._sounds[sound].pg_sound.stop()
-        if sound in SoundManager._playing:
-            del SoundManager._playing[sound]
+        SoundManager._requests.pop(sound, None)
+        channels = [SoundManager._reserved[sound]] if sound in SoundManager._reserved else \
+            [SoundManager._channels[i] for i in SoundManager._by_sound.get(sound, ())]
+        for channel in channels:
+            if fadeout:
+                channel.fadeout(500)
+            else:
+                channel.stop()
+
+    @staticmethod
+    def flush():
+        """Plays the sounds requested since the last flush, call once per frame"""
+        requests, SoundManager._requests = SoundManager._requests, {}
+        for sound, request in requests.items():
+            index = SoundManager._find_channel(sound)
+            if index is None:
+                log.debug("No channel for '%s'", sound)
+                continue
+            channel = SoundManager._channels[index]
+            channel.set_volume(request.volume / 100 * get_config().global_volume)
+            channel.play(SoundManager._sounds[sound], -1 if request.loop else 0)
+            SoundManager._add_voice(index, sound)
+
+    @staticmethod
+    def handle_event(event_type: int) -> bool:
+        """Releases the voice of a finished channel, False if `event_type` is not a channel end event"""
+        index = SoundManager._end_events.get(event_type)
+        if index is None:
+            return False
+        if SoundManager._pending_ends[index]:
+            SoundManager._pending_ends[index] -= 1
+            return True
+        if index in SoundManager._voices:
+            SoundManager._remove_voice(index)
+            SoundManager._free.append(index)
+        return True
+
+    @staticmethod
+    def playing(sound: str) -> int:
+        if (channel := SoundManager._reserved.get(sound)) is not None:
+            return int(channel.get_busy())
+        return len(SoundManager._by_sound.get(sound, ()))
+
+    @staticmethod
+    def _find_channel(sound: str):
+        priority = get_config().sound_priorities.get(sound, 0)
+        limit = get_config().sound_voice_limits.get(sound, get_config().sound_voice_limit)
+        voices = SoundManager._by_sound.get(sound)
+        if voices and len(voices) >= limit:
+            return SoundManager._take_voice(next(iter(voices)))
+        if SoundManager._free:
+            return SoundManager._free.pop()
+        for lower in sorted(SoundManager._by_priority):
+            if lower > priority:
+                break
+            SoundManager.stolen += 1
+            return SoundManager._take_voice(next(iter(SoundManager._by_priority[lower])))
+        return None
+
+    @staticmethod
+    def _take_voice(index: int) -> int:
+        # the replaced voice still sends its end event
+        SoundManager._remove_voice(index)
+        SoundManager._pending_ends[index] += 1
+        return index
+
+    @staticmethod
+    def _add_voice(index: int, sound: str):
+        priority = get_config().sound_priorities.get(sound, 0)
+        SoundManager._voices[index] = _Voice(sound, priority)
+        SoundManager._by_sound.setdefault(sound, {})[index] = None
+        SoundManager._by_priority.setdefault(priority, {})[index] = None
 
     @staticmethod
-    def _update():
-        delta = time.time() - SoundManager._last_update
-        SoundManager._last_update = time.time()
-        filterd_playing = {}
-        for sound in SoundManager._playing:
-            SoundManager._playing[sound] -= delta
-            if (remaining := SoundManager._playing[sound]) > 0:
-                filterd_playing[sound] = remaining
-        SoundManager._playing = filterd_playing
+    def _remove_voice(index: int):
+        voice = SoundManager._voices.pop(index)
+        for table, key in ((SoundManager._by_sound, voice.sound), (SoundManager._by_priority, voice.priority)):
+            channels = table[key]
+            del channels[index]
+            if not channels:
+                del table[key]
 
     @staticmethod
     def _check_sound(sound: str):
@@ -74,4 +202,4 @@ class SoundManager:
                 pg_sound = load_sound(sound)
             except FileNotFoundError as e:
                 raise FileNotFoundError(f"Audio file '{sound}' not found") from e
-            SoundManager._sounds[sound] = _SoundInfo(pg_sound, pg_sound.get_length())
+            SoundManager._sounds[sound] = pg_sound
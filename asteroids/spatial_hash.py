@@ -0,0 +1,140 @@
+import logging
+from abc import abstractmethod
+from typing import Iterable, Iterator
+
+import pygame
+from pygame.sprite import Sprite
+
+log = logging.getLogger(__name__)
+
+
+class BroadPhase:
+    """Collision candidates for the sprites of a single group.
+
+    `candidates` and `hits` count the pairs tested and colliding since the last
+    `rebuild`, the `total_` counters keep adding up across frames.
+    """
+
+    def __init__(self):
+        self.candidates = 0
+        self.hits = 0
+        self.total_candidates = 0
+        self.total_hits = 0
+
+    def rebuild(self, sprites: Iterable[Sprite]):
+        self.total_candidates += self.candidates
+        self.total_hits += self.hits
+        self.candidates = self.hits = 0
+
+    @abstractmethod
+    def query(self, sprite: Sprite) -> Iterator[Sprite]:
+        pass
+
+    def collide(self, sprite: Sprite) -> Iterator[Sprite]:
+        for other in self.query(sprite):
+            if self._collides(sprite, other):
+                self.hits += 1
+                yield other
+
+    def _collides(self, sprite: Sprite, other: Sprite) -> bool:
+        return pygame.sprite.collide_circle(sprite, other)
+
+
+class BruteForce(BroadPhase):
+    def __init__(self):
+        super().__init__()
+        self._sprites: list[Sprite] = []
+
+    def rebuild(self, sprites: Iterable[Sprite]):
+        super().rebuild(sprites)
+        self._sprites = list(sprites)
+
+    def query(self, sprite: Sprite) -> Iterator[Sprite]:
+        for other in self._sprites:
+            if other is not sprite and other.alive():
+                self.candidates += 1
+                yield other
+
+
+class SpatialHash(BroadPhase):
+    """Uniform grid, sprites are bucketed by the cells covered by their `position` and `radius`.
+
+    With `wrap` the screen is a torus: the grid folds at the edges and the circle
+    test uses the shortest offset across them, so sprites on opposite edges collide.
+    """
+
+    def __init__(self, size: tuple[int, int], cell_size: int = 128, wrap: bool = False):
+        super().__init__()
+        self.cell_size = cell_size
+        self.wrap = wrap
+        self._size = size
+        self._columns = -(-size[0] // cell_size)
+        self._rows = -(-size[1] // cell_size)
+        self._cells: dict[tuple[int, int], dict[Sprite, None]] = {}
+        self._sprite_bounds: dict[Sprite, tuple[int, int, int, int]] = {}
+
+    def rebuild(self, sprites: Iterable[Sprite]):
+        super().rebuild(sprites)
+        present = set()
+        for sprite in sprites:
+            present.add(sprite)
+            bounds = self._bounds(sprite)
+            old_bounds = self._sprite_bounds.get(sprite)
+            if bounds == old_bounds:
+                continue
+            if old_bounds is not None:
+                self._remove(sprite, old_bounds)
+            self._insert(sprite, bounds)
+        for sprite in [s for s in self._sprite_bounds if s not in present]:
+            self._remove(sprite, self._sprite_bounds.pop(sprite))
+
+    def query(self, sprite: Sprite) -> Iterator[Sprite]:
+        found = {}
+        for cell in self._cells_of(self._bounds(sprite)):
+            found.update(self._cells.get(cell, ()))
+        for other in found:
+            if other is not sprite and other.alive():
+                self.candidates += 1
+                yield other
+
+    def _collides(self, sprite: Sprite, other: Sprite) -> bool:
+        if not self.wrap:
+            return super()._collides(sprite, other)
+        width, height = self._size
+        dx = abs(sprite.rect.centerx - other.rect.centerx) % width
+        dy = abs(sprite.rect.centery - other.rect.centery) % height
+        dx, dy = min(dx, width - dx), min(dy, height - dy)
+        reach = sprite.radius + other.radius
+        return dx * dx + dy * dy <= reach * reach
+
+    def _bounds(self, sprite: Sprite) -> tuple[int, int, int, int]:
+        x, y = sprite.position
+        radius = sprite.radius
+        return (int((x - radius) // self.cell_size), int((y - radius) // self.cell_size),
+                int((x + radius) // self.cell_size), int((y + radius) // self.cell_size))
+
+    def _cells_of(self, bounds: tuple[int, int, int, int]) -> Iterator[tuple[int, int]]:
+        left, top, right, bottom = bounds
+        if self.wrap:
+            columns = range(left, min(right, left + self._columns - 1) + 1)
+            rows = range(top, min(bottom, top + self._rows - 1) + 1)
+            for column in columns:
+                for row in rows:
+                    yield column % self._columns, row % self._rows
+        else:
+            for column in range(left, right + 1):
+                for row in range(top, bottom + 1):
+                    yield column, row
+
+    def _insert(self, sprite: Sprite, bounds: tuple[int, int, int, int]):
+        self._sprite_bounds[sprite] = bounds
+        for cell in self._cells_of(bounds):
+            self._cells.setdefault(cell, {})[sprite] = None
+
+    def _remove(self, sprite: Sprite, bounds: tuple[int, int, int, int]):
+        for cell in self._cells_of(bounds):
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.pop(sprite, None)
+                if not bucket:
+                    del self._cells[cell]
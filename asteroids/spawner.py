@@ -1,6 +1,7 @@
 import logging
-import re
+from typing import Iterable, Optional, Sequence
 
+import numpy as np
 import pygame
 import random
 
@@ -12,64 +13,118 @@ from asteroids.config import get_config
 from asteroids.display import Display
 from asteroids.events.events_info import SpawnAsteroidInfo, SpawnAlienInfo, SpawnPowerUpInfo
 from asteroids.layer import Layer
+from asteroids.manifest import asteroid_table, get_manifest
 from asteroids.power_up import PowerUp
-from asteroids.utils import get_sprites_path
+from asteroids.utils import get_sprite_names
 
 log = logging.getLogger(__name__)
 
 
 class Spawner:
+    ALIEN_SCALE = .7
+    BORDER_SIDES = ('top', 'left', 'right', 'bottom')
+
     def __init__(self, groups: dict[Layer, pygame.sprite.Group]):
         self.groups = groups
+        # batches draw from numpy, seeded from the random module so a seed still reproduces the whole game
+        self._rng = np.random.default_rng(random.getrandbits(64))
         self._init_asteroid_sprites()
 
     def _init_asteroid_sprites(self):
-        self.asteroids_sprites: dict[str, dict[str, list[str]]] = {}
-        for sprite in get_sprites_path().iterdir():
-            match = re.match(r'(meteor(\w+)_(\w+)\d).png', sprite.name)
-            if match:
-                name, color, size = match.groups()
-                size = 'medium' if size == 'med' else size
-                self.asteroids_sprites.setdefault(color.lower(), {}).setdefault(size, []).append(name)
+        manifest = get_manifest()
+        self.asteroids_sprites: dict[str, dict[str, list[str]]] = (
+            manifest.asteroids if manifest is not None else asteroid_table(get_sprite_names()))
+        self._colors = list(self.asteroids_sprites)
 
     def spawn_asteroid(self, info: SpawnAsteroidInfo):
-        if len([a for a in self.groups[Layer.ASTEROIDS] if a.size == 'big']) >= get_config().max_asteroids and info.size == 'big':
-            log.debug("Too many big asteroids on screen")
-            return
-        x_vel = [-get_config().asteroid_max_velocity, get_config().asteroid_max_velocity]
-        y_vel = [-get_config().asteroid_max_velocity, get_config().asteroid_max_velocity]
-        if not info.position:
-            pos, spawn_location = self._random_border_location()
-            match spawn_location:
+        self.spawn_asteroids_batch((info,))
+
+    def spawn_wave(self, count: int, size: str = 'big', color: Optional[str] = None) -> list[Asteroid]:
+        return self.spawn_asteroids_batch([SpawnAsteroidInfo(position=None, size=size, color=color)] * count)
+
+    def spawn_asteroids_batch(self, infos: Sequence[SpawnAsteroidInfo]) -> list[Asteroid]:
+        """Spawns many asteroids, drawing their positions, velocities and sprites in one go"""
+        config = get_config()
+        group = self.groups[Layer.ASTEROIDS]
+        big_room = config.max_asteroids - group.population['big']
+        accepted = []
+        for info in infos:
+            if info.size == 'big':
+                if big_room <= 0:
+                    log.debug("Too many big asteroids on screen")
+                    continue
+                big_room -= 1
+            accepted.append(info)
+        count = len(accepted)
+        if not count:
+            return []
+
+        # numpy only pays off past a single asteroid
+        draws = self._draw_batch(accepted) if count > 1 else [self._draw_one(accepted[0])]
+        asteroids = []
+        for info, (position, velocity, angular_velocity, color_pick, sprite_pick) in zip(accepted, draws):
+            color = info.color or self._colors[color_pick]
+            names = self.asteroids_sprites[color][info.size]
+            asteroids.append(Asteroid.acquire(angular_velocity=angular_velocity,
+                                              image_name=names[int(sprite_pick * len(names))],
+                                              size=info.size, color=color,
+                                              pos=position, velocity=Vector2(velocity)))
+        log.debug("Spawned %d asteroids", count)
+        group.add(*asteroids)
+        return asteroids
+
+    def _draw_batch(self, infos: Sequence[SpawnAsteroidInfo]) -> Iterable[tuple]:
+        config = get_config()
+        count = len(infos)
+        max_velocity, min_velocity = config.asteroid_max_velocity, config.asteroid_min_velocity
+        low = np.full((count, 2), -max_velocity)
+        high = np.full((count, 2), max_velocity)
+        positions = np.array([(0., 0.) if not info.position else tuple(info.position) for info in infos])
+        border = np.array([not info.position for info in infos])
+        if border.any():
+            width, height = Display.get_size()
+            offset = config.out_of_screen_offset_spawn
+            side = self._rng.integers(len(self.BORDER_SIDES), size=count)
+            along = self._rng.random(count)
+            top, left, right, bottom = (border & (side == i) for i in range(len(self.BORDER_SIDES)))
+            positions[top] = np.column_stack((along[top] * width, np.full(top.sum(), -offset)))
+            positions[left] = np.column_stack((np.full(left.sum(), -offset), along[left] * height))
+            positions[right] = np.column_stack((np.full(right.sum(), width + offset), along[right] * height))
+            positions[bottom] = np.column_stack((along[bottom] * width, np.full(bottom.sum(), height + offset)))
+            # head into the screen
+            low[top, 1] = min_velocity
+            low[left, 0] = min_velocity
+            high[right, 0] = -min_velocity
+            high[bottom, 1] = -min_velocity
+        velocities = low + self._rng.random((count, 2)) * (high - low)
+        angular_velocities = self._rng.uniform(-config.asteroid_max_angular_velocity,
+                                          config.asteroid_max_angular_velocity, count)
+        color_picks = self._rng.integers(len(self._colors), size=count)
+        sprite_picks = self._rng.random(count)
+        return zip(positions.tolist(), velocities.tolist(), angular_velocities.tolist(),
+                   color_picks.tolist(), sprite_picks.tolist())
+
+    def _draw_one(self, info: SpawnAsteroidInfo) -> tuple:
+        config = get_config()
+        max_velocity, min_velocity = config.asteroid_max_velocity, config.asteroid_min_velocity
+        low, high = [-max_velocity, -max_velocity], [max_velocity, max_velocity]
+        if info.position:
+            position = list(info.position)
+        else:
+            position, side = self._random_border_location()
+            match side:
                 case 'top':
-                    y_vel[0] = get_config().asteroid_min_velocity
+                    low[1] = min_velocity
                 case 'left':
-                    x_vel[0] = get_config().asteroid_min_velocity
+                    low[0] = min_velocity
                 case 'right':
-                    x_vel[1] = -get_config().asteroid_min_velocity
+                    high[0] = -min_velocity
                 case 'bottom':
-                    y_vel[1] = -get_config().asteroid_min_velocity
-            log.debug('Spawning asteroid from %s at pos (%d, %d) and velocity range (x=%s, y=%s)',
-                      spawn_location, x_vel, y_vel, *pos)
-        else:
-            pos = info.position
-
-        velocity = Vector2(self._random_value_in_range(*x_vel),
-                           self._random_value_in_range(*y_vel))
-
-        ang_vel = self._random_value_in_range(-get_config().asteroid_max_angular_velocity,
-                                              get_config().asteroid_max_angular_velocity)
-
-        color = info.color
-        if not info.color:
-            color = random.choice(list(self.asteroids_sprites.keys()))
-
-        asteroid = Asteroid(angular_velocity=ang_vel,
-                            image_name=random.choice(self.asteroids_sprites[color][info.size]),
-                            size=info.size, color=color,
-                            pos=pos, velocity=velocity)
-        log.debug("Spawned %s", asteroid)
-        self.groups[Layer.ASTEROIDS].add(asteroid)
+                    high[1] = -min_velocity
+        velocity = [self._random_value_in_range(*bounds) for bounds in zip(low, high)]
+        angular_velocity = self._random_value_in_range(-config.asteroid_max_angular_velocity,
+                                                       config.asteroid_max_angular_velocity)
+        return position, velocity, angular_velocity, random.randrange(len(self._colors)), random.random()
 
     def spawn_alien(self, info: SpawnAlienInfo):
         alien = self.groups[Layer.ENEMIES].sprites()
@@ -83,7 +138,7 @@ class Spawner:
             'left': Vector2(1, 0),
             'right': Vector2(-1, 0),
         }[spawn_loc]
-        alien = Alien(velocity=velocity, scale=.7, pos=pos, groups=self.groups)
+        alien = Alien(velocity=velocity, scale=self.ALIEN_SCALE, pos=pos, groups=self.groups)
         log.info(f"Spawning alien: {alien}")
         self.groups[Layer.ENEMIES].add(alien)
 
@@ -120,18 +175,19 @@ class Spawner:
 
     def _random_border_location(self, relative_area: float = 0.):
         width, height = Display.get_size()
-        spawn_location = random.choice(['top', 'left', 'right', 'bottom'])
+        spawn_location = random.choice(self.BORDER_SIDES)
         rand_height = self._random_value_in_range(height * relative_area, height * (1 - relative_area))
         rand_width = self._random_value_in_range(width * relative_area, width * (1 - relative_area))
+        offset = get_config().out_of_screen_offset_spawn
         match spawn_location:
             case 'top':
-                pos = [rand_width, -get_config().out_of_screen_offset_spawn]
+                pos = [rand_width, -offset]
             case 'left':
-                pos = [-get_config().out_of_screen_offset_spawn, rand_height]
+                pos = [-offset, rand_height]
             case 'right':
-                pos = [width + get_config().out_of_screen_offset_spawn, rand_height]
+                pos = [width + offset, rand_height]
             case 'bottom':
-                pos = [rand_width, height + get_config().out_of_screen_offset_spawn]
+                pos = [rand_width, height + offset]
             case _:
                 raise ValueError(f'Unknown spawn location: {spawn_location}')
         return pos, spawn_location
\ No newline at end of file
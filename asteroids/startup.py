@@ -0,0 +1,35 @@
+import time
+from contextlib import contextmanager
+
+
+class StartupReport:
+    """Wall time of the startup phases in the order they first ran"""
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+
+    def add(self, name: str, ms: float):
+        self.phases[name] = self.phases.get(name, 0.) + ms
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000)
+
+    def format(self) -> str:
+        total = sum(self.phases.values())
+        width = max(len(name) for name in (*self.phases, 'time to first frame'))
+        lines = [f'{name:<{width}}  {ms:8.1f} ms  {ms / total if total else 0:6.1%}'
+                 for name, ms in self.phases.items()]
+        lines.append(f"{'time to first frame':<{width}}  {total:8.1f} ms")
+        return '\n'.join(lines)
+
+
+_report = StartupReport()
+
+
+def get_startup_report() -> StartupReport:
+    return _report
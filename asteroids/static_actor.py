@@ -1,5 +1,6 @@
 import math
 from dataclasses import dataclass, field, InitVar
+from typing import Optional
 
 import pygame
 from pygame import Rect
@@ -10,7 +11,8 @@ from pygame.surface import Surface
 
 from asteroids.display import Display
 from asteroids.layer import Layer
-from asteroids.utils import load_image
+from asteroids.rotation_cache import RotationCache
+from asteroids.utils import load_scaled_image
 
 
 @dataclass(eq=False)
@@ -26,15 +28,20 @@ class StaticActor(Sprite):
     groups: dict[Layer, pygame.sprite.Group] = field(default=None, repr=False)
     _original_image: Surface = field(init=False, repr=False)
     _position: Vector2 = field(init=False)
+    _previous_position: Optional[Vector2] = field(init=False, default=None, repr=False)
 
     HITBOX_RADIUS_RATIO = 0.9
+    # farther moves in one step are teleports, they are not interpolated
+    MAX_INTERPOLATION_DISTANCE = 64
 
     def __post_init__(self, pos: Vector2):
         super().__init__()
-        self._original_image = load_image(self.image_name)
-        self._scale(self.scale)
-        self.image = self._original_image.copy()
-        self.image.set_alpha(math.floor(self.alpha * 255))
+        self._original_image = load_scaled_image(self.image_name, self.scale)
+        # shared with every sprite of this asset until rotated
+        self.image = self._original_image
+        if self.alpha < 1:
+            self.image = self.image.copy()
+            self.image.set_alpha(math.floor(self.alpha * 255))
         self.rect = self.image.get_rect()
         self.position = Vector2(pos)
         self.radius = self.image.get_width() / 2 * self.HITBOX_RADIUS_RATIO
@@ -48,12 +55,6 @@ class StaticActor(Sprite):
         self._position = Vector2(value)
         self.rect.center = self._position
 
-    def _scale(self, factor):
-        self._original_image = pygame.transform.scale(
-            self._original_image,
-            (factor * self._original_image.get_width(),
-             factor * self._original_image.get_height()))
-
     def rotate(self, angle, pivot=None):
         # using // reduce the vibrations
         if not pivot:
@@ -70,13 +71,31 @@ class StaticActor(Sprite):
         rotated_image_center = (self.position.x - rotated_offset.x,
                                 self.position.y - rotated_offset.y)
 
-        # using rotozoom to smooth edges
-        rotated_image = pygame.transform.rotozoom(self._original_image, angle, 1.0)
-        rotated_image_rect = rotated_image.get_rect(center=rotated_image_center)
-
-        self.image = rotated_image
-        self.rect = rotated_image_rect
-        self.image.set_alpha(math.floor(self.alpha * 255))
+        self.image = self._rotated_image(angle)
+        self.rect = self.image.get_rect(center=rotated_image_center)
+
+    def _rotated_image(self, angle) -> Surface:
+        # rotated surfaces are shared, only translucent sprites pay for a copy
+        image = RotationCache.get(self.image_name, self.scale, angle, self._tint())
+        if self.alpha < 1:
+            image = image.copy()
+            image.set_alpha(math.floor(self.alpha * 255))
+        return image
+
+    def _tint(self) -> Optional[tuple]:
+        return None
+
+    def snapshot(self):
+        self._previous_position = Vector2(self._position)
+
+    def interpolated(self, alpha: float) -> tuple[Surface, Rect]:
+        """Image and rect between the last snapshot (`alpha` 0) and now (`alpha` 1)"""
+        if self._previous_position is None:
+            return self.image, self.rect
+        back = (self._previous_position - self._position) * (1 - alpha)
+        if back.length_squared() > self.MAX_INTERPOLATION_DISTANCE ** 2:
+            return self.image, self.rect
+        return self.image, self.rect.move(round(back.x), round(back.y))
 
     def inbounds(self):
         return Display.get_rect().colliderect(self.rect)
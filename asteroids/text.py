@@ -1,16 +1,76 @@
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Iterable
 
+import pygame
+
+from asteroids.config import get_config
 from asteroids.display import Display
 from asteroids.utils import load_font
 
 
+class _SurfaceCache:
+    """LRU of rendered text bounded by entry count and surface bytes"""
+
+    def __init__(self):
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def get(self, key: tuple):
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._surfaces.move_to_end(key)
+        return surface
+
+    def put(self, key: tuple, surface: pygame.Surface):
+        self._surfaces[key] = surface
+        self.bytes += self._size(surface)
+        max_entries = get_config().text_cache_entries
+        max_bytes = get_config().text_cache_bytes
+        while len(self._surfaces) > 1 and (len(self._surfaces) > max_entries or self.bytes > max_bytes):
+            _, evicted = self._surfaces.popitem(last=False)
+            self.bytes -= self._size(evicted)
+
+    def clear(self):
+        self._surfaces.clear()
+        self.bytes = 0
+
+    @staticmethod
+    def _size(surface: pygame.Surface) -> int:
+        return surface.get_height() * surface.get_pitch()
+
+
 @dataclass
 class Text:
     font: str
 
-    def render(self, text, size, position):
-        font = load_font(self.font, size)
-        surface = font.render(text, True, '#ffffff')
-        Display.get_screen().blit(surface,
-                                  (position.x - surface.get_width() / 2,
-                                   position.y - surface.get_height() / 2))
+    _cache = _SurfaceCache()
+
+    def render(self, text, size, position, color='#ffffff') -> pygame.Rect:
+        surface = self.get_surface(text, size, color)
+        return Display.get_screen().blit(surface,
+                                         (position.x - surface.get_width() / 2,
+                                          position.y - surface.get_height() / 2))
+
+    def get_surface(self, text, size, color='#ffffff') -> pygame.Surface:
+        key = (self.font, size, text, color)
+        surface = Text._cache.get(key)
+        if surface is None:
+            if not Text._cache:
+                # emptied along with the fonts that rendered it
+                pygame.register_quit(Text._cache.clear)
+            surface = load_font(self.font, size).render(text, True, color)
+            Text._cache.put(key, surface)
+        return surface
+
+    def prewarm(self, texts: Iterable[tuple[str, int]], color='#ffffff'):
+        for text, size in texts:
+            self.get_surface(text, size, color)
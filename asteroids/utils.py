@@ -6,6 +6,13 @@ from pathlib import Path
 
 import pygame
 
+from asteroids.atlas import ATLAS_IMAGE, get_atlas, has_atlas
+from asteroids.config import Config, get_config
+from asteroids.manifest import KINDS, get_manifest
+from asteroids.preloader import AssetPreloader, get_preloader
+
+log = logging.getLogger(__name__)
+
 
 def _get_resource_path(resource, suffix='') -> Traversable:
     suffix = f'.{suffix}' if suffix else ''
@@ -14,26 +21,89 @@ def _get_resource_path(resource, suffix='') -> Traversable:
     return file
 
 
+def _asset_path(kind: str, name: str) -> Traversable:
+    manifest = get_manifest()
+    if manifest is not None and (path := manifest.path(kind, name)) is not None:
+        return path
+    directory, suffix = KINDS[kind]
+    return _get_resource_path(f'{name}{suffix}', directory)
+
+
 def get_sprites_path() -> Traversable:
     return _get_resource_path(resource='', suffix='sprites')
 
 
+def get_sprite_names() -> list[str]:
+    if get_config().sprite_atlas and (atlas := get_atlas()) is not None:
+        return sorted(atlas.rects)
+    if (manifest := get_manifest()) is not None:
+        return list(manifest.paths['sprites'])
+    return sorted(sprite.name.removesuffix('.png') for sprite in get_sprites_path().iterdir()
+                  if sprite.name.endswith('.png'))
+
+
+def _preloaded(key: str):
+    preloader = get_preloader()
+    return preloader.take(key) if preloader is not None else None
+
+
+def referenced_sounds(config: Config) -> set[str]:
+    sounds = {value for name, value in config._asdict().items() if name.endswith('_sound')}
+    sounds.update(bullet.sound for bullet in (*config.player_bullet, config.alien_bullet))
+    return sounds
+
+
+def preload_assets(workers: int) -> AssetPreloader:
+    """Starts decoding the sprites, or their atlas, and the sounds referenced by `Config`"""
+    preloader = AssetPreloader(workers)
+    if get_config().sprite_atlas and has_atlas():
+        path = _get_resource_path(ATLAS_IMAGE)
+        preloader.submit('atlas', lambda: pygame.image.load(path))
+    else:
+        for name in get_sprite_names():
+            path = _asset_path('sprites', name)
+            preloader.submit(f'image:{name}', lambda path=path: pygame.image.load(path))
+    for sound in referenced_sounds(get_config()):
+        path = str(_asset_path('sounds', sound))
+        preloader.submit(f'sound:{sound}', lambda path=path: pygame.mixer.Sound(path))
+    return preloader
+
+
 @cache
 def load_image(image_name: str) -> pygame.Surface:
-    file = f'{image_name}.png'
-    return pygame.image.load(_get_resource_path(file, 'sprites')).convert_alpha()
+    if get_config().sprite_atlas and (atlas := get_atlas()) is not None:
+        if (image := atlas.get(image_name)) is not None:
+            return image
+        log.debug("'%s' is not in the sprite atlas", image_name)
+    image = _preloaded(f'image:{image_name}')
+    if image is None:
+        image = pygame.image.load(_asset_path('sprites', image_name))
+    return image.convert_alpha()
+
+
+@cache
+def load_scaled_image(image_name: str, scale: float) -> pygame.Surface:
+    image = load_image(image_name)
+    if scale == 1:
+        return image
+    return pygame.transform.scale(image,
+                                  (scale * image.get_width(),
+                                   scale * image.get_height()))
 
 
 @cache
 def load_font(font_name: str, size: int) -> pygame.font.Font:
-    file = f'{font_name}.ttf'
-    return pygame.font.Font(_get_resource_path(file), size)
+    if not load_font.cache_info().currsize:
+        # fonts die with pygame.quit(), drop them before a later init gets them
+        pygame.register_quit(load_font.cache_clear)
+    return pygame.font.Font(_asset_path('fonts', font_name), size)
 
 
 @cache
 def load_sound(sound_name: str) -> pygame.mixer.Sound:
-    file = f'{sound_name}.ogg'
-    return pygame.mixer.Sound(str(_get_resource_path(file, 'sounds')))
+    if (sound := _preloaded(f'sound:{sound_name}')) is not None:
+        return sound
+    return pygame.mixer.Sound(str(_asset_path('sounds', sound_name)))
 
 
 def repeat_surface(size: tuple[int, int], image: pygame.Surface) -> pygame.Surface:
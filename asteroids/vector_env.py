@@ -0,0 +1,464 @@
+import logging
+import math
+from typing import Optional
+
+import numpy as np
+import pygame
+from pygame.constants import K_SPACE, K_a, K_d, K_w
+
+from asteroids.actor import Actor
+from asteroids.asteroid import Asteroid
+from asteroids.config import Config, get_config, set_config
+from asteroids.env import ACTIONS, FEATURES
+from asteroids.game import setup_headless
+from asteroids.layer import Layer
+from asteroids.manifest import asteroid_table, get_manifest
+from asteroids.physics import wrap
+from asteroids.player import Player
+from asteroids.spawner import Spawner
+from asteroids.static_actor import StaticActor
+from asteroids.utils import get_sprite_names, load_scaled_image
+
+log = logging.getLogger(__name__)
+
+SIZES = ('small', 'medium', 'big')
+_BIG = SIZES.index('big')
+_LAYER_COLUMN = FEATURES.index('health') + 1
+
+# what each action presses, indexed by action
+_THRUST, _LEFT, _RIGHT, _FIRE = (np.array([key in action.keys.pressed for action in ACTIONS])
+                                 for key in (K_w, K_a, K_d, K_SPACE))
+
+
+class VectorAsteroidsEnv:
+    """`num_envs` games stepped together, the state of all worlds lives in `(num_envs, ...)` arrays.
+
+    Asteroids, bullets and the player follow the rules of `Asteroids`: the Spawner's
+    sprites and velocities, `Asteroid.EXPLODE_PARTS`, `HEALTH_TABLE` and `SCORE`, the
+    player and bullet physics and the `Config` values they read. Aliens and power-ups
+    are not simulated, and collisions of a frame are resolved at once instead of one
+    sprite after the other. Observations and rewards match `AsteroidsEnv`, stacked
+    along the first axis. Finished worlds reset on the step they end, the returned
+    info holds their final counters.
+    """
+
+    def __init__(self, num_envs: int = 64, max_entities: int = 16, frame_skip: int = 4,
+                 dt: float = 1000 / 60, max_steps: Optional[int] = None, health_weight: float = .1,
+                 config: Optional[Config] = None):
+        if config is not None:
+            set_config(config)
+        setup_headless()
+        pygame.init()
+        config = get_config()
+        # the sprites only size the hitboxes, converting them still needs a display mode
+        pygame.display.set_mode((config.width, config.height))
+        self.num_envs = num_envs
+        self.max_entities = max_entities
+        self.frame_skip = frame_skip
+        self.dt = dt
+        self.max_steps = max_steps
+        self.health_weight = health_weight
+        self.observation_shape = (num_envs, 1 + max_entities, len(FEATURES))
+        self._size = np.array((config.width, config.height), dtype=np.float64)
+        self._scale = 2 / max(config.width, config.height)
+        self._bullet = config.player_bullet[0]
+        self._init_sprites(config)
+        self._rng = np.random.default_rng()
+
+        capacity = config.max_asteroids * self._max_parts()
+        bullets = math.ceil(self._bullet.duration / self._bullet.cooldown) + 1
+        k = num_envs
+        self.asteroid_position = np.zeros((k, capacity, 2))
+        self.asteroid_velocity = np.zeros((k, capacity, 2))
+        self.asteroid_extent = np.zeros((k, capacity, 2))
+        self.asteroid_radius = np.zeros((k, capacity))
+        self.asteroid_angle = np.zeros((k, capacity))
+        self.asteroid_angular_speed = np.zeros((k, capacity))
+        self.asteroid_health = np.zeros((k, capacity))
+        self.asteroid_size = np.zeros((k, capacity), dtype=np.intp)
+        self.asteroid_color = np.zeros((k, capacity), dtype=np.intp)
+        self.asteroid_ttl = np.zeros((k, capacity))
+        self.asteroid_age = np.zeros((k, capacity))
+        self.asteroid_last_teleport = np.zeros((k, capacity))
+        self.asteroid_spawned = np.zeros((k, capacity), dtype=bool)
+        self.asteroid_alive = np.zeros((k, capacity), dtype=bool)
+        self.bullet_position = np.zeros((k, bullets, 2))
+        self.bullet_velocity = np.zeros((k, bullets, 2))
+        self.bullet_angle = np.zeros((k, bullets))
+        self.bullet_ttl = np.zeros((k, bullets))
+        self.bullet_alive = np.zeros((k, bullets), dtype=bool)
+        self.player_position = np.zeros((k, 2))
+        self.player_velocity = np.zeros((k, 2))
+        self.player_angle = np.zeros(k)
+        self.player_thrust = np.zeros(k)
+        self.player_health = np.zeros(k)
+        self.player_cooldown = np.zeros(k)
+        self.player_alpha = np.zeros(k)
+        self.player_dead = np.zeros(k, dtype=bool)
+        self.lives = np.zeros(k, dtype=np.int64)
+        self.score = np.zeros(k, dtype=np.int64)
+        self.deaths = np.zeros(k, dtype=np.int64)
+        self.asteroids_destroyed = np.zeros(k, dtype=np.int64)
+        self.frames = np.zeros(k, dtype=np.int64)
+        self.steps = np.zeros(k, dtype=np.int64)
+        self.spawn_elapsed = np.zeros(k)
+        self.game_over = np.zeros(k, dtype=bool)
+
+    def _init_sprites(self, config: Config):
+        manifest = get_manifest()
+        sprites = manifest.asteroids if manifest is not None else asteroid_table(get_sprite_names())
+        self._colors = list(sprites)
+        longest = max(len(names) for sizes in sprites.values() for names in sizes.values())
+        # sprites per size and colour, and their half sizes, like Spawner picks them
+        self._sprite_counts = np.zeros((len(SIZES), len(self._colors)), dtype=np.intp)
+        self._sprite_extents = np.zeros((len(SIZES), len(self._colors), longest, 2))
+        for size_index, size in enumerate(SIZES):
+            for color_index, color in enumerate(self._colors):
+                names = sprites[color][size]
+                self._sprite_counts[size_index, color_index] = len(names)
+                for i, name in enumerate(names):
+                    self._sprite_extents[size_index, color_index, i] = load_scaled_image(name, 1).get_size()
+        self._sprite_extents /= 2
+        self._health_table = np.array([Asteroid.HEALTH_TABLE[size] for size in SIZES], dtype=np.float64)
+        self._score_table = np.array([Asteroid.SCORE[size] for size in SIZES], dtype=np.int64)
+        self._parts = {SIZES.index(size): [[SIZES.index(part) for part, amount in parts.items() for _ in range(amount)]
+                                           for parts in options]
+                       for size, options in Asteroid.EXPLODE_PARTS.items()}
+        player = load_scaled_image('player', config.player_scale)
+        self._player_extent = np.array(player.get_size()) / 2
+        self._player_radius = player.get_width() / 2 * StaticActor.HITBOX_RADIUS_RATIO
+        bullet = load_scaled_image(self._bullet.image, self._bullet.scale)
+        self._bullet_extent = np.array(bullet.get_size()) / 2
+        self._bullet_radius = bullet.get_width() / 2 * StaticActor.HITBOX_RADIUS_RATIO
+
+    def _max_parts(self) -> int:
+        # asteroids a big one can break into at once, every big one on screen may be breaking
+        def parts(size: int) -> int:
+            return max((sum(parts(part) for part in option) for option in self._parts.get(size, ())), default=1)
+        return parts(_BIG) + 1
+
+    def reset(self, seed: Optional[int] = None) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        self._rng = np.random.default_rng(seed)
+        self._reset_worlds(np.ones(self.num_envs, dtype=bool))
+        return self._observe(), self._info()
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        """Plays one action per world for `frame_skip` frames, returns stacked observations,
+        rewards, terminated, truncated and info arrays"""
+        actions = np.asarray(actions)
+        rewards = np.zeros(self.num_envs)
+        for _ in range(self.frame_skip):
+            running = ~self.game_over
+            score, health, deaths = self.score.copy(), self.player_health.copy(), self.deaths.copy()
+            self._frame(_THRUST[actions] & running, _LEFT[actions] & running,
+                        _RIGHT[actions] & running, _FIRE[actions] & running)
+            health_change = np.where(self.deaths == deaths, self.player_health - health, 0.)
+            rewards += running * (self.score - score + self.health_weight * health_change)
+            self.frames += running
+        self.steps += 1
+        terminated = self.game_over.copy()
+        truncated = ~terminated & (self.steps >= self.max_steps) if self.max_steps is not None \
+            else np.zeros(self.num_envs, dtype=bool)
+        info = self._info()
+        done = terminated | truncated
+        if done.any():
+            self._reset_worlds(done)
+        return self._observe(), rewards, terminated, truncated, info
+
+    def close(self):
+        pygame.quit()
+
+    def _info(self) -> dict[str, np.ndarray]:
+        return {'score': self.score.copy(), 'lives': self.lives.copy(), 'health': self.player_health.copy(),
+                'deaths': self.deaths.copy(), 'asteroids_destroyed': self.asteroids_destroyed.copy(),
+                'steps': self.steps.copy(), 'frames': self.frames.copy()}
+
+    def _reset_worlds(self, worlds: np.ndarray):
+        self.asteroid_alive[worlds] = False
+        self.bullet_alive[worlds] = False
+        # Asteroids._init_player takes the first life
+        self.lives[worlds] = get_config().lives - 1
+        for counter in (self.score, self.deaths, self.asteroids_destroyed, self.frames, self.steps):
+            counter[worlds] = 0
+        self.spawn_elapsed[worlds] = 0
+        self.game_over[worlds] = False
+        self._respawn(worlds)
+
+    def _respawn(self, worlds: np.ndarray):
+        self.player_position[worlds] = self._size // 2
+        self.player_velocity[worlds] = 0
+        self.player_angle[worlds] = 0
+        self.player_thrust[worlds] = 0
+        self.player_health[worlds] = 100
+        self.player_cooldown[worlds] = 0
+        self.player_alpha[worlds] = 1
+        self.player_dead[worlds] = False
+
+    def _frame(self, thrust: np.ndarray, left: np.ndarray, right: np.ndarray, fire: np.ndarray):
+        dt = self.dt
+        self._update_asteroids(dt)
+        self._update_bullets(dt)
+        self._update_player(dt, thrust, left, right, fire)
+        self._collide()
+        self._spawn_timer(dt)
+
+    def _inbounds(self, position: np.ndarray, extent: np.ndarray) -> np.ndarray:
+        # StaticActor.inbounds, the rect overlaps the screen
+        width, height = self._size
+        x, y, extent_x, extent_y = position[..., 0], position[..., 1], extent[..., 0], extent[..., 1]
+        return (x + extent_x > 0) & (x - extent_x < width) & (y + extent_y > 0) & (y - extent_y < height)
+
+    def _wrap(self, position: np.ndarray, extent: np.ndarray, mask: np.ndarray):
+        position[mask] = wrap(position[mask], np.broadcast_to(extent, position.shape)[mask], *self._size)
+
+    def _span(self) -> int:
+        # free slots are taken lowest first, so the live asteroids sit at the front
+        used = np.flatnonzero(self.asteroid_alive.any(axis=0))
+        return used[-1] + 1 if len(used) else 0
+
+    def _update_asteroids(self, dt: float):
+        n = self._span()
+        alive, spawned, ttl = self.asteroid_alive[:, :n], self.asteroid_spawned[:, :n], self.asteroid_ttl[:, :n]
+        position, extent = self.asteroid_position[:, :n], self.asteroid_extent[:, :n]
+        age, angle = self.asteroid_age[:, :n], self.asteroid_angle[:, :n]
+        age += dt
+        position += self.asteroid_velocity[:, :n] * (dt * Actor.VELOCITY_MULT)
+        angle -= self.asteroid_angular_speed[:, :n]
+        np.mod(angle, 360, out=angle)
+        inbounds = self._inbounds(position, extent)
+        teleport = alive & spawned & ~inbounds
+        if teleport.any():
+            # Asteroid._teleport, teleporting again right away means it is stuck
+            last_teleport = self.asteroid_last_teleport[:, :n]
+            stuck = teleport & (age - last_teleport < Asteroid.KILL_TELEPORT_DELTA * 1000)
+            self._wrap(position, extent, teleport)
+            last_teleport[teleport] = age[teleport]
+            alive &= ~stuck
+            inbounds = self._inbounds(position, extent)
+        entered = alive & inbounds & ~spawned
+        spawned |= entered
+        ttl[entered] = math.inf
+        alive &= spawned | inbounds | (ttl >= 0)
+        ttl -= dt
+
+    def _update_bullets(self, dt: float):
+        self.bullet_position += self.bullet_velocity * (dt * Actor.VELOCITY_MULT)
+        outside = self.bullet_alive & ~self._inbounds(self.bullet_position, self._bullet_extent)
+        if outside.any():
+            self._wrap(self.bullet_position, self._bullet_extent, outside)
+        self.bullet_ttl -= dt
+        self.bullet_alive &= self.bullet_ttl > 0
+
+    def _update_player(self, dt: float, thrust: np.ndarray, left: np.ndarray, right: np.ndarray,
+                       fire: np.ndarray):
+        radians = np.radians(self.player_angle)
+        self.player_velocity[:, 0] -= np.sin(radians) * self.player_thrust
+        self.player_velocity[:, 1] -= np.cos(radians) * self.player_thrust
+        np.clip(self.player_velocity, -Player.MAX_VELOCITY, Player.MAX_VELOCITY, out=self.player_velocity)
+        self.player_thrust[:] = 0
+        self.player_position += self.player_velocity * (dt * Actor.VELOCITY_MULT)
+        outside = ~self._inbounds(self.player_position, self._player_extent)
+        if outside.any():
+            self._wrap(self.player_position, self._player_extent, outside)
+
+        # Player._die_slowly
+        dead = self.player_dead
+        self.player_angle[dead] += 300 * dt / 1000
+        self.player_alpha[dead] *= .96
+        self._on_player_dead(dead & (self.player_alpha < .2))
+
+        alive = ~dead
+        clockwise = alive & right
+        self.player_angle[clockwise] -= Player.ANGULAR_SPEED
+        self.player_angle[clockwise & (self.player_angle <= 0)] = 359
+        counter_clockwise = alive & left
+        self.player_angle[counter_clockwise] += Player.ANGULAR_SPEED
+        self.player_angle[counter_clockwise & (self.player_angle >= 360)] = 0
+        self.player_thrust[alive & thrust] = Player.THRUST_MULT
+        self._shoot(alive & fire & (self.player_cooldown <= 0))
+        self.player_cooldown[alive] = np.maximum(self.player_cooldown[alive] - dt, 0)
+
+    def _shoot(self, worlds: np.ndarray):
+        slot = np.argmin(self.bullet_alive, axis=1)
+        worlds = np.flatnonzero(worlds & ~self.bullet_alive[np.arange(self.num_envs), slot])
+        if not len(worlds):
+            return
+        slot = slot[worlds]
+        radians = np.radians(self.player_angle[worlds])
+        self.bullet_position[worlds, slot] = self.player_position[worlds]
+        self.bullet_velocity[worlds, slot] = np.column_stack((-np.sin(radians), -np.cos(radians))) * self._bullet.velocity
+        self.bullet_angle[worlds, slot] = self.player_angle[worlds]
+        self.bullet_ttl[worlds, slot] = self._bullet.duration
+        self.bullet_alive[worlds, slot] = True
+        self.player_cooldown[worlds] = self._bullet.cooldown
+
+    def _on_player_dead(self, worlds: np.ndarray):
+        # Asteroids._on_player_dead and _init_player, a finished game stays over
+        worlds = worlds & ~self.game_over
+        self.deaths += worlds
+        self.lives -= worlds
+        over = worlds & (self.lives == -1)
+        self.game_over |= over
+        self._respawn(worlds & ~over)
+
+    def _collide(self):
+        n = self._span()
+        alive, position, radius = self.asteroid_alive[:, :n], self.asteroid_position[:, :n], self.asteroid_radius[:, :n]
+        # Asteroids.check_player_bullets_hit
+        offsets = self.bullet_position[:, :, None] - position[:, None]
+        reach = self._bullet_radius + radius[:, None]
+        hits = ((np.einsum('kbai,kbai->kba', offsets, offsets) <= reach ** 2)
+                & self.bullet_alive[:, :, None] & alive[:, None])
+        if hits.any():
+            self.bullet_alive &= ~hits.any(axis=2)
+            health = self.asteroid_health[:, :n]
+            health -= hits.sum(axis=1) * self._bullet.damage
+            destroyed = alive & (health <= 0)
+            alive &= ~destroyed
+            self.score += (self._score_table[self.asteroid_size[:, :n]] * destroyed).sum(axis=1)
+            self.asteroids_destroyed += destroyed.sum(axis=1)
+            self._explode(destroyed)
+            # the parts may land past the old span
+            n = self._span()
+            alive, position, radius = (self.asteroid_alive[:, :n], self.asteroid_position[:, :n],
+                                       self.asteroid_radius[:, :n])
+
+        # Asteroids.check_asteroid_hit_player
+        offsets = position - self.player_position[:, None]
+        reach = self._player_radius + radius
+        touching = (np.einsum('kai,kai->ka', offsets, offsets) <= reach ** 2) & alive
+        self.player_health -= touching.sum(axis=1) * get_config().player_asteroid_damage * ~self.player_dead
+
+        # Player.explode
+        exploded = ~self.player_dead & (self.player_health <= 0)
+        self.player_dead |= exploded
+        self.player_velocity[exploded] = 0
+        self.player_thrust[exploded] = 0
+
+    def _explode(self, destroyed: np.ndarray):
+        worlds, sizes, colors, positions = [], [], [], []
+        for world, slot in zip(*np.nonzero(destroyed)):
+            options = self._parts.get(self.asteroid_size[world, slot])
+            if not options:
+                continue
+            for part in options[self._rng.integers(len(options))]:
+                worlds.append(world)
+                sizes.append(part)
+                colors.append(self.asteroid_color[world, slot])
+                positions.append(self.asteroid_position[world, slot])
+        if worlds:
+            self._spawn(np.array(worlds), np.array(sizes), np.array(colors), np.array(positions))
+
+    def _spawn_timer(self, dt: float):
+        # the SPAWN_ASTEROID EventTimer, capped by Config.max_asteroids like Spawner
+        interval = get_config().asteroid_spawn_frequency_ms
+        self.spawn_elapsed += dt
+        due = self.spawn_elapsed >= interval
+        if not due.any():
+            return
+        self.spawn_elapsed[due] -= interval
+        big = ((self.asteroid_size == _BIG) & self.asteroid_alive).sum(axis=1)
+        worlds = np.flatnonzero(due & (big < get_config().max_asteroids))
+        if len(worlds):
+            self._spawn(worlds, np.full(len(worlds), _BIG), np.full(len(worlds), -1), None)
+
+    def _spawn(self, worlds: np.ndarray, sizes: np.ndarray, colors: np.ndarray, positions: Optional[np.ndarray]):
+        """Spawner.spawn_asteroids_batch, asteroids without a position come in from a random border"""
+        config = get_config()
+        rng = self._rng
+        count = len(worlds)
+        max_velocity, min_velocity = config.asteroid_max_velocity, config.asteroid_min_velocity
+        low = np.full((count, 2), -max_velocity)
+        high = np.full((count, 2), max_velocity)
+        if positions is None:
+            width, height = self._size
+            offset = config.out_of_screen_offset_spawn
+            side = rng.integers(len(Spawner.BORDER_SIDES), size=count)
+            along = rng.random(count)
+            top, left, right, bottom = (side == i for i in range(len(Spawner.BORDER_SIDES)))
+            positions = np.empty((count, 2))
+            positions[top] = np.column_stack((along[top] * width, np.full(top.sum(), -offset)))
+            positions[left] = np.column_stack((np.full(left.sum(), -offset), along[left] * height))
+            positions[right] = np.column_stack((np.full(right.sum(), width + offset), along[right] * height))
+            positions[bottom] = np.column_stack((along[bottom] * width, np.full(bottom.sum(), height + offset)))
+            low[top, 1] = min_velocity
+            low[left, 0] = min_velocity
+            high[right, 0] = -min_velocity
+            high[bottom, 1] = -min_velocity
+        velocities = low + rng.random((count, 2)) * (high - low)
+        angular_speeds = rng.uniform(-config.asteroid_max_angular_velocity, config.asteroid_max_angular_velocity, count)
+        colors = np.where(colors < 0, rng.integers(len(self._colors), size=count), colors)
+        sprites = (rng.random(count) * self._sprite_counts[sizes, colors]).astype(np.intp)
+        extents = self._sprite_extents[sizes, colors, sprites]
+
+        # the n-th asteroid of a world takes the n-th free slot of that world
+        order = np.argsort(worlds, kind='stable')
+        worlds, sizes, colors = worlds[order], sizes[order], colors[order]
+        positions, velocities, angular_speeds, extents = (
+            positions[order], velocities[order], angular_speeds[order], extents[order])
+        rank = np.arange(count) - np.searchsorted(worlds, worlds)
+        capacity = self.asteroid_alive.shape[1]
+        free = np.argsort(self.asteroid_alive, axis=1, kind='stable')
+        slots = free[worlds, np.minimum(rank, capacity - 1)]
+        fits = (rank < capacity) & ~self.asteroid_alive[worlds, slots]
+        if not fits.all():
+            log.debug("No room for %d asteroids", (~fits).sum())
+        worlds, slots = worlds[fits], slots[fits]
+        self.asteroid_position[worlds, slots] = positions[fits]
+        self.asteroid_velocity[worlds, slots] = velocities[fits]
+        self.asteroid_extent[worlds, slots] = extents[fits]
+        self.asteroid_radius[worlds, slots] = extents[fits, 0] * StaticActor.HITBOX_RADIUS_RATIO
+        self.asteroid_angle[worlds, slots] = 0
+        self.asteroid_angular_speed[worlds, slots] = angular_speeds[fits]
+        self.asteroid_health[worlds, slots] = self._health_table[sizes[fits]]
+        self.asteroid_size[worlds, slots] = sizes[fits]
+        self.asteroid_color[worlds, slots] = colors[fits]
+        # Asteroid.__init__, not spawned until it enters the screen
+        self.asteroid_ttl[worlds, slots] = 5000
+        self.asteroid_age[worlds, slots] = 0
+        self.asteroid_last_teleport[worlds, slots] = -math.inf
+        self.asteroid_spawned[worlds, slots] = False
+        self.asteroid_alive[worlds, slots] = True
+
+    def _observe(self) -> np.ndarray:
+        observation = np.zeros(self.observation_shape, dtype=np.float32)
+        center = self._size / 2
+        radians = np.radians(self.player_angle)
+        observation[:, 0, 0:2] = (self.player_position - center) * self._scale
+        observation[:, 0, 2:4] = self.player_velocity
+        observation[:, 0, 4] = self._player_radius * self._scale
+        observation[:, 0, 5] = -np.sin(radians)
+        observation[:, 0, 6] = -np.cos(radians)
+        observation[:, 0, 7] = self.player_health / 100
+        observation[:, 0, _LAYER_COLUMN + Layer.PLAYERS - 1] = 1
+
+        bullets = self.bullet_alive.shape[1]
+        positions = np.concatenate((self.asteroid_position, self.bullet_position), axis=1)
+        alive = np.concatenate((self.asteroid_alive, self.bullet_alive), axis=1)
+        # shortest offsets on the wrapping screen
+        offsets = (positions - self.player_position[:, None] + center) % self._size - center
+        distances = np.where(alive, np.einsum('kni,kni->kn', offsets, offsets), np.inf)
+        count = min(self.max_entities, distances.shape[1])
+        nearest = np.argpartition(distances, count - 1, axis=1)[:, :count]
+        nearest = np.take_along_axis(nearest, np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1), axis=1)
+        valid = np.isfinite(np.take_along_axis(distances, nearest, axis=1))
+
+        def pick(asteroid: np.ndarray, bullet: np.ndarray) -> np.ndarray:
+            bullet = np.broadcast_to(bullet, (self.num_envs, bullets) + asteroid.shape[2:])
+            values = np.concatenate((asteroid, bullet), axis=1)
+            index = nearest if values.ndim == 2 else nearest[..., None]
+            return np.take_along_axis(values, index, axis=1)
+
+        rows = observation[:, 1:1 + count]
+        angles = np.radians(pick(self.asteroid_angle, self.bullet_angle))
+        rows[..., 0:2] = np.take_along_axis(offsets, nearest[..., None], axis=1) * self._scale
+        rows[..., 2:4] = pick(self.asteroid_velocity, self.bullet_velocity)
+        rows[..., 4] = pick(self.asteroid_radius, self._bullet_radius) * self._scale
+        rows[..., 5] = -np.sin(angles)
+        rows[..., 6] = -np.cos(angles)
+        # bullets keep the Actor default health of 1
+        rows[..., 7] = pick(self.asteroid_health, 1.) / 100
+        layers = pick(np.full(self.asteroid_alive.shape, Layer.ASTEROIDS), np.array(Layer.BULLETS))
+        np.put_along_axis(rows, (_LAYER_COLUMN + layers - 1)[..., None], 1, axis=2)
+        rows[~valid] = 0
+        return observation
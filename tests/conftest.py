@@ -0,0 +1,83 @@
+import os
+import random
+
+# must be set before pygame.init()
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import numpy as np
+import pygame
+import pytest
+
+import asteroids.config
+from asteroids.config import Config, get_config
+
+
+@pytest.fixture(autouse=True)
+def config(monkeypatch):
+    monkeypatch.setattr(asteroids.config, '_config', Config(full_screen=False, width=640, height=480))
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """Replaces Config fields until the end of the test"""
+    def configure(**overrides):
+        monkeypatch.setattr(asteroids.config, '_config', get_config()._replace(**overrides))
+
+    return configure
+
+
+@pytest.fixture
+def screen() -> pygame.Surface:
+    pygame.init()
+    return pygame.display.set_mode((640, 480))
+
+
+@pytest.fixture
+def make_game(configure):
+    from asteroids.asteroids import Asteroids
+
+    def make(seed: int = 0, **overrides) -> Asteroids:
+        configure(**overrides)
+        random.seed(seed)
+        pygame.init()
+        return Asteroids()
+
+    yield make
+    pygame.quit()
+
+
+@pytest.fixture
+def make_env():
+    """Builds envs of the given type and closes every one of them after the test"""
+    envs = []
+
+    def make(env_type, **kwargs):
+        envs.append(env_type(**kwargs))
+        return envs[-1]
+
+    yield make
+    for env in envs:
+        env.close()
+
+
+@pytest.fixture
+def rollout():
+    from asteroids.env import ACTIONS
+
+    def rollout(env, seed: int, steps: int = 40) -> tuple[np.ndarray, np.ndarray]:
+        """Stacked observations and rewards of `steps` random actions drawn from `seed`, one per world"""
+        worlds = (env.num_envs,) if hasattr(env, 'num_envs') else ()
+        actions = np.random.default_rng(seed).integers(len(ACTIONS), size=(steps, *worlds))
+        observation, _ = env.reset(seed=seed)
+        observations, rewards = [observation], []
+        for action in actions:
+            observation, reward, terminated, truncated, _ = env.step(action)
+            observations.append(observation)
+            rewards.append(reward)
+            if np.all(terminated | truncated):
+                break
+        return np.stack(observations), np.array(rewards)
+
+    return rollout
@@ -0,0 +1,26 @@
+import pygame
+
+from asteroids.animation import Animation, load_clip
+
+IMAGES = ('bullet_hit1', 'bullet_hit2')
+
+
+def test_instances_share_one_clip(screen):
+    first, second = Animation(IMAGES, (10, 10), fps=30), Animation(IMAGES, (50, 50), fps=30)
+    assert first._clip is second._clip is load_clip(IMAGES, 1.)
+    assert first.image is second.image
+    assert load_clip(IMAGES, .5) is not first._clip
+
+
+def test_frames_follow_elapsed_time(screen):
+    clip = load_clip(IMAGES, .8)
+    animation = Animation(IMAGES, (10, 10), fps=10, scale=.8)
+    pygame.sprite.Group(animation)
+    animation.update(50, None)
+    assert animation.image is clip.frames[0]
+    animation.update(60, None)
+    assert animation.image is clip.frames[1]
+    assert animation.rect.center == (10, 10) and animation.alive()
+    # a long frame skips past the end
+    animation.update(500, None)
+    assert not animation.alive() and animation._frame == 1
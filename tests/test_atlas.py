@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pygame
+import pytest
+
+from asteroids.atlas import ATLAS_IMAGE, ATLAS_INDEX, Atlas, build, pack
+
+SPRITES = Path(__file__).parent.parent / 'asteroids' / 'resources' / 'sprites'
+
+
+@pytest.mark.parametrize('padding', [0, 1, 3])
+def test_pack_places_every_sprite_without_overlaps(padding):
+    sizes = {f'sprite{i}': (7 + i * 13 % 50, 5 + i * 7 % 40) for i in range(60)}
+    rects, (width, height) = pack(sizes, max_width=200, padding=padding)
+    assert {name: rect.size for name, rect in rects.items()} == sizes
+    bounds = pygame.Rect(0, 0, width, height)
+    padded = [pygame.Rect(rect.topleft, (rect.w + padding, rect.h + padding)) for rect in rects.values()]
+    placed = list(rects.values())
+    for i, rect in enumerate(placed):
+        assert bounds.contains(rect)
+        assert rect.collidelist(padded[i + 1:]) == -1
+        assert padded[i].collidelist(placed[i + 1:]) == -1
+    assert width <= 200
+
+
+def test_pack_starts_a_shelf_for_a_sprite_wider_than_the_atlas():
+    rects, size = pack({'small': (10, 10), 'wide': (300, 5)}, max_width=100, padding=0)
+    assert rects['small'].topleft == (0, 0)
+    assert rects['wide'].topleft == (0, 10)
+    assert size == (300, 15)
+
+
+def test_build_round_trips_the_sprites(tmp_path, screen):
+    rects = build(SPRITES, tmp_path)
+    assert (tmp_path / ATLAS_INDEX).is_file()
+    atlas = Atlas(pygame.image.load(tmp_path / ATLAS_IMAGE).convert_alpha(), rects)
+    for name in ('player', 'bullet'):
+        original = pygame.image.load(SPRITES / f'{name}.png').convert_alpha()
+        sprite = atlas.get(name)
+        assert sprite.get_size() == original.get_size()
+        assert pygame.image.tobytes(sprite, 'RGBA') == pygame.image.tobytes(original, 'RGBA')
+    assert atlas.get('missing') is None
@@ -0,0 +1,47 @@
+import argparse
+
+import pytest
+
+from asteroids import batch
+from asteroids.batch import Episode, episodes, run, run_episode
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    monkeypatch.setattr(batch, '_base_config', None)
+    monkeypatch.setattr(batch, '_env', None)
+    yield
+    if batch._env is not None:
+        batch._env.close()
+
+
+def test_episodes_cover_every_sweep_combination():
+    planned = episodes(2, seed=10, frames=100, policy='idle',
+                      sweep={'lives': [1, 3], 'max_asteroids': [5, 10, 20]})
+    assert [episode.index for episode in planned] == list(range(12))
+    assert {(episode.seed, tuple(episode.overrides.items())) for episode in planned} == {
+        (seed, (('lives', lives), ('max_asteroids', asteroids)))
+        for seed in (10, 11) for lives in (1, 3) for asteroids in (5, 10, 20)}
+    assert episodes(3, seed=0, frames=1, policy='random') == [
+        Episode(index, index, {}, 1, 'random') for index in range(3)]
+
+
+def test_sweep_needs_a_list():
+    assert batch._parse_sweep('lives=[1, 2]') == ('lives', [1, 2])
+    with pytest.raises(argparse.ArgumentTypeError):
+        batch._parse_sweep('lives=2')
+
+
+def test_run_episode_is_deterministic(worker):
+    episode = Episode(index=0, seed=7, overrides={'max_asteroids': 8}, frames=300)
+    first, second = run_episode(episode), run_episode(episode)
+    assert first._replace(seconds=0, sim_fps=0) == second._replace(seconds=0, sim_fps=0)
+    assert first.frames == 300 or first.game_over
+    assert first.overrides == {'max_asteroids': 8}
+
+
+def test_pool_results_match_in_process(worker):
+    episode = Episode(index=0, seed=2, overrides={}, frames=60, policy='idle')
+    pooled, = run([episode], workers=1)
+    local = run_episode(episode)
+    assert pooled._replace(seconds=0, sim_fps=0) == local._replace(seconds=0, sim_fps=0)
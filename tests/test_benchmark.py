@@ -0,0 +1,58 @@
+import argparse
+
+import pytest
+
+from asteroids import benchmark
+from asteroids.benchmark import PHASES, Scenario, _parse_override, build_game, compare, measure, run
+from asteroids.layer import Layer
+
+
+def _results(median_ms: float) -> dict:
+    return {'asteroids=10': {'update': {'median_ms': median_ms}}}
+
+
+def test_compare_flags_only_relevant_slowdowns():
+    baseline = _results(1.)
+    assert compare(_results(1.05), baseline, tolerance=.1, min_ms=.01) == []
+    assert compare(_results(1.2), baseline, tolerance=.1, min_ms=.5) == []
+    assert len(compare(_results(1.2), baseline, tolerance=.1, min_ms=.01)) == 1
+    assert compare({'asteroids=50': {'update': {'median_ms': 9.}}}, baseline, .1, .01) == []
+
+
+def test_parse_override():
+    assert _parse_override('max_asteroids=40') == ('max_asteroids', 40)
+    assert _parse_override('background_image=blue') == ('background_image', 'blue')
+    with pytest.raises(argparse.ArgumentTypeError):
+        _parse_override('not_a_field=1')
+
+
+def test_scenario_is_reproducible(screen):
+    scenario = Scenario(asteroids=12, bullets=5, alien=False, explosions=0)
+    positions = [sorted(tuple(a.position) for a in build_game(scenario, seed=3).layers[Layer.ASTEROIDS])
+                 for _ in range(2)]
+    assert len(positions[0]) == 12
+    assert positions[0] == positions[1]
+
+
+def test_run_times_every_phase(screen):
+    results = run([Scenario(asteroids=5, bullets=5)], PHASES, repeat=2, dt=16, seed=0)
+    timings = results[Scenario(asteroids=5, bullets=5).name]
+    assert set(timings) == set(PHASES)
+    assert all(timing['samples'] == 2 for timing in timings.values())
+
+
+def test_every_sample_measures_the_same_world(screen, monkeypatch):
+    scenario = Scenario(asteroids=8, bullets=8, explosions=2)
+    worlds = []
+    prepare = benchmark._prepare
+
+    def recording(*args):
+        call = prepare(*args)
+        game = call.__self__
+        worlds.append(sorted((round(a.position.x, 6), round(a.position.y, 6))
+                             for a in game.layers[Layer.ASTEROIDS]))
+        return call
+
+    monkeypatch.setattr(benchmark, '_prepare', recording)
+    measure(scenario, 'check_player_bullets_hit', repeat=3, dt=16, seed=1)
+    assert worlds[0] and worlds[0] == worlds[1] == worlds[2]
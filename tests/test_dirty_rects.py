@@ -0,0 +1,28 @@
+import random
+
+import pygame
+from pygame.math import Vector2
+
+from asteroids.events.events_info import SpawnAsteroidInfo
+
+
+def test_dirty_frames_match_a_full_redraw(make_game):
+    game = make_game(seed=2, dirty_rects=True, max_dirty_rects=10 ** 6)
+    width, height = game.screen.get_size()
+    for _ in range(20):
+        game.spawner.spawn_asteroid(SpawnAsteroidInfo(
+            position=Vector2(random.randrange(width), random.randrange(height)), size='big', color=None))
+    for _ in range(120):
+        game.update(16)
+        game.render()
+    dirty = pygame.image.tobytes(game.screen, 'RGB')
+    game._render_full()
+    assert pygame.image.tobytes(game.screen, 'RGB') == dirty
+
+
+def test_renders_return_the_drawn_rects(make_game):
+    game = make_game(dirty_rects=True)
+    game.update(16)
+    game.render()
+    assert game._overlay_rects and all(isinstance(rect, pygame.Rect) for rect in game._overlay_rects)
+    assert game._layer_rects
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from asteroids.env import FEATURES, AsteroidsEnv
+
+
+def test_observations_have_the_documented_layout(make_env):
+    env = make_env(AsteroidsEnv, max_entities=8)
+    observation, info = env.reset(seed=1)
+    assert observation.shape == env.observation_shape == (9, len(FEATURES))
+    assert observation.dtype == np.float32
+    assert observation[0, FEATURES.index('is_players')] == 1
+    assert info.items() >= {'score': 0, 'lives': env.game.lives, 'health': env.game.player.health,
+                            'steps': 0}.items()
+    rows = observation[1:]
+    present = rows[rows.any(axis=1)]
+    # one layer each, nearest first, zero rows after the last entity
+    assert (present[:, FEATURES.index('is_players') + 1:].sum(axis=1) == 1).all()
+    distances = np.hypot(present[:, 0], present[:, 1])
+    assert (np.diff(distances) >= 0).all()
+    assert not rows[len(present):].any()
+
+
+def test_same_seed_same_rollout(make_env, rollout):
+    env = make_env(AsteroidsEnv)
+    observations, rewards = rollout(env, seed=3)
+    again = rollout(env, seed=3)
+    np.testing.assert_array_equal(observations, again[0])
+    np.testing.assert_array_equal(rewards, again[1])
+    assert not np.array_equal(observations, rollout(env, seed=4)[0])
+
+
+def test_steps_truncate(make_env):
+    env = make_env(AsteroidsEnv, frame_skip=3, max_steps=5)
+    env.reset(seed=1)
+    for _ in range(4):
+        *_, truncated, info = env.step(0)
+        assert not truncated
+    *_, truncated, info = env.step(0)
+    assert truncated and info['steps'] == 5
+
+
+
+def test_info_counts_skipped_frames(make_env):
+    env = make_env(AsteroidsEnv, frame_skip=3)
+    _, info = env.reset(seed=1)
+    assert info['frames'] == 0
+    for _ in range(5):
+        *_, info = env.step(0)
+    assert info['steps'] == 5 and info['frames'] == 15
+
+
+@pytest.mark.parametrize('grayscale, shape', [(False, (48, 64, 3)), (True, (48, 64))])
+def test_pixel_observations(make_env, grayscale, shape):
+    env = make_env(AsteroidsEnv, frame_size=(64, 48), grayscale=grayscale)
+    observation, _ = env.reset(seed=1)
+    assert observation.shape == env.observation_shape == shape
+    assert observation.dtype == np.uint8
+    observation, *_ = env.step(0)
+    assert observation.shape == shape and observation.any()
@@ -0,0 +1,62 @@
+from asteroids.events.event_bus import EventBus, set_event_bus
+from asteroids.events.game_events import EventId
+from asteroids.events.timer import EventTimer
+
+
+def test_dispatches_to_every_subscriber_in_order():
+    bus = EventBus()
+    received = []
+    bus.subscribe(EventId.SPAWN_ASTEROID, lambda info: received.append(('first', info)))
+    bus.subscribe(EventId.SPAWN_ASTEROID, lambda info: received.append(('second', info)))
+    bus.subscribe(EventId.PLAYER_DEAD, lambda info: received.append(('dead', info)))
+    bus.post(EventId.SPAWN_ASTEROID, 1)
+    bus.post(EventId.PLAYER_DEAD)
+    bus.post(EventId.SPAWN_ASTEROID, 2)
+    assert bus.dispatch() == 3
+    assert received == [('first', 1), ('second', 1), ('dead', None), ('first', 2), ('second', 2)]
+    assert bus.posted[EventId.SPAWN_ASTEROID] == bus.dispatched[EventId.SPAWN_ASTEROID] == 2
+
+
+def test_events_posted_while_dispatching_wait_for_the_next_dispatch():
+    bus = EventBus()
+    received = []
+
+    def explode(info):
+        received.append(info)
+        if info == 'big':
+            bus.post(EventId.SPAWN_ASTEROID, 'small')
+
+    bus.subscribe(EventId.SPAWN_ASTEROID, explode)
+    bus.post(EventId.SPAWN_ASTEROID, 'big')
+    bus.dispatch()
+    assert received == ['big'] and len(bus) == 1
+    bus.dispatch()
+    assert received == ['big', 'small'] and len(bus) == 0
+
+
+def test_unsubscribe_and_clear():
+    bus = EventBus()
+    received = []
+    handler = received.append
+    bus.subscribe(EventId.SPAWN_ALIEN, handler)
+    bus.unsubscribe(EventId.SPAWN_ALIEN, handler)
+    bus.post(EventId.SPAWN_ALIEN, 1)
+    bus.dispatch()
+    bus.subscribe(EventId.SPAWN_ALIEN, handler)
+    bus.post(EventId.SPAWN_ALIEN, 2)
+    bus.clear()
+    assert bus.dispatch() == 0
+    assert received == []
+    # unhandled events still count as dispatched
+    assert bus.dispatched[EventId.SPAWN_ALIEN] == 1
+
+
+def test_timer_posts_on_game_time():
+    bus = EventBus()
+    set_event_bus(bus)
+    timer = EventTimer(EventId.SPAWN_ASTEROID, None, 100)
+    for _ in range(5):
+        timer.update(30)
+    assert bus.posted[EventId.SPAWN_ASTEROID] == 1
+    timer.update(250)
+    assert bus.posted[EventId.SPAWN_ASTEROID] == 4
@@ -0,0 +1,46 @@
+import numpy as np
+import pygame
+import pytest
+
+from asteroids.frame import FrameRenderer
+
+
+@pytest.fixture
+def game(make_game):
+    game = make_game(seed=3)
+    for _ in range(30):
+        game.update(16)
+    return game
+
+
+def _downscaled(game, size):
+    game._render_full()
+    frame = pygame.transform.smoothscale(game.screen, size)
+    return np.transpose(pygame.surfarray.array3d(frame), (1, 0, 2)).astype(np.int16)
+
+
+@pytest.mark.parametrize('grayscale, shape', [(False, (60, 80, 3)), (True, (60, 80))])
+def test_frames_are_views_of_the_render_buffer(game, grayscale, shape):
+    frames = FrameRenderer((80, 60), grayscale)
+    frame = frames.render(game)
+    assert frame.shape == shape and frame.dtype == np.uint8
+    assert np.shares_memory(frame, frames._gray if grayscale else frames._pixels)
+    for _ in range(5):
+        game.update(16)
+    # the next render overwrites the same buffer
+    assert np.shares_memory(frames.render(game), frame)
+
+
+def test_rgb_frame_looks_like_the_downscaled_screen(game):
+    size = (160, 120)
+    frame = FrameRenderer(size).render(game).astype(np.int16)
+    expected = _downscaled(game, size)
+    # a flipped frame is off by about 2.5
+    assert np.abs(frame - expected).mean() < 1
+
+
+def test_grayscale_weights_the_rgb_frame(game):
+    rgb = FrameRenderer((80, 60)).render(game).astype(np.float64)
+    gray = FrameRenderer((80, 60), grayscale=True).render(game).astype(np.float64)
+    expected = rgb @ (.299, .587, .114)
+    assert np.abs(gray - expected).max() <= 2
@@ -0,0 +1,33 @@
+from asteroids.gui import GUI
+
+
+def test_hud_is_rebuilt_only_when_values_change(screen):
+    gui = GUI(screen, max_health=100)
+    gui.render()
+    hud = gui._hud
+    gui.render()
+    assert gui.rebuilds == 1 and gui._hud is hud
+
+    gui.score += 3
+    gui.render()
+    assert gui.rebuilds == 2 and gui._hud is not hud
+    gui.health, gui.lives = 40, 2
+    gui.render()
+    gui.render()
+    assert gui.rebuilds == 3
+
+
+def test_render_returns_the_blitted_rect(screen):
+    gui = GUI(screen, max_health=100, score=12, lives=3, health=80)
+    [rect] = gui.render()
+    assert rect.topleft == (GUI.WIDTH_OFFSET, screen.get_height() - GUI.HEIGHT_OFFSET)
+    assert rect.size == gui._hud.get_size()
+
+
+def test_hud_returns_the_cached_surface_render_blits(screen):
+    gui = GUI(screen, max_health=100, score=12, lives=3, health=80)
+    [rect] = gui.render()
+    hud, position = gui.hud()
+    assert gui.rebuilds == 1 and hud is gui._hud
+    assert rect.topleft == (position.x, position.y)
+    assert rect.size == hud.get_size()
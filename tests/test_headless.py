@@ -0,0 +1,26 @@
+from asteroids.game import run_headless
+from asteroids.layer import Layer
+
+DT = 1000 / 60
+
+
+def _state(game) -> tuple:
+    return (game.gui.score, game.lives, game.player.health, tuple(game.player.position),
+            sorted((round(a.position.x, 6), round(a.position.y, 6)) for a in game.layers[Layer.ASTEROIDS]))
+
+
+def test_seeded_fixed_step_runs_are_identical(make_game):
+    states = []
+    for _ in range(2):
+        game = make_game(seed=7)
+        for _ in range(600):
+            game.update(DT)
+        states.append(_state(game))
+    assert states[0] == states[1]
+    assert states[0][4], 'asteroids should have spawned'
+
+
+def test_run_headless_counts_frames():
+    result = run_headless(120, seed=1)
+    assert result.frames == 120
+    assert result.fps > 0
@@ -0,0 +1,41 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from asteroids.manifest import MANIFEST, VERSION, asteroid_table, build, get_manifest
+from asteroids.utils import get_sprite_names
+
+RESOURCES = Path(__file__).parent.parent / 'asteroids' / 'resources'
+
+
+@pytest.fixture
+def resources(tmp_path):
+    get_manifest.cache_clear()
+    yield shutil.copytree(RESOURCES, tmp_path / 'resources', ignore=shutil.ignore_patterns(MANIFEST))
+    get_manifest.cache_clear()
+
+
+def test_asteroid_table_groups_sprites_by_color_and_size():
+    table = asteroid_table(['meteorBrown_big1', 'meteorBrown_big2', 'meteorGrey_med1',
+                            'meteorGrey_tiny2', 'player', 'meteorBrown'])
+    assert table == {'brown': {'big': ['meteorBrown_big1', 'meteorBrown_big2']},
+                     'grey': {'medium': ['meteorGrey_med1'], 'tiny': ['meteorGrey_tiny2']}}
+
+
+def test_built_manifest_matches_the_sprite_directory(resources):
+    build(resources)
+    manifest = get_manifest(resources)
+    assert manifest is not None
+    assert set(manifest.paths['sprites']) == set(get_sprite_names())
+    assert manifest.path('sprites', 'player') == resources / 'sprites' / 'player.png'
+    assert manifest.path('sprites', 'missing') is None
+    assert manifest.asteroids == asteroid_table(manifest.paths['sprites'])
+
+
+def test_missing_or_outdated_manifest_is_ignored(resources):
+    assert get_manifest(resources) is None
+    (resources / MANIFEST).write_text(json.dumps({'version': VERSION - 1, 'paths': {}, 'asteroids': {}}))
+    get_manifest.cache_clear()
+    assert get_manifest(resources) is None
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from pygame.math import Vector2
+
+from asteroids.actor import Actor
+from asteroids.physics import PhysicsWorld, set_world
+
+SIZE = (640, 480)
+DT = 16
+
+
+@pytest.fixture
+def world(screen):
+    world = PhysicsWorld(capacity=4)
+    set_world(world)
+    yield world
+    set_world(None)
+
+
+def _actor(**kwargs) -> Actor:
+    return Actor(image_name='player', scale=.5, **kwargs)
+
+
+def test_out_of_bounds_bodies_teleport_like_actors(world):
+    positions = [(700, 100), (-40, 300), (320, 530), (200, -40)]
+    set_world(None)
+    legacy = [_actor(pos=Vector2(position)) for position in positions]
+    set_world(world)
+    bodied = [_actor(pos=Vector2(position)) for position in positions]
+    world.step(0, SIZE)
+    for actor in legacy:
+        actor._teleport()
+    for actor, expected in zip(bodied, legacy):
+        actor.update(0, None)
+        assert tuple(actor.position) == pytest.approx(tuple(expected.position))
+
+
+def test_step_matches_the_per_sprite_update(world):
+    set_world(None)
+    legacy = _actor(pos=Vector2(560, 240), velocity=Vector2(.2, -.1), angle=80)
+    set_world(world)
+    bodied = _actor(pos=Vector2(560, 240), velocity=Vector2(.2, -.1), angle=80)
+    assert bodied._body is not None and legacy._body is None
+    for frame in range(240):
+        for actor in (legacy, bodied):
+            if frame % 3:
+                actor.accelerate()
+            actor.rotate_ccw()
+        world.step(DT, SIZE)
+        legacy.update(DT, None)
+        bodied.update(DT, None)
+        assert bodied.position.distance_to(legacy.position) < 1e-6, frame
+        assert bodied.angle == pytest.approx(legacy.angle)
+
+
+def test_expired_bodies_are_killed_and_freed(world):
+    actor = _actor(pos=Vector2(100, 100))
+    actor.teleport = False
+    actor.ttl_ms = 2 * DT
+    actor._sync_body()
+    assert len(world) == 1
+    for _ in range(2):
+        world.step(DT, SIZE)
+        actor.update(DT, None)
+    assert actor._body is None
+    assert len(world) == 0
+
+
+def test_inputs_reach_the_body_when_synced(world):
+    actor = _actor(pos=Vector2(100, 100))
+    actor.velocity = Vector2(.5, .25)
+    actor.teleport = False
+    actor.rotate_ccw()
+    assert world.angle[actor._body] == actor.angle
+    np.testing.assert_allclose(world.velocity[actor._body], (.5, .25))
+    assert not world.teleport[actor._body]
+    actor.accelerate()
+    assert world.thrust[actor._body] == Actor.THRUST_MULT
+    assert type(actor) is Actor
@@ -0,0 +1,82 @@
+import pytest
+from pygame.math import Vector2
+
+from asteroids.asteroid import Asteroid
+from asteroids.bullet import Bullet
+from asteroids.config import get_config, set_config
+from asteroids.physics import PhysicsWorld, set_world
+from asteroids.pool import Pool
+
+# identity of the sprite itself, not its state
+_IGNORED = {'_Sprite__g', '_in_pool'}
+
+
+@pytest.fixture(autouse=True)
+def pools(screen):
+    for pool in Pool._pools.values():
+        pool.clear()
+        pool.hits = pool.misses = 0
+    yield
+    for pool in Pool._pools.values():
+        pool.clear()
+
+
+def _bullet_kwargs(**overrides) -> dict:
+    kwargs = dict(image_name='bullet', pos=Vector2(50, 60), velocity=Vector2(.3, -.4), angle=25,
+                  scale=.8, ttl=500, damage=1, groups=None, hit_animation_images=('bullet_hit1',))
+    return kwargs | overrides
+
+
+def _asteroid_kwargs(**overrides) -> dict:
+    kwargs = dict(angular_velocity=1.5, image_name='meteorBrown_big1', size='big', color='Brown',
+                  pos=Vector2(200, 100), velocity=Vector2(-.2, .1))
+    return kwargs | overrides
+
+
+def _state(sprite) -> dict:
+    return {name: value for name, value in vars(sprite).items() if name not in _IGNORED}
+
+
+def test_released_instances_are_reused_up_to_capacity():
+    set_config(get_config()._replace(pool_capacity={'bullet': 1}))
+    first, second = Bullet.acquire(**_bullet_kwargs()), Bullet.acquire(**_bullet_kwargs())
+    first.kill()
+    first.kill()
+    second.kill()
+    assert Bullet.pool.stats().free == 1
+    assert Bullet.acquire(**_bullet_kwargs()) is first
+    assert (Bullet.pool.hits, Bullet.pool.misses) == (1, 2)
+
+
+@pytest.mark.parametrize('cls, make_kwargs, reuse_kwargs', [
+    (Bullet, _bullet_kwargs(), _bullet_kwargs(image_name='laserBlue02', scale=1, angle=300, damage=2)),
+    (Asteroid, _asteroid_kwargs(), _asteroid_kwargs(image_name='meteorGrey_small1', size='small', color='Grey')),
+    (Asteroid, _asteroid_kwargs(), _asteroid_kwargs(pos=Vector2(10, 10))),
+])
+def test_reset_matches_a_fresh_instance(cls, make_kwargs, reuse_kwargs, monkeypatch):
+    used = cls.acquire(**make_kwargs)
+    used.update(16, None)
+    used.hit()
+    used.kill()
+    monkeypatch.setattr(cls, '__init__', lambda *args, **kwargs: pytest.fail('reset ran __init__'))
+    reused = cls.acquire(**reuse_kwargs)
+    monkeypatch.undo()
+    assert reused is used
+    fresh = cls(**reuse_kwargs)
+    # init=False fields of a fresh instance still read their class default
+    for name in _state(fresh).keys() | _state(reused).keys():
+        assert getattr(reused, name) == getattr(fresh, name), name
+
+
+def test_reset_reattaches_the_physics_body():
+    world = PhysicsWorld()
+    set_world(world)
+    try:
+        asteroid = Asteroid.acquire(**_asteroid_kwargs())
+        asteroid.kill()
+        assert len(world) == 0
+        assert Asteroid.acquire(**_asteroid_kwargs()) is asteroid
+        assert asteroid._body is not None and len(world) == 1
+        assert tuple(world.velocity[asteroid._body]) == tuple(asteroid.velocity)
+    finally:
+        set_world(None)
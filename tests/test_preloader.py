@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from asteroids.preloader import AssetPreloader, get_preloader
+
+
+@pytest.fixture
+def preloader():
+    preloader = AssetPreloader(workers=2)
+    yield preloader
+    preloader.shutdown()
+
+
+def test_take_returns_each_asset_once(preloader):
+    preloader.submit('a', lambda: 'first')
+    preloader.submit('b', lambda: 'second')
+    assert preloader.take('b') == 'second'
+    assert preloader.take('a') == 'first'
+    assert preloader.take('a') is None
+    assert preloader.take('never') is None
+
+
+def test_take_waits_for_assets_still_decoding(preloader):
+    release = threading.Event()
+    preloader.submit('slow', lambda: release.wait() and 'decoded')
+    assert preloader.progress() == (0, 1)
+    threading.Timer(.05, release.set).start()
+    assert preloader.take('slow') == 'decoded'
+    assert preloader.waits == 1
+
+
+def test_failed_loads_raise_on_take(preloader):
+    def fail():
+        raise FileNotFoundError('missing.png')
+
+    preloader.submit('broken', fail)
+    with pytest.raises(FileNotFoundError):
+        preloader.take('broken')
+
+
+def test_game_stops_its_preloader_after_startup(make_game, monkeypatch):
+    stopped = []
+    shutdown = AssetPreloader.shutdown
+    monkeypatch.setattr(AssetPreloader, 'shutdown', lambda self: stopped.append(self) or shutdown(self))
+    make_game(preload_assets=True)
+    assert len(stopped) == 1
+    assert get_preloader() is None
@@ -0,0 +1,60 @@
+import json
+
+from asteroids.profiler import FrameProfiler
+
+
+def _profiler(frame_times: list[float]) -> FrameProfiler:
+    profiler = FrameProfiler(enabled=True, window=len(frame_times))
+    profiler._frame_times.extend(frame_times)
+    return profiler
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = FrameProfiler()
+    assert profiler.phase('update') is profiler.phase('render')
+    with profiler.phase('update'):
+        pass
+    profiler.begin_frame()
+    profiler.end_frame()
+    assert profiler.summary() == {'frame': {50: 0., 95: 0., 99: 0.}}
+
+
+def test_histogram_bins_frame_times():
+    profiler = _profiler([1., 2., 9., 11., 19., 40.])
+    assert profiler.histogram(20., bins=2) == [3, 3]
+    # slower than the scale lands in the last bin
+    assert profiler.histogram(20., bins=4) == [2, 1, 1, 2]
+    assert sum(profiler.histogram(5.)) == 6
+
+
+def test_percentiles_over_the_window():
+    profiler = _profiler([float(ms) for ms in range(101)])
+    assert profiler.percentiles() == {50: 50., 95: 95., 99: 99.}
+
+
+def test_phases_and_frames_go_to_the_chrome_trace(tmp_path):
+    profiler = FrameProfiler(enabled=True)
+    profiler.begin_frame()
+    with profiler.phase('update'):
+        pass
+    profiler.end_frame({'ASTEROIDS': 3})
+    path = tmp_path / 'trace.json'
+    profiler.export_chrome_trace(str(path))
+    events = json.loads(path.read_text())['traceEvents']
+    assert [event['name'] for event in events] == ['update', 'frame', 'sprites']
+    assert events[2]['args'] == {'ASTEROIDS': 3}
+    assert set(profiler.summary()) == {'frame', 'update'}
+
+
+def test_overlay_draws_the_histogram(screen):
+    profiler = _profiler([5., 10., 30.])
+    profiler.overlay = True
+    rect = profiler.draw_overlay(screen)
+    assert rect.topleft == (10, 10) and rect.width == FrameProfiler.OVERLAY_WIDTH
+    # the 30 ms frame is in a red bin past the 60 fps budget, 5 ms in a green one
+    scale = 30 * 1.25
+    bin_width = FrameProfiler.OVERLAY_WIDTH / FrameProfiler.HISTOGRAM_BINS
+    bottom = FrameProfiler.HISTOGRAM_HEIGHT - 1
+    for frame_time, color in ((30, (0xe0, 0x40, 0x40)), (5, (0x40, 0xc0, 0x40))):
+        x = int(frame_time / scale * FrameProfiler.HISTOGRAM_BINS) * bin_width + 1
+        assert profiler._overlay.get_at((int(x), bottom))[:3] == color
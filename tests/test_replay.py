@@ -0,0 +1,125 @@
+import random
+
+import pygame
+import pytest
+from pygame.constants import K_SPACE, K_a, K_d, K_j, K_p, K_w
+
+from asteroids.layer import Layer
+from asteroids.replay import (Recorder, Replay, _read_varint, _unzigzag, _write_varint, _zigzag)
+from asteroids.sound import SoundManager
+
+SEED = 11
+KEYS = ((), (K_w,), (K_a, K_SPACE), (K_w, K_d), (K_SPACE,))
+
+
+class _Pressed:
+    def __init__(self, keys):
+        self._keys = set(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._keys
+
+
+def _script(frames: int = 600) -> list[tuple[float, tuple, tuple]]:
+    rng = random.Random(3)
+    events = {50: K_j, 100: K_p, 130: K_p, 200: K_p, 260: K_p, 300: K_p}
+    return [(rng.uniform(10, 25), KEYS[frame // 45 % len(KEYS)],
+             (pygame.event.Event(pygame.KEYDOWN, key=events[frame]),) if frame in events else ())
+            for frame in range(frames)]
+
+
+def _state(game) -> tuple:
+    return (game.gui.score, game.lives, game.player.health, game._pause,
+            sorted((round(a.position.x, 6), round(a.position.y, 6)) for a in game.layers[Layer.ASTEROIDS]))
+
+
+@pytest.fixture
+def pauses(monkeypatch) -> list[bool]:
+    toggles = []
+    monkeypatch.setattr(SoundManager, 'mute', staticmethod(lambda: toggles.append(True)))
+    monkeypatch.setattr(SoundManager, 'unmute', staticmethod(lambda: toggles.append(False)))
+    return toggles
+
+
+def record(path, make_game, monkeypatch, **overrides):
+    game = make_game(seed=SEED, **overrides)
+    recorder = Recorder(str(path), SEED, game.screen.get_size())
+    recorder.attach(game)
+    pygame.event.clear()
+    with monkeypatch.context() as patch:
+        for dt, keys, events in _script():
+            for event in events:
+                pygame.event.post(event)
+            patch.setattr(pygame.key, 'get_pressed', lambda keys=keys: _Pressed(keys))
+            recorder.update(game, dt)
+    recorder.close(game.gui.score)
+    return game
+
+
+def replay(path, make_game, **overrides):
+    replay = Replay(str(path))
+    game = make_game(seed=replay.header.seed, **overrides)
+    pygame.event.clear()
+    frames = replay.play(game)
+    return game, replay, frames
+
+
+@pytest.mark.parametrize('value', [0, 1, 127, 128, 300, 2 ** 35 + 5])
+def test_varint_round_trip(value):
+    out = bytearray(b'x')
+    _write_varint(out, value)
+    assert _read_varint(bytes(out), 1) == (value, len(out))
+
+
+@pytest.mark.parametrize('value', [0, 1, -1, 63, -64, 10 ** 9, -10 ** 9])
+def test_zigzag_round_trip(value):
+    assert _zigzag(value) >= 0
+    assert _unzigzag(_zigzag(value)) == value
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'not.rep'
+    path.write_bytes(b'\0' * 32)
+    with pytest.raises(ValueError):
+        Replay(str(path))
+
+
+def test_replay_reaches_the_recorded_state(tmp_path, make_game, monkeypatch, pauses):
+    path = tmp_path / 'session.rep'
+    recorded = _state(record(path, make_game, monkeypatch))
+    recorded_pauses = list(pauses)
+    pauses.clear()
+    game, session, frames = replay(path, make_game)
+    assert frames == session.recorded_frames == 600
+    assert session.recorded_score == game.gui.score
+    assert _state(game) == recorded
+    assert pauses == recorded_pauses == [True, False, True, False, True]
+
+
+def test_frames_decode_dt_and_keys(tmp_path, make_game, monkeypatch):
+    path = tmp_path / 'session.rep'
+    record(path, make_game, monkeypatch)
+    frames = list(Replay(str(path)).frames())
+    script = _script()
+    assert [frame.dt for frame in frames] == [round(dt * 1000) / 1000 for dt, _, _ in script]
+    assert [frame.keys.pressed for frame in frames] == [frozenset(keys) for _, keys, _ in script]
+
+
+def test_frames_decode_input_events(tmp_path, make_game, monkeypatch):
+    path = tmp_path / 'session.rep'
+    record(path, make_game, monkeypatch)
+    frames = list(Replay(str(path)).frames())
+    assert [[event.key for event in frame.events] for frame in frames] == \
+           [[event.key for event in events] for _, _, events in _script()]
+
+
+@pytest.mark.parametrize('hz', [60, 120, 240])
+def test_fixed_timestep_replay_reaches_the_recorded_state(tmp_path, make_game, monkeypatch, pauses, hz):
+    path = tmp_path / 'session.rep'
+    recorded = _state(record(path, make_game, monkeypatch, fixed_timestep_hz=hz))
+    recorded_pauses = list(pauses)
+    pauses.clear()
+    game, _, _ = replay(path, make_game, fixed_timestep_hz=hz)
+    # input is handled once per frame, not once per simulation step
+    assert pauses == recorded_pauses == [True, False, True, False, True]
+    assert _state(game) == recorded
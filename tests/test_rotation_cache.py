@@ -0,0 +1,73 @@
+import pytest
+
+from asteroids.rotation_cache import RotationCache
+
+
+@pytest.fixture(autouse=True)
+def cache(screen):
+    RotationCache.clear()
+    yield
+    RotationCache.clear()
+
+
+@pytest.fixture
+def step(configure):
+    return lambda step: configure(rotation_step=step)
+
+
+def test_quantize_rounds_to_step_and_wraps(step):
+    step(5)
+    assert RotationCache.quantize(12) == 10
+    assert RotationCache.quantize(13) == 15
+    assert RotationCache.quantize(359) == 0
+    assert RotationCache.quantize(-3) == 355
+
+
+def test_angles_in_one_step_share_a_surface(step):
+    step(5)
+    assert RotationCache.get('player', .5, 11) is RotationCache.get('player', .5, 9)
+    assert RotationCache.get('player', .5, 11) is not RotationCache.get('player', .5, 14)
+
+
+def test_key_includes_scale(step):
+    step(1)
+    plain = RotationCache.get('player', .5, 30)
+    assert RotationCache.get('player', 1, 30) is not plain
+    assert RotationCache.get('player', 1, 30).get_width() > plain.get_width()
+
+
+def test_zero_step_disables_the_cache(step):
+    step(0)
+    assert RotationCache.get('player', .5, 30) is not RotationCache.get('player', .5, 30)
+    assert not RotationCache._surfaces
+
+
+def test_prebake_fills_every_step(step):
+    step(10)
+    RotationCache.prebake('player', .5)
+    assert len(RotationCache._surfaces) == 36
+
+
+def test_key_includes_tint(step):
+    step(1)
+    plain = RotationCache.get('player', .5, 30)
+    tinted = RotationCache.get('player', .5, 30, (255, 0, 0))
+    assert tinted is not plain
+    assert RotationCache.get('player', .5, 30, (255, 0, 0)) is tinted
+    assert tinted.get_size() == plain.get_size()
+
+
+def test_hit_actors_share_the_cached_tint(step):
+    from pygame.math import Vector2
+    from asteroids.actor import Actor
+
+    step(1)
+    actors = [Actor(image_name='player', scale=.5, pos=Vector2(100, 100), angle=30) for _ in range(2)]
+    for actor in actors:
+        actor.hit()
+        actor.rotate(actor.angle)
+    tinted = RotationCache.get('player', .5, 30, Actor.HIT_MARK_COLOR)
+    assert actors[0].image is tinted and actors[1].image is tinted
+    actors[0]._hit_mark_cooldown = 0
+    actors[0].rotate(actors[0].angle)
+    assert actors[0].image is RotationCache.get('player', .5, 30)
@@ -0,0 +1,29 @@
+import pstats
+import sys
+import time
+
+from asteroids.sampler import StackSampler, profile_session
+
+
+def _busy(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_collapse_is_outermost_first():
+    collapsed = StackSampler._collapse(sys._getframe())
+    names = collapsed.split(';')
+    assert names[-1].startswith('test_collapse_is_outermost_first (test_sampler.py:')
+    assert len(names) > 1
+
+
+def test_profile_session_writes_both_outputs(tmp_path):
+    prefix = tmp_path / 'session'
+    with profile_session(str(prefix), interval=.0005):
+        _busy(.2)
+    stats = pstats.Stats(str(prefix) + '.pstats')
+    assert any(name == '_busy' for _, _, name in stats.stats)
+    lines = (tmp_path / 'session.collapsed').read_text().splitlines()
+    assert lines and all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+    assert any('_busy (test_sampler.py' in line for line in lines)
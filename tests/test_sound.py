@@ -0,0 +1,88 @@
+import pygame
+import pytest
+
+from asteroids.config import get_config, set_config
+from asteroids.sound import SoundManager
+
+LASER, IMPACT, LOSE = 'sfx_laser2', 'impactMetal_000', 'sfx_lose'
+
+
+@pytest.fixture
+def sounds():
+    def init(**overrides):
+        set_config(get_config()._replace(**overrides))
+        SoundManager.init()
+
+    pygame.init()
+    SoundManager.stolen = SoundManager.coalesced = 0
+    yield init
+    SoundManager._sounds.clear()
+    pygame.quit()
+
+
+def _end(index):
+    return next(event for event, channel in SoundManager._end_events.items() if channel == index)
+
+
+def test_requests_in_a_frame_play_once_louder(sounds):
+    sounds()
+    for _ in range(3):
+        SoundManager.play(LASER, volume=40)
+    SoundManager.flush()
+    assert SoundManager.playing(LASER) == 1
+    assert SoundManager.coalesced == 2
+    index, = SoundManager._by_sound[LASER]
+    volume = SoundManager._channels[index].get_volume()
+    assert volume == pytest.approx(get_config().global_volume, abs=.01)
+
+
+def test_unique_requests_are_dropped_while_playing(sounds):
+    sounds()
+    SoundManager.play(LASER, unique=True)
+    SoundManager.play(LASER, unique=True)
+    SoundManager.flush()
+    SoundManager.play(LASER, unique=True)
+    SoundManager.flush()
+    assert SoundManager.playing(LASER) == 1
+    assert SoundManager.coalesced == 0
+
+
+def test_voice_cap_restarts_the_oldest_voice(sounds):
+    sounds(sound_voice_limits={LASER: 2})
+    for _ in range(3):
+        SoundManager.play(LASER)
+        SoundManager.flush()
+    first, second = SoundManager._by_sound[LASER]
+    assert SoundManager.playing(LASER) == 2
+    assert SoundManager.stolen == 0
+    # the restarted channel is now the newest voice, its old end event is ignored
+    assert SoundManager.handle_event(_end(second))
+    assert SoundManager.playing(LASER) == 2
+    assert SoundManager.handle_event(_end(second))
+    assert list(SoundManager._by_sound[LASER]) == [first]
+
+
+def test_full_mixer_steals_from_lower_priorities_only(sounds):
+    sounds(sound_channels=2, sound_priorities={LOSE: 2, IMPACT: 1}, sound_voice_limits={})
+    for _ in range(2):
+        SoundManager.play(IMPACT)
+        SoundManager.flush()
+    SoundManager.play(LASER)
+    SoundManager.flush()
+    assert SoundManager.playing(LASER) == 0
+    SoundManager.play(LOSE)
+    SoundManager.flush()
+    assert SoundManager.playing(LOSE) == 1 and SoundManager.playing(IMPACT) == 1
+    assert SoundManager.stolen == 1
+
+
+def test_end_events_free_their_channel(sounds):
+    sounds(sound_channels=1)
+    SoundManager.play(LASER)
+    SoundManager.flush()
+    index, = SoundManager._by_sound[LASER]
+    assert SoundManager._free == []
+    assert SoundManager.handle_event(_end(index))
+    assert SoundManager.playing(LASER) == 0
+    assert SoundManager._free == [index]
+    assert not SoundManager.handle_event(pygame.USEREVENT + 1000)
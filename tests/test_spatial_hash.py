@@ -0,0 +1,70 @@
+import random
+
+import pygame
+from pygame.math import Vector2
+
+from asteroids.spatial_hash import BruteForce, SpatialHash
+
+SIZE = (640, 480)
+
+
+class Body(pygame.sprite.Sprite):
+    def __init__(self, x: float, y: float, radius: float, group: pygame.sprite.Group):
+        super().__init__(group)
+        self.position = Vector2(x, y)
+        self.radius = radius
+        self.rect = pygame.Rect(0, 0, radius * 2, radius * 2)
+        self.rect.center = x, y
+
+    def move(self, x: float, y: float):
+        self.position = Vector2(x, y)
+        self.rect.center = x, y
+
+
+def _bodies(count: int, seed: int = 0) -> pygame.sprite.Group:
+    rng = random.Random(seed)
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        Body(rng.uniform(0, SIZE[0]), rng.uniform(0, SIZE[1]), rng.uniform(5, 40), group)
+    return group
+
+
+def test_same_hits_as_brute_force_with_fewer_candidates():
+    group = _bodies(120)
+    grid, brute = SpatialHash(SIZE, cell_size=64), BruteForce()
+    grid.rebuild(group)
+    brute.rebuild(group)
+    for sprite in group:
+        assert set(grid.collide(sprite)) == set(brute.collide(sprite))
+    assert grid.hits == brute.hits
+    assert grid.candidates < brute.candidates
+
+
+def test_rebuild_tracks_moved_and_removed_sprites():
+    group = pygame.sprite.Group()
+    a, b = Body(10, 10, 5, group), Body(300, 300, 5, group)
+    probe = Body(300, 300, 5, pygame.sprite.Group())
+    grid = SpatialHash(SIZE, cell_size=64)
+    grid.rebuild(group)
+    assert list(grid.collide(probe)) == [b]
+    a.move(302, 300)
+    b.kill()
+    grid.rebuild(group)
+    assert list(grid.collide(probe)) == [a]
+    assert b not in grid._sprite_bounds
+
+
+def test_wrap_collides_across_the_edges():
+    group = pygame.sprite.Group()
+    right = Body(SIZE[0] - 4, 200, 10, group)
+    left = Body(4, 200, 10, pygame.sprite.Group())
+    plain, wrapped = SpatialHash(SIZE, cell_size=64), SpatialHash(SIZE, cell_size=64, wrap=True)
+    plain.rebuild(group)
+    wrapped.rebuild(group)
+    assert list(plain.collide(left)) == []
+    assert list(wrapped.collide(left)) == [right]
+    # folded into a candidate cell but too far apart
+    right.move(SIZE[0] - 30, 200)
+    wrapped.rebuild(group)
+    assert list(wrapped.query(left)) == [right]
+    assert list(wrapped.collide(left)) == []
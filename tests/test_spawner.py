@@ -0,0 +1,97 @@
+import random
+
+import pytest
+from pygame.math import Vector2
+
+from asteroids.display import Display
+from asteroids.events.events_info import SpawnAsteroidInfo
+from asteroids.layer import Layer
+from asteroids.spawner import Spawner
+
+
+def _spawned(game):
+    return [(asteroid.size, asteroid.color, tuple(asteroid.position), tuple(asteroid.velocity))
+            for asteroid in game.layers[Layer.ASTEROIDS]]
+
+
+def test_population_counts_sizes_as_asteroids_come_and_go(make_game):
+    game = make_game()
+    group = game.layers[Layer.ASTEROIDS]
+    group.empty()
+    small = game.spawner.spawn_wave(3, size='small')
+    game.spawner.spawn_wave(2, size='big')
+    assert group.population['small'] == 3 and group.population['big'] == 2
+    small[0].kill()
+    assert group.population['small'] == 2
+    group.empty()
+    assert +group.population == {}
+
+
+def test_wave_stops_at_the_big_asteroid_cap(make_game):
+    game = make_game(max_asteroids=5)
+    group = game.layers[Layer.ASTEROIDS]
+    group.empty()
+    assert len(game.spawner.spawn_wave(3)) == 3
+    assert len(game.spawner.spawn_wave(4)) == 2
+    assert game.spawner.spawn_wave(1) == []
+    # smaller asteroids are not capped
+    assert len(game.spawner.spawn_wave(4, size='medium')) == 4
+    assert group.population['big'] == 5
+
+
+@pytest.mark.parametrize('count', [1, 40])
+def test_border_asteroids_come_into_the_screen(make_game, count):
+    game = make_game()
+    game.layers[Layer.ASTEROIDS].empty()
+    width, height = Display.get_size()
+    for asteroid in game.spawner.spawn_wave(count):
+        x, y = asteroid.position
+        assert not (0 <= x <= width and 0 <= y <= height)
+        heading = Vector2(width / 2, height / 2) - asteroid.position
+        # the velocity component across the border points inwards
+        if x < 0 or x > width:
+            assert asteroid.velocity.x * heading.x > 0
+        else:
+            assert asteroid.velocity.y * heading.y > 0
+
+
+def test_batch_keeps_the_given_positions_and_colors(make_game):
+    game = make_game()
+    game.layers[Layer.ASTEROIDS].empty()
+    infos = [SpawnAsteroidInfo(position=Vector2(100, 200), size='medium', color='brown'),
+             SpawnAsteroidInfo(position=Vector2(300, 400), size='small', color=None)]
+    first, second = game.spawner.spawn_asteroids_batch(infos)
+    assert tuple(first.position) == (100, 200) and first.color == 'brown' and first.size == 'medium'
+    assert tuple(second.position) == (300, 400) and second.size == 'small'
+    assert second.color in game.spawner.asteroids_sprites
+
+
+def test_same_seed_spawns_the_same_asteroids(make_game):
+    spawned = []
+    for _ in range(2):
+        game = make_game(seed=5)
+        game.spawner.spawn_wave(10)
+        game.spawner.spawn_asteroid(SpawnAsteroidInfo(position=None, size='medium', color=None))
+        spawned.append(_spawned(game))
+    assert spawned[0] == spawned[1]
+
+
+def test_new_spawner_reseeds_from_random(make_game):
+    game = make_game()
+    random.seed(1)
+    first = Spawner(game.layers).spawn_wave(3, size='small')
+    random.seed(1)
+    second = Spawner(game.layers).spawn_wave(3, size='small')
+    assert [tuple(a.velocity) for a in first] == [tuple(a.velocity) for a in second]
+
+
+def test_new_spawner_leaves_other_spawners_alone(make_game):
+    game = make_game()
+    spawned = []
+    for build_another in (False, True):
+        random.seed(1)
+        spawner = Spawner(game.layers)
+        if build_another:
+            Spawner(game.layers)
+        spawned.append([tuple(a.velocity) for a in spawner.spawn_wave(3, size='small')])
+    assert spawned[0] == spawned[1]
@@ -0,0 +1,41 @@
+import time
+
+import pytest
+
+from asteroids import game
+from asteroids.startup import StartupReport, get_startup_report
+
+
+def test_phases_add_up_in_first_run_order():
+    report = StartupReport()
+    report.add('imports', 10)
+    with report.phase('display'):
+        time.sleep(.01)
+    report.add('imports', 5)
+    assert list(report.phases) == ['imports', 'display']
+    assert report.phases['imports'] == 15
+    assert report.phases['display'] >= 10
+    lines = report.format().splitlines()
+    assert lines[0].split()[:2] == ['imports', '15.0']
+    assert lines[-1].startswith('time to first frame')
+    assert float(lines[-1].split()[-2]) == pytest.approx(sum(report.phases.values()), abs=.1)
+
+
+def test_report_is_printed_after_the_first_frame(capsys):
+    report = get_startup_report()
+    report.phases.pop('first frame', None)
+    printed = []
+
+    class Game:
+        is_running = True
+
+        def update(self, dt):
+            printed.append(capsys.readouterr().out)
+
+        def render(self):
+            pass
+
+    assert game._loop(Game(), dt=16, frames=3, startup_report=True) == 3
+    assert printed[0] == '' and 'first frame' in printed[1]
+    assert printed[2] == ''
+    assert 'first frame' in report.phases
@@ -0,0 +1,74 @@
+import pygame
+import pytest
+
+from asteroids.config import get_config, set_config
+from asteroids.text import Text, _SurfaceCache
+
+
+def _surface(width: int, height: int = 10) -> pygame.Surface:
+    return pygame.Surface((width, height))
+
+
+def _limit(entries: int = 64, size: int = 1 << 30):
+    set_config(get_config()._replace(text_cache_entries=entries, text_cache_bytes=size))
+
+
+def test_evicts_the_least_recently_used_entry():
+    _limit(entries=2)
+    cache = _SurfaceCache()
+    cache.put('a', _surface(1))
+    cache.put('b', _surface(1))
+    assert cache.get('a') is not None
+    cache.put('c', _surface(1))
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_byte_budget_keeps_at_least_one_entry():
+    probe = _surface(10)
+    entry_bytes = probe.get_height() * probe.get_pitch()
+    _limit(size=entry_bytes * 2)
+    cache = _SurfaceCache()
+    for key in 'abc':
+        cache.put(key, _surface(10))
+    assert len(cache) == 2 and cache.bytes == entry_bytes * 2
+    cache.put('huge', _surface(100))
+    assert len(cache) == 1 and cache.get('huge') is not None
+    cache.clear()
+    assert len(cache) == 0 and cache.bytes == 0
+
+
+@pytest.fixture
+def text(screen):
+    Text._cache.clear()
+    return Text(get_config().gui_font)
+
+
+def test_get_surface_caches_by_text_size_and_color(text):
+    surface = text.get_surface('Game Over', 40)
+    assert text.get_surface('Game Over', 40) is surface
+    assert text.get_surface('Game Over', 32) is not surface
+    assert text.get_surface('Game Over', 40, '#ff0000') is not surface
+
+
+def test_prewarm_and_render_centers_the_text(text):
+    text.prewarm((('Game paused', 40),))
+    misses = Text._cache.misses
+    rect = text.render('Game paused', 40, pygame.Vector2(320, 240))
+    assert Text._cache.misses == misses
+    assert rect.center == pytest.approx((320, 240), abs=1)
+
+
+def test_quit_drops_fonts_and_rendered_text(text):
+    from asteroids.utils import load_font
+
+    surface = text.get_surface('Score', 32)
+    pygame.quit()
+    assert len(Text._cache) == 0
+    assert load_font.cache_info().currsize == 0
+    pygame.init()
+    assert text.get_surface('Score', 32) is not surface
+    # registered again for the next quit
+    pygame.quit()
+    assert len(Text._cache) == 0
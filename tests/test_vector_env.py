@@ -0,0 +1,54 @@
+import numpy as np
+
+from asteroids.env import FEATURES
+from asteroids.vector_env import VectorAsteroidsEnv
+
+
+def test_shapes(make_env):
+    env = make_env(VectorAsteroidsEnv, num_envs=5, max_entities=6)
+    observations, info = env.reset(seed=0)
+    assert observations.shape == env.observation_shape == (5, 7, len(FEATURES))
+    assert observations.dtype == np.float32
+    assert (observations[:, 0, FEATURES.index('is_players')] == 1).all()
+    assert all(value.shape == (5,) for value in info.values())
+    observations, rewards, terminated, truncated, info = env.step(np.zeros(5, dtype=int))
+    assert observations.shape == (5, 7, len(FEATURES))
+    assert rewards.shape == terminated.shape == truncated.shape == (5,)
+    assert (info['frames'] == env.frame_skip).all()
+
+
+def test_same_seed_same_rollout(make_env, rollout):
+    env = make_env(VectorAsteroidsEnv, num_envs=4)
+    observations, rewards = rollout(env, seed=1, steps=60)
+    again = rollout(env, seed=1, steps=60)
+    np.testing.assert_array_equal(observations, again[0])
+    np.testing.assert_array_equal(rewards, again[1])
+    assert not np.array_equal(observations, rollout(env, seed=2, steps=60)[0])
+    # the worlds draw from one generator but do not mirror each other
+    assert not np.array_equal(observations[:, 0], observations[:, 1])
+
+
+def test_truncated_worlds_reset_and_report_their_final_counters(make_env):
+    env = make_env(VectorAsteroidsEnv, num_envs=3, max_steps=2)
+    env.reset(seed=0)
+    *_, truncated, info = env.step(np.zeros(3, dtype=int))
+    assert not truncated.any()
+    *_, truncated, info = env.step(np.zeros(3, dtype=int))
+    assert truncated.all()
+    assert (info['steps'] == 2).all() and (info['frames'] == 2 * env.frame_skip).all()
+    assert (env.steps == 0).all() and (env.frames == 0).all()
+
+
+def test_finished_worlds_reset_on_their_own(make_env):
+    env = make_env(VectorAsteroidsEnv, num_envs=3)
+    env.reset(seed=0)
+    env.step(np.zeros(3, dtype=int))
+    env.score[:] = 10
+    env.game_over[1] = True
+    _, rewards, terminated, truncated, info = env.step(np.zeros(3, dtype=int))
+    assert terminated.tolist() == [False, True, False]
+    assert not truncated.any()
+    # the finished world does not play its last step
+    assert info['frames'].tolist() == [2 * env.frame_skip, env.frame_skip, 2 * env.frame_skip]
+    assert rewards[1] == 0
+    assert env.score.tolist() == [10, 0, 10] and not env.game_over.any()